@@ -0,0 +1,498 @@
+"""
+Autopilot for Math Snake.
+
+Autopilot plays a round by itself. It searches for the shortest safe path
+from the snake's head to the tile it has to eat next, then follows that
+path, so soak tests and benchmarks get long, realistic games with long
+snakes and nobody playing. It plugs into Game as a pilot in place of the
+keyboard (python main.py --autopilot), and soak() plays rounds headless
+on GameEngine alone:
+
+    python autopilot.py --rounds 200 --difficulty Hard
+    python autopilot.py --rounds 20 --answer-digits 60 --save-losses
+
+It does not import pygame.
+"""
+
+import argparse
+import random
+import time
+from array import array
+from collections import deque
+from config import SNAKE_SPEED
+from engine import GameEngine, PLAYING, WON, SNAKE, TILE, rng_stream
+from expression import CREATORS, create_expression
+from replay import ReplayRecorder
+from snake import UP, LEFT, DOWN, RIGHT
+
+# a round that goes this many steps per board cell without eating a digit is stuck
+STEPS_PER_CELL = 4
+
+class Autopilot:
+    """
+    Plays a round by searching for safe paths to the next digit.
+    
+    The search is a breadth-first search over the board that knows when
+    each body cell will be free: the cell k segments from the tail clears
+    after k + 1 moves, so the path can run into cells the tail is about to
+    leave. Walls, the stats bar and every tile other than the target are
+    blocked. A path is only taken if the snake could still reach its own
+    tail after eating, so it doesn't close itself into a pocket; when the
+    shortest path fails that test, the shortest paths entering the target
+    from its other sides are tried. Otherwise the snake wanders until a
+    safe path opens up: it edges towards the target, and every other
+    stretch of as many moves as it is long it follows its tail instead,
+    which reshuffles the body so it can't keep circling the same pocket.
+    
+    A found path is kept and followed move by move. It is only searched
+    again when the target changes, the snake leaves the path or the next
+    cell on it is no longer safe (e.g. a tile respawned there).
+    """
+
+    def __init__(self):
+        """Start without a plan."""
+        self.plan = deque()
+        self.goal = None
+        self.expected = None
+        # moves made without a safe path since the target last changed
+        self.stalled = 0
+        # how often a move came from a new search or from the kept plan
+        self.searches = 0
+        self.reused = 0
+
+    def next_action(self, engine):
+        """
+        Choose the direction of the next snake move.
+        
+        Args:
+            engine (GameEngine): The round being played
+        
+        Returns:
+            str: One of UP, LEFT, DOWN, RIGHT
+        """
+        cols = engine.cols
+        snake = engine.snake
+        head = snake.row * cols + snake.col
+        target = engine.currentNumToFind
+        goal = None if target.row is None else (target.row * cols + target.col, engine.idx)
+
+        if self.plan and goal == self.goal and head == self.expected and self.safe(engine, self.plan[0]):
+            self.reused += 1
+        else:
+            self.searches += 1
+            if goal != self.goal:
+                self.stalled = 0
+            self.goal = goal
+            self.plan = deque(self.search(engine, head, goal))
+
+        if self.plan:
+            self.expected = self.plan.popleft()
+            return direction(head, self.expected, cols)
+        self.expected = None
+        return self.wander(engine, head)
+
+    def safe(self, engine, cell):
+        """
+        Check that the snake can move onto a cell next.
+        
+        Args:
+            engine (GameEngine): The round being played
+            cell (int): Packed cell (row * cols + col) next to the head
+        
+        Returns:
+            bool: True if the move neither hits the body nor eats a wrong tile
+        """
+        value = engine.cells.flat[cell]
+        if value == SNAKE:
+            # the tail moves out of the way unless the snake is growing
+            tail = engine.snake.body[-1]
+            return cell == tail[0] * engine.cols + tail[1] and len(engine.snake.body) > 1
+        return value < TILE or cell == self.goal[0]
+
+    def search(self, engine, head, goal):
+        """
+        Find a safe path to the target tile.
+        
+        Args:
+            engine (GameEngine): The round being played
+            head (int): Packed cell of the snake's head
+            goal (tuple): Packed cell of the target and the answer index, or
+                None if the target is off the board
+        
+        Returns:
+            list: Packed cells to move through, ending on the target, or an
+                empty list if there is no safe path
+        """
+        if goal is None:
+            return []
+        rows, cols = engine.rows, engine.cols
+        target = goal[0]
+        body = engine.snake.body.snapshot()
+        times = clear_times(body)
+        blocked = tile_cells(engine, target)
+        path = shortest_path(head, target, times, blocked, rows, cols)
+        if path is None:
+            return []
+        if can_escape(body, path, blocked, rows, cols):
+            return path
+
+        # arriving from another side may leave a way out
+        around = blocked | {target}
+        for side in neighbors(target, rows, cols):
+            if len(path) > 1 and side == path[-2]:
+                continue
+            route = [] if side == head else shortest_path(head, side, times, around, rows, cols)
+            if route is None or times.get(side, 0) > len(route):
+                continue
+            route.append(target)
+            if can_escape(body, route, blocked, rows, cols):
+                return route
+        return []
+
+    def wander(self, engine, head):
+        """
+        Choose a move while no safe path to the target exists.
+        
+        Takes the move that gets closest to the target among those after
+        which the snake can still reach its tail, or during every other
+        stretch of len(body) moves the first move on the way to the tail.
+        If there is none, moves to the free neighbor with the most open
+        cells around it.
+        
+        Args:
+            engine (GameEngine): The round being played
+            head (int): Packed cell of the snake's head
+        
+        Returns:
+            str: One of UP, LEFT, DOWN, RIGHT
+        """
+        rows, cols = engine.rows, engine.cols
+        body = engine.snake.body.snapshot()
+        target = None if self.goal is None else self.goal[0]
+        blocked = tile_cells(engine, target)
+        times = clear_times(body)
+        self.stalled += 1
+        if len(body) > 2 and (self.stalled // len(body)) % 2 == 1:
+            path = shortest_path(head, body[-1], times, tile_cells(engine, None), rows, cols)
+            if path is not None:
+                return direction(head, path[0], cols)
+
+        moves = [cell for cell in neighbors(head, rows, cols)
+                 if cell not in blocked and times.get(cell, 0) <= 1]
+
+        best, best_distance = None, None
+        for cell in moves:
+            # the body after the move, one longer if it eats the target
+            after = array("l", [cell])
+            after.extend(body if cell == target else body[:-1])
+            if len(after) > 2 and shortest_path(after[0], after[-1], clear_times(after),
+                                                blocked, rows, cols) is None:
+                continue
+            distance = 0 if target is None else distance_between(cell, target, cols)
+            if best is None or distance < best_distance:
+                best, best_distance = cell, distance
+        if best is not None:
+            return direction(head, best, cols)
+
+        best_size = -1
+        for cell in moves:
+            size = open_area(cell, times, blocked, rows, cols, len(body) * 2 + 1)
+            if size > best_size:
+                best, best_size = cell, size
+        # no free neighbor at all, the round is lost whatever the move
+        return UP if best is None else direction(head, best, cols)
+
+def direction(cell, following, cols):
+    """
+    Get the move from a cell to a neighboring one.
+    
+    Args:
+        cell (int): Packed cell the snake is on
+        following (int): Packed neighboring cell
+        cols (int): Number of columns in the grid
+    
+    Returns:
+        str: One of UP, LEFT, DOWN, RIGHT
+    """
+    delta = following - cell
+    if delta == -cols:
+        return UP
+    if delta == cols:
+        return DOWN
+    return LEFT if delta == -1 else RIGHT
+
+def distance_between(cell, other, cols):
+    """
+    Get the number of moves between two cells on an empty board.
+    
+    Args:
+        cell (int): Packed cell
+        other (int): Packed cell
+        cols (int): Number of columns in the grid
+    
+    Returns:
+        int: The Manhattan distance between the cells
+    """
+    row, col = divmod(cell, cols)
+    other_row, other_col = divmod(other, cols)
+    return abs(row - other_row) + abs(col - other_col)
+
+def neighbors(cell, rows, cols):
+    """
+    Get the cells a snake on a cell can move to without leaving the board.
+    
+    Args:
+        cell (int): Packed cell
+        rows (int): Number of rows in the grid (row 0 is the stats bar)
+        cols (int): Number of columns in the grid
+    
+    Returns:
+        list: Packed neighboring cells
+    """
+    row, col = divmod(cell, cols)
+    cells = []
+    if row > 1:
+        cells.append(cell - cols)
+    if row < rows - 1:
+        cells.append(cell + cols)
+    if col > 0:
+        cells.append(cell - 1)
+    if col < cols - 1:
+        cells.append(cell + 1)
+    return cells
+
+def clear_times(body):
+    """
+    Get how many moves it takes each body cell to clear.
+    
+    Args:
+        body (array): Packed body cells from head to tail
+    
+    Returns:
+        dict: Packed cell -> number of moves until the tail has left it
+    """
+    length = len(body)
+    return {cell: length - k for k, cell in enumerate(body)}
+
+def can_escape(body, path, blocked, rows, cols):
+    """
+    Check that the snake can still reach its tail after eating at the end of a path.
+    
+    Args:
+        body (array): Packed body cells from head to tail
+        path (list): Packed cells the head moves through, ending on the target
+        blocked (set): Packed cells that may never be entered
+        rows (int): Number of rows in the grid
+        cols (int): Number of columns in the grid
+    
+    Returns:
+        bool: True if the tail can be reached from the target afterwards
+    """
+    # the body after following the path and growing by one on the target
+    after = array("l", reversed(path))
+    after.extend(body[:max(len(body) + 1 - len(path), 0)])
+    after = after[:len(body) + 1]
+    if len(after) <= 2:
+        return True
+    return shortest_path(after[0], after[-1], clear_times(after), blocked, rows, cols) is not None
+
+def tile_cells(engine, target):
+    """
+    Get the cells of the tiles the snake must not eat.
+    
+    Args:
+        engine (GameEngine): The round being played
+        target (int): Packed cell of the target tile, or None to block every tile
+    
+    Returns:
+        set: Packed cells of the blocked tiles
+    """
+    cols = engine.cols
+    return {num.row * cols + num.col for num in engine.nums
+            if num.row is not None and num.row * cols + num.col != target}
+
+def shortest_path(start, goal, times, blocked, rows, cols):
+    """
+    Breadth-first search for the shortest safe path between two cells.
+    
+    A body cell may only be entered once the tail has left it, so a cell
+    that is reached too early stays open for a later, longer route.
+    
+    Args:
+        start (int): Packed start cell
+        goal (int): Packed goal cell
+        times (dict): Packed cell -> moves until it clears, see clear_times
+        blocked (set): Packed cells that may never be entered
+        rows (int): Number of rows in the grid
+        cols (int): Number of columns in the grid
+    
+    Returns:
+        list: Packed cells from the one after start up to goal, or None if
+            goal cannot be reached
+    """
+    parent = {start: start}
+    frontier = [start]
+    moves = 0
+    while frontier:
+        moves += 1
+        following = []
+        for cell in frontier:
+            for near in neighbors(cell, rows, cols):
+                if near in parent or near in blocked or times.get(near, 0) > moves:
+                    continue
+                parent[near] = cell
+                if near == goal:
+                    path = [near]
+                    while parent[path[-1]] != start:
+                        path.append(parent[path[-1]])
+                    path.reverse()
+                    return path
+                following.append(near)
+        frontier = following
+    return None
+
+def open_area(start, times, blocked, rows, cols, limit):
+    """
+    Count the free cells reachable from a cell, up to a limit.
+    
+    Args:
+        start (int): Packed cell to count from
+        times (dict): Packed cell -> moves until it clears, see clear_times
+        blocked (set): Packed cells that may never be entered
+        rows (int): Number of rows in the grid
+        cols (int): Number of columns in the grid
+        limit (int): Stop counting at this many cells
+    
+    Returns:
+        int: Number of reachable cells, at most limit
+    """
+    seen = {start}
+    stack = [start]
+    while stack and len(seen) < limit:
+        for near in neighbors(stack.pop(), rows, cols):
+            if near not in seen and near not in blocked and times.get(near, 0) <= 1:
+                seen.add(near)
+                stack.append(near)
+    return min(len(seen), limit)
+
+def random_answer(digits, rng):
+    """
+    Draw an answer with a fixed number of digits, for long rounds.
+    
+    Args:
+        digits (int): Number of digits
+        rng (random.Random): Random source
+    
+    Returns:
+        int: The answer
+    """
+    return rng.randint(10 ** (digits - 1), 10 ** digits - 1)
+
+def soak(rounds, difficulty="Hard", rows=30, cols=30, seed=None, answer_digits=None, save_losses=False):
+    """
+    Play rounds headless with the autopilot as fast as possible.
+    
+    Every round gets its own seed from a stream seeded with seed, so a run
+    with a seed is reproducible, and lost rounds can be saved as replays.
+    
+    Args:
+        rounds (int): Number of rounds to play
+        difficulty (str): Difficulty level the answers are drawn from
+        rows (int): Number of rows in the grid
+        cols (int): Number of columns in the grid
+        seed (int): Seed for the whole run, or None
+        answer_digits (int): Play random answers of this many digits
+            instead of questions, or None
+        save_losses (bool): Save a replay of every round that was lost
+    
+    Returns:
+        dict: Totals for the run:
+            - rounds, won, steps: Rounds played, rounds won, snake moves made
+            - reasons: Number of rounds lost for each reason ('stuck' for
+              rounds stopped after too many steps)
+            - longest: Longest snake reached
+            - searches, reused: Moves planned by a new search or a kept plan
+            - seconds: Time spent playing
+            - replays: Paths of the saved replays
+    """
+    seeds = random.Random(seed)
+    totals = {
+        'rounds': rounds,
+        'won': 0,
+        'steps': 0,
+        'reasons': {},
+        'longest': 0,
+        'searches': 0,
+        'reused': 0,
+        'seconds': 0.0,
+        'replays': []
+    }
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        round_seed = seeds.getrandbits(32)
+        question = rng_stream(round_seed, "question")
+        if answer_digits:
+            expression = None
+            answer = random_answer(answer_digits, question)
+        else:
+            expression = create_expression(difficulty, question)
+            answer = expression.evaluate()
+
+        engine = GameEngine(answer, rows, cols, round_seed)
+        pilot = Autopilot()
+        recorder = None
+        if save_losses:
+            text = str(answer) if expression is None else expression.render()
+            recorder = ReplayRecorder(engine, difficulty, text, SNAKE_SPEED)
+        stall_steps = STEPS_PER_CELL * rows * cols
+        last_progress = 0
+
+        while engine.status == PLAYING and engine.steps - last_progress < stall_steps:
+            action = pilot.next_action(engine)
+            if recorder is not None:
+                recorder.record(action)
+            if engine.step(action)['correct']:
+                last_progress = engine.steps
+
+        totals['steps'] += engine.steps
+        totals['longest'] = max(totals['longest'], len(engine.snake.body))
+        totals['searches'] += pilot.searches
+        totals['reused'] += pilot.reused
+        if engine.status == WON:
+            totals['won'] += 1
+            continue
+
+        reason = engine.reason or "stuck"
+        totals['reasons'][reason] = totals['reasons'].get(reason, 0) + 1
+        if recorder is not None:
+            recorder.finish(engine)
+            path = recorder.save()
+            if path is not None:
+                totals['replays'].append(path)
+
+    totals['seconds'] = time.perf_counter() - start
+    return totals
+
+def main():
+    parser = argparse.ArgumentParser(description="Let the autopilot play Math Snake rounds headless.")
+    parser.add_argument("--rounds", type=int, default=100, help="rounds to play")
+    parser.add_argument("--difficulty", choices=list(CREATORS), default="Hard")
+    parser.add_argument("--grid", type=int, nargs=2, default=[30, 30], metavar=("ROWS", "COLS"))
+    parser.add_argument("--seed", type=int, default=None, help="seed for a reproducible run")
+    parser.add_argument("--answer-digits", type=int, default=None,
+                        help="play random answers of this many digits, for long snakes")
+    parser.add_argument("--save-losses", action="store_true", help="save a replay of every lost round")
+    args = parser.parse_args()
+
+    totals = soak(args.rounds, args.difficulty, *args.grid, args.seed, args.answer_digits, args.save_losses)
+    moves = max(totals['searches'] + totals['reused'], 1)
+    print(f"Won {totals['won']}/{totals['rounds']} rounds, lost: {totals['reasons'] or 'none'}")
+    print(f"{totals['steps']} steps in {totals['seconds']:.2f} s "
+          f"({totals['steps'] / max(totals['seconds'], 1e-9):.0f} steps/s), longest snake {totals['longest']}")
+    print(f"{totals['reused'] / moves:.0%} of moves reused a kept plan")
+    for path in totals['replays']:
+        print(f"Replay saved to {path}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+"""
+Batched headless environment for Math Snake.
+
+BatchEngine runs N independent rounds in lockstep. All state lives in
+NumPy arrays laid out struct-of-arrays style (one array per field, one
+row per game) and step() advances every game with a handful of vectorized
+operations instead of a Python loop per game. The rules are the same as
+engine.GameEngine, so this is the tool for mass simulation, balancing runs
+and agent training.
+"""
+
+import numpy as np
+
+# actions; NOOP leaves the snake where it is
+NOOP = -1
+UP = 0
+LEFT = 1
+DOWN = 2
+RIGHT = 3
+
+# (row, col) offset for each action, indexed by action
+DROW = np.array([-1, 0, 1, 0])
+DCOL = np.array([0, -1, 0, 1])
+
+# cell values in the occupancy grid, digit d is stored as TILE + d
+EMPTY = 0
+SNAKE = 1
+TILE = 2
+
+# round status
+PLAYING = 0
+WON = 1
+LOST = 2
+
+# reasons a round can be lost
+NONE = 0
+WALL = 1
+SELF = 2
+WRONG = 3
+
+# enough digits for any int64 answer
+MAX_DIGITS = 19
+
+# rejection sampling rounds before respawning falls back to a full scan
+RESPAWN_TRIES = 32
+
+# cell index of a tile that found no free cell
+OFFBOARD = -1
+
+class BatchEngine:
+    """
+    N independent Math Snake rounds stepped together.
+    
+    State arrays (one row per game):
+    - grid: (N, rows, cols) uint8 occupancy grid, see EMPTY/SNAKE/TILE
+    - body: (N, rows * cols) ring buffer of cell indices (row * cols + col)
+    - head_ptr, length: position of the head in body and the snake length
+    - tiles: (N, 10) cell index of each digit tile, OFFBOARD while the
+      board has no free cell for it
+    - digits, ans_len, progress: answer digits and how many are collected
+    - status, reason, steps: round outcome and number of moves attempted
+    
+    Row 0 is the stats bar, so snakes die there just like in the real game.
+    """
+
+    def __init__(self, n, rows, cols, seed=None):
+        """
+        Allocate the state buffers for n games.
+        
+        Games start out finished; call reset() with answers to start them.
+        
+        Args:
+            n (int): Number of games in the batch
+            rows (int): Number of rows in each grid
+            cols (int): Number of columns in each grid
+            seed (int): Seed for the batch's random generator, or None
+        """
+        self.n = n
+        self.rows = rows
+        self.cols = cols
+        self.capacity = rows * cols
+        self.rng = np.random.default_rng(seed)
+
+        self.grid = np.zeros((n, rows, cols), dtype=np.uint8)
+        # flat view of the same memory, indexed by cell
+        self.flat = self.grid.reshape(n, self.capacity)
+
+        self.body = np.zeros((n, self.capacity), dtype=np.int32)
+        self.head_ptr = np.zeros(n, dtype=np.int64)
+        self.length = np.zeros(n, dtype=np.int64)
+        self.tiles = np.zeros((n, 10), dtype=np.int64)
+
+        self.answers = np.zeros(n, dtype=np.int64)
+        self.digits = np.zeros((n, MAX_DIGITS), dtype=np.int64)
+        self.ans_len = np.ones(n, dtype=np.int64)
+        self.progress = np.zeros(n, dtype=np.int64)
+
+        self.status = np.full(n, LOST, dtype=np.int8)
+        self.reason = np.zeros(n, dtype=np.int8)
+        self.steps = np.zeros(n, dtype=np.int64)
+
+        self.games = np.arange(n)
+
+        # cells number tiles may spawn on (same area as game_numbers.Number)
+        tile_rows, tile_cols = np.meshgrid(np.arange(1, rows), np.arange(1, cols), indexing="ij")
+        self.tile_cells = (tile_rows * cols + tile_cols).ravel()
+
+    @property
+    def observation(self):
+        """
+        The (N, rows, cols) occupancy grid.
+        
+        This is the live state buffer, not a copy: it changes on every step.
+        """
+        return self.grid
+
+    @property
+    def head(self):
+        """
+        Cell index of every snake's head.
+        
+        Returns:
+            np.ndarray: (N,) array of row * cols + col
+        """
+        return self.body[self.games, self.head_ptr]
+
+    def reset(self, answers, games=None):
+        """
+        Start new rounds for some or all games.
+        
+        Args:
+            answers (array-like): Answer for each reset game (or one for all)
+            games (array-like): Indices or boolean mask of games to reset,
+                None resets every game
+        """
+        if games is None:
+            games = self.games
+        else:
+            games = np.asarray(games)
+            if games.dtype == bool:
+                games = np.flatnonzero(games)
+        count = len(games)
+        if count == 0:
+            return
+
+        answers = np.broadcast_to(np.asarray(answers, dtype=np.int64), (count,))
+        rows, cols = self.rows, self.cols
+
+        self.grid[games] = EMPTY
+
+        # snake head in the middle 80% of the board, like snake.Snake
+        head_rows = self.rng.integers(int(rows * 0.1), int(rows * 0.9) + 1, count)
+        head_cols = self.rng.integers(int(cols * 0.1), int(cols * 0.9) + 1, count)
+        heads = head_rows * cols + head_cols
+
+        # ten distinct tile cells per game that avoid the head
+        keys = self.rng.random((count, len(self.tile_cells)))
+        keys[self.tile_cells[None, :] == heads[:, None]] = 2.0
+        picks = np.argpartition(keys, 9, axis=1)[:, :10]
+        tiles = self.tile_cells[picks]
+
+        self.flat[games[:, None], tiles] = TILE + np.arange(10)
+        self.flat[games, heads] = SNAKE
+        self.tiles[games] = tiles
+        self.body[games, 0] = heads
+        self.head_ptr[games] = 0
+        self.length[games] = 1
+
+        # split |answer| into its decimal digits, most significant first
+        magnitude = np.abs(answers)
+        powers = 10 ** np.arange(1, MAX_DIGITS, dtype=np.int64)
+        lengths = 1 + (magnitude[:, None] >= powers[None, :]).sum(axis=1)
+        exponents = lengths[:, None] - 1 - np.arange(MAX_DIGITS)[None, :]
+        digits = (magnitude[:, None] // 10 ** np.maximum(exponents, 0)) % 10
+
+        self.answers[games] = answers
+        self.digits[games] = np.where(exponents >= 0, digits, 0)
+        self.ans_len[games] = lengths
+        self.progress[games] = 0
+        self.status[games] = PLAYING
+        self.reason[games] = NONE
+        self.steps[games] = 0
+
+    def step(self, actions):
+        """
+        Advance every game by one snake move.
+        
+        Finished games ignore their action; reset() them to play again.
+        
+        Args:
+            actions (array-like): (N,) actions, one of NOOP, UP, LEFT, DOWN, RIGHT
+        
+        Returns:
+            dict: Per-game arrays describing the step:
+                - moved: Whether the snake moved
+                - eaten: Digit eaten this step, or -1
+                - correct: Whether the eaten digit was the expected one
+                - status: PLAYING, WON or LOST after the step (live array)
+        """
+        actions = np.asarray(actions)
+        games = self.games
+        cols = self.cols
+
+        active = (self.status == PLAYING) & (actions >= 0)
+        self.steps[active] += 1
+        direction = np.where(active, actions, 0)
+
+        heads = self.head
+        new_rows = heads // cols + DROW[direction]
+        new_cols = heads % cols + DCOL[direction]
+        inside = (new_rows >= 1) & (new_rows < self.rows) & (new_cols >= 0) & (new_cols < cols)
+        wall = active & ~inside
+        moved = active & inside
+        new_heads = np.where(moved, new_rows * cols + new_cols, heads)
+
+        # the snake grows when its head lands on the digit it is looking for
+        wanted = self.digits[games, np.minimum(self.progress, self.ans_len - 1)]
+        grow = moved & (new_heads == self.tiles[games, wanted])
+
+        # pop tails before checking self collision so following the tail is legal
+        popping = games[moved & ~grow]
+        tail_ptr = (self.head_ptr[popping] - self.length[popping] + 1) % self.capacity
+        self.flat[popping, self.body[popping, tail_ptr]] = EMPTY
+        self.length[popping] -= 1
+
+        values = self.flat[games, new_heads]
+        self_hit = moved & (values == SNAKE)
+
+        pushing_mask = moved & ~self_hit
+        pushing = games[pushing_mask]
+        self.head_ptr[pushing] = (self.head_ptr[pushing] + 1) % self.capacity
+        self.body[pushing, self.head_ptr[pushing]] = new_heads[pushing]
+        self.length[pushing] += 1
+
+        eaten_mask = pushing_mask & (values >= TILE)
+        eaten = np.full(self.n, -1, dtype=np.int64)
+        eaten[eaten_mask] = values[eaten_mask].astype(np.int64) - TILE
+        self.flat[pushing, new_heads[pushing]] = SNAKE
+
+        # tiles that found no free cell go back on the board once one frees up
+        waiting = pushing_mask[:, None] & (self.tiles == OFFBOARD)
+        if waiting.any():
+            # one tile at a time, so two tiles never pick the same cell
+            for game, digit in zip(*np.nonzero(waiting)):
+                self.respawn(np.array([game]), np.array([digit]))
+
+        self.respawn(games[eaten_mask], eaten[eaten_mask])
+
+        correct = eaten_mask & (eaten == wanted)
+        wrong = eaten_mask & ~correct
+        self.progress[correct] += 1
+        won = correct & (self.progress == self.ans_len)
+
+        self.status[wall | self_hit | wrong] = LOST
+        self.reason[wall] = WALL
+        self.reason[self_hit] = SELF
+        self.reason[wrong] = WRONG
+        self.status[won] = WON
+
+        return {
+            'moved': moved,
+            'eaten': eaten,
+            'correct': correct,
+            'status': self.status
+        }
+
+    def respawn(self, games, digits):
+        """
+        Move eaten tiles to random empty cells.
+        
+        Uses vectorized rejection sampling, then an explicit scan of the free
+        cells for games whose board is too crowded for sampling to succeed.
+        A tile with no free cell left is taken off the board (OFFBOARD) and
+        placed again by step() once a cell frees up.
+        
+        Args:
+            games (np.ndarray): Games whose tile was eaten, each at most once
+            digits (np.ndarray): The eaten digit for each of those games
+        """
+        pending = np.arange(len(games))
+        cells = np.zeros(len(games), dtype=np.int64)
+
+        for _ in range(RESPAWN_TRIES):
+            if pending.size == 0:
+                break
+            candidates = self.tile_cells[self.rng.integers(0, len(self.tile_cells), pending.size)]
+            free = self.flat[games[pending], candidates] == EMPTY
+            cells[pending[free]] = candidates[free]
+            pending = pending[~free]
+
+        placed = np.ones(len(games), dtype=bool)
+        for i in pending:
+            free_cells = self.tile_cells[self.flat[games[i], self.tile_cells] == EMPTY]
+            if free_cells.size:
+                cells[i] = self.rng.choice(free_cells)
+            else:
+                placed[i] = False
+
+        self.tiles[games[~placed], digits[~placed]] = OFFBOARD
+        games, digits, cells = games[placed], digits[placed], cells[placed]
+        self.tiles[games, digits] = cells
+        self.flat[games, cells] = TILE + digits
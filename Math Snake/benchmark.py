@@ -0,0 +1,497 @@
+"""
+Rendering benchmark for Math Snake.
+
+Drives each screen for a fixed number of frames with scripted input and
+reports frames per second and per-frame latency percentiles. It runs
+headless with the SDL dummy drivers, so it needs no display and no one
+playing:
+    
+    python benchmark.py --frames 300 --grid 30 60 --snake-lengths 1 200 --output build/before.json
+    python benchmark.py --screens game --ticks-per-frame 1 5
+
+Frame caps are switched off while measuring, so the
+numbers are how fast each screen can draw, not how fast it is allowed to.
+Every pygame.display.update call ends a frame. Results are saved as JSON
+(build/benchmark.json unless --output says otherwise, build/ is not
+tracked) so runs can be compared across commits.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+import config
+
+SCREENS = ("menu", "question", "game", "autopilot", "death", "victory", "you_win")
+
+DEFAULT_FRAMES = 300
+DEFAULT_GRIDS = (30,)
+DEFAULT_SNAKE_LENGTHS = (1, 50, 200)
+DEFAULT_TICKS_PER_FRAME = (1,)
+DEFAULT_PARTICLE_SCALES = (1, 10)
+DEFAULT_OUTPUT = os.path.join("build", "benchmark.json")
+
+# digits in the answers the autopilot plays, so its snake keeps growing
+AUTOPILOT_DIGITS = 200
+
+class StopBenchmark(Exception):
+    """Raised by the frame recorder once enough frames were drawn."""
+
+class FrameRecorder:
+    """
+    Stands in for pygame.display.update and records when each frame ends.
+    
+    It also keeps a virtual clock that advances one frame per update, for
+    screens that are driven by the wall clock.
+    """
+
+    def __init__(self, frames, fps, on_done=None):
+        """
+        Prepare to record a run.
+        
+        Args:
+            frames (int): Number of frames to record
+            fps (int): Frame rate the virtual clock advances at
+            on_done (callable): Called instead of stopping the screen with
+                StopBenchmark once enough frames were drawn, or None
+        """
+        self.frames = frames
+        self.fps = fps
+        self.on_done = on_done
+        self.update = pygame.display.update
+        self.times = []
+        self.start = None
+        self.now = 0.0
+
+    def __call__(self, *args):
+        """Update the display and end the frame."""
+        self.update(*args)
+        self.times.append(time.perf_counter())
+        self.now += 1 / self.fps
+        if len(self.times) >= self.frames:
+            if self.on_done is None:
+                raise StopBenchmark()
+            self.on_done()
+
+    def time(self):
+        """Return the virtual time in seconds."""
+        return self.now
+
+class Unthrottled:
+    """pygame.time.Clock replacement that never waits."""
+
+    def tick(self, framerate=0):
+        """Return 0 ms without waiting."""
+        return 0
+
+class Scripted:
+    """Temporarily replaces attributes (input, clocks, display updates) for one run."""
+
+    def __init__(self, *patches):
+        """
+        Set up the replacements.
+        
+        Args:
+            patches (tuple): (object, attribute name, replacement) triples
+        """
+        self.patches = patches
+        self.saved = []
+
+    def __enter__(self):
+        """Apply the replacements."""
+        for target, name, value in self.patches:
+            self.saved.append((target, name, getattr(target, name)))
+            setattr(target, name, value)
+        return self
+
+    def __exit__(self, *exc):
+        """Put the original attributes back."""
+        for target, name, value in reversed(self.saved):
+            setattr(target, name, value)
+        self.saved = []
+        return False
+
+def summarize(screen, params, recorder, start):
+    """
+    Turn the recorded frame end times into a result.
+    
+    Args:
+        screen (str): Name of the screen
+        params (dict): Parameters of the run
+        recorder (FrameRecorder): The recorder used for the run
+        start (float): perf_counter() when the run started
+    
+    Returns:
+        dict: fps and frame time statistics in ms
+    """
+    ends = np.array(recorder.times)
+    frame_ms = np.diff(np.concatenate(([start], ends))) * 1000
+    p50, p95, p99 = np.percentile(frame_ms, (50, 95, 99))
+    return {
+        'screen': screen,
+        'params': params,
+        'frames': len(frame_ms),
+        'fps': len(frame_ms) / (ends[-1] - start),
+        'mean_ms': frame_ms.mean(),
+        'p50_ms': p50,
+        'p95_ms': p95,
+        'p99_ms': p99,
+        'max_ms': frame_ms.max()
+    }
+
+def run_screen(screen, params, frames, fps, draw, on_done=None, patches=()):
+    """
+    Run one screen under the recorder and summarize it.
+    
+    Args:
+        screen (str): Name of the screen
+        params (dict): Parameters of the run
+        frames (int): Number of frames to record
+        fps (int): Frame rate of the virtual clock
+        draw (callable): Runs the screen, called with the recorder
+        on_done (callable): See FrameRecorder
+        patches (tuple): Extra (object, name, replacement) triples
+    
+    Returns:
+        dict: The run's result, see summarize()
+    """
+    recorder = FrameRecorder(frames, fps, on_done)
+    patches = ((pygame.display, "update", recorder),
+               (pygame.time, "Clock", Unthrottled),
+               # the dummy driver has no system cursors
+               (pygame.mouse, "set_cursor", lambda *args: None)) + tuple(patches)
+    with Scripted(*patches):
+        start = time.perf_counter()
+        try:
+            draw(recorder)
+        except StopBenchmark:
+            pass
+    return summarize(screen, params, recorder, start)
+
+def mouse_path(recorder):
+    """
+    Scripted mouse position: sweeps diagonally across the screen.
+    
+    Args:
+        recorder (FrameRecorder): Recorder of the run, for the frame number
+    
+    Returns:
+        callable: Stand-in for pygame.mouse.get_pos
+    """
+    def get_pos():
+        step = len(recorder.times) * 7
+        return (step % config.SCREEN_WIDTH, (step // 3) % config.SCREEN_HEIGHT)
+    return get_pos
+
+def bench_menu(frames):
+    """Benchmark draw_menu with the mouse sweeping over the buttons."""
+    import menu
+
+    def draw(recorder):
+        with Scripted((pygame.mouse, "get_pos", mouse_path(recorder))):
+            while True:
+                menu.draw_menu()
+
+    return [run_screen("menu", {}, frames, config.FPS, draw)]
+
+def bench_question(frames):
+    """Benchmark the question screen, clicking stars as the mouse moves."""
+    import question
+
+    def draw(recorder):
+        clicking = lambda *args: (len(recorder.times) % 20 < 10, False, False)
+        with Scripted((pygame.mouse, "get_pos", mouse_path(recorder)),
+                      (pygame.mouse, "get_pressed", clicking),
+                      (question.time, "time", recorder.time)):
+            # Easy runs out after 300 frames, so the default run ends on the pulsing timer
+            question.QuestionWindow("Easy").display_expression()
+
+    return [run_screen("question", {}, frames, 30, draw)]
+
+def snake_cycle(rows, cols):
+    """
+    A closed path through the board the snake can follow forever.
+    
+    Snakes one way through the columns and comes back along row 1. Needs an
+    even number of columns; with an odd number the last column is left out.
+    
+    Args:
+        rows (int): Number of rows in the grid (row 0 is the stats bar)
+        cols (int): Number of columns in the grid
+    
+    Returns:
+        list: (row, col) cells in the order the snake visits them
+    """
+    cols -= cols % 2
+    path = [(row, 0) for row in range(1, rows)]
+    for col in range(1, cols):
+        rows_down = range(2, rows) if col % 2 == 0 else range(rows - 1, 1, -1)
+        path += [(row, col) for row in rows_down]
+    path += [(1, col) for col in range(cols - 1, 0, -1)]
+    return path
+
+def lay_snake(engine, path, length):
+    """
+    Replace the engine's snake with one of the given length along a path.
+    
+    Args:
+        engine (GameEngine): A freshly started round
+        path (list): Cells from snake_cycle(); the snake ends at path[length - 1]
+        length (int): Length of the snake
+    """
+    from engine import EMPTY, SNAKE
+
+    snake, free = engine.snake, engine.free
+    for cell in snake.body:
+        free.release(cell)
+        engine.cells[cell] = EMPTY
+    snake.body.clear()
+
+    # the head is pushed last, so it ends up at path[length - 1]
+    for cell in path[:length]:
+        snake.body.push(cell)
+        free.take(cell)
+        engine.cells[cell] = SNAKE
+    snake.row, snake.col = snake.body[0]
+    snake.head_index = snake.body.packed_at(0)
+
+    # tiles under the new body move elsewhere, their old cell stays taken
+    for num in engine.nums:
+        if (num.row, num.col) in snake.body:
+            num.createNewPos(free)
+            engine.put_tile(num)
+
+def bench_game(frames, grid, snake_lengths, ticks_per_frame=DEFAULT_TICKS_PER_FRAME):
+    """
+    Benchmark Game frames with a snake of each length following a fixed route.
+    
+    Each length is run once for every number of snake moves per frame, as
+    when ticks are shorter than frames or a frame ran late.
+    """
+    from game import Game
+    from engine import GameEngine, PLAYING
+    from renderer import draw_cell
+    from snake import DIRECTIONS
+
+    game = Game()
+    game.question_pool.pause()
+    game.clock = Unthrottled()
+    rows, cols = config.SQUARE_PER_ROW, config.SQUARE_PER_COL
+    path = snake_cycle(rows, cols)
+    # direction to take from every cell of the route
+    turns = {}
+    for cell, following in zip(path, path[1:] + path[:1]):
+        delta = (following[0] - cell[0], following[1] - cell[1])
+        turns[cell] = next(action for action, offset in DIRECTIONS.items() if offset == delta)
+
+    results = []
+    for length in snake_lengths:
+        length = max(1, min(length, len(path) - 1))
+        for ticks in ticks_per_frame:
+            engine = GameEngine(123456789, rows, cols, seed=0)
+            lay_snake(engine, path, length)
+            game.game_state = game.new_state(engine)
+            for cell in engine.snake.body:
+                draw_cell(config.SCREEN, config.BLUE, *cell)
+            game.read_action = lambda: turns[(engine.snake.row, engine.snake.col)]
+
+            def draw(recorder):
+                while True:
+                    # a fixed number of snake moves every frame, however
+                    # little time has passed
+                    game.update_frame()
+                    for _ in range(ticks):
+                        result = game.step_snake()
+                        if result['status'] != PLAYING:
+                            # the route runs over tiles; keep the round going
+                            # so every frame draws the same kind of board
+                            engine.status = PLAYING
+                            engine.idx = 0
+                    game.draw_frame()
+
+            params = {'grid': grid, 'snake_length': length, 'ticks_per_frame': ticks}
+            results.append(run_screen("game", params, frames, config.FPS, draw))
+    return results
+
+def bench_autopilot(frames, grid):
+    """Benchmark Game frames played by the autopilot, one snake move per frame."""
+    from game import Game
+    from engine import GameEngine, PLAYING
+    from autopilot import Autopilot, random_answer
+
+    game = Game()
+    game.question_pool.pause()
+    game.clock = Unthrottled()
+    rows, cols = config.SQUARE_PER_ROW, config.SQUARE_PER_COL
+    seeds = random.Random(0)
+    params = {'grid': grid, 'rounds': 0, 'longest_snake': 1}
+
+    def new_round():
+        seed = seeds.getrandbits(32)
+        engine = GameEngine(random_answer(AUTOPILOT_DIGITS, seeds), rows, cols, seed)
+        game.game_state = game.new_state(engine, pilot=Autopilot())
+        params['rounds'] += 1
+
+    def draw(recorder):
+        new_round()
+        while True:
+            game.update_frame()
+            result = game.step_snake()
+            params['longest_snake'] = max(params['longest_snake'], len(game.game_state['engine'].snake.body))
+            if result['status'] != PLAYING:
+                new_round()
+            game.draw_frame()
+
+    return [run_screen("autopilot", params, frames, config.FPS, draw)]
+
+def bench_animations(particle_scales):
+    """Benchmark the death and victory animations at several particle counts."""
+    import screens
+
+    results = []
+    for scale in particle_scales:
+        death = screens.DEATH_PARTICLES * scale
+        results.append(run_screen("death", {'particles': death}, 120, 60,
+                                  lambda recorder: screens.death_animation(config.SCREEN, death)))
+        firework = screens.FIREWORK_PARTICLES * scale
+        results.append(run_screen("victory", {'particles_per_firework': firework}, 120, 60,
+                                  lambda recorder: screens.victory_animation(config.SCREEN, firework)))
+    return results
+
+def bench_you_win(frames):
+    """Benchmark the win screen, pressing R once enough frames were drawn."""
+    import screens
+
+    restart = lambda: pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_r))
+    return [run_screen("you_win", {}, frames, config.FPS,
+                       lambda recorder: screens.you_win_screen(), on_done=restart)]
+
+def set_grid(grid):
+    """
+    Resize the board before the game modules are imported.
+    
+    Args:
+        grid (int): Number of rows and columns
+    """
+    config.SQUARE_PER_ROW = config.SQUARE_PER_COL = grid
+    config.SPOT_WIDTH = config.SCREEN_WIDTH // grid
+    config.SPOT_HEIGHT = config.SCREEN_HEIGHT // grid
+
+def run(args, grid):
+    """
+    Run the selected benchmarks for one grid size in this process.
+    
+    Args:
+        args (argparse.Namespace): Parsed command line
+        grid (int): Number of rows and columns
+    
+    Returns:
+        list: One result dict per run
+    """
+    set_grid(grid)
+    config.setup()
+
+    results = []
+    if "menu" in args.screens:
+        results += bench_menu(args.frames)
+    if "question" in args.screens:
+        results += bench_question(args.frames)
+    if "game" in args.screens:
+        results += bench_game(args.frames, grid, args.snake_lengths, args.ticks_per_frame)
+    if "autopilot" in args.screens:
+        results += bench_autopilot(args.frames, grid)
+    if "death" in args.screens or "victory" in args.screens:
+        results += [result for result in bench_animations(args.particles) if result['screen'] in args.screens]
+    if "you_win" in args.screens:
+        results += bench_you_win(args.frames)
+    return results
+
+def run_grids(args):
+    """
+    Run every grid size, each in its own process since modules read the grid size at import.
+    
+    Args:
+        args (argparse.Namespace): Parsed command line
+    
+    Returns:
+        list: Results of every run
+    """
+    if len(args.grid) == 1:
+        return run(args, args.grid[0])
+
+    results = []
+    for grid in args.grid:
+        with tempfile.TemporaryDirectory() as tmp:
+            output = os.path.join(tmp, "results.json")
+            command = [sys.executable, os.path.abspath(__file__),
+                       "--frames", str(args.frames), "--grid", str(grid), "--output", output,
+                       "--screens", *args.screens,
+                       "--snake-lengths", *map(str, args.snake_lengths),
+                       "--ticks-per-frame", *map(str, args.ticks_per_frame),
+                       "--particles", *map(str, args.particles)]
+            subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+            with open(output) as file:
+                runs = json.load(file)['results']
+        for result in runs:
+            result['params'].setdefault('grid', grid)
+        results += runs
+    return results
+
+def commit():
+    """Return the current git commit, or None outside a checkout."""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+def report(results):
+    """
+    Print the results as a table.
+    
+    Args:
+        results (list): Result dicts from run()
+    """
+    for result in results:
+        params = " ".join(f"{key}={value}" for key, value in result['params'].items())
+        print(f"{result['screen']:<10}{params:<36}{result['fps']:9.1f} fps"
+              f"{result['p50_ms']:8.2f}{result['p95_ms']:8.2f}{result['p99_ms']:8.2f} ms (p50/p95/p99)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Math Snake's screens headless.")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="frames per run")
+    parser.add_argument("--grid", type=int, nargs="+", default=list(DEFAULT_GRIDS), help="rows/columns of the board")
+    parser.add_argument("--snake-lengths", type=int, nargs="+", default=list(DEFAULT_SNAKE_LENGTHS))
+    parser.add_argument("--ticks-per-frame", type=int, nargs="+", default=list(DEFAULT_TICKS_PER_FRAME),
+                        help="snake moves simulated in each game frame")
+    parser.add_argument("--particles", type=int, nargs="+", default=list(DEFAULT_PARTICLE_SCALES),
+                        help="multiples of the default particle counts")
+    parser.add_argument("--screens", nargs="+", choices=SCREENS, default=list(SCREENS))
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="JSON file to write")
+    args = parser.parse_args()
+
+    results = run_grids(args)
+    report(results)
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as file:
+        json.dump({
+            'commit': commit(),
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'frames': args.frames,
+            'results': results
+        }, file, indent=2)
+
+if __name__ == "__main__":
+    main()
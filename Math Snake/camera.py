@@ -0,0 +1,250 @@
+"""
+Camera view for huge boards in Math Snake.
+
+In huge grid mode the board has hundreds of cells per side, far more than
+fit on the screen at a playable size. A Camera keeps a window of the board
+around the snake's head and CameraRenderer draws only the cells inside it,
+so the cost of a frame depends on the size of the screen, not the board.
+"""
+
+import numpy as np
+import pygame
+from config import *
+from engine import SNAKE
+from glyphs import get_atlas
+from renderer import BoardRenderer
+
+class Camera:
+    """
+    Window of view_rows x view_cols board cells that follows the snake.
+    
+    The camera only scrolls when the head gets within `margin` cells of an
+    edge of the window, and never shows anything outside the board. Row 0
+    is the stats bar row of the board, so the window starts at row 1.
+    """
+
+    def __init__(self, rows, cols, view_rows, view_cols):
+        """
+        Initialize the camera at the top-left corner of the board.
+        
+        Args:
+            rows (int): Number of rows in the board
+            cols (int): Number of columns in the board
+            view_rows (int): Rows visible at once
+            view_cols (int): Columns visible at once
+        """
+        self.rows = rows
+        self.cols = cols
+        self.view_rows = min(view_rows, rows - 1)
+        self.view_cols = min(view_cols, cols)
+        self.margin_rows = self.view_rows // 4
+        self.margin_cols = self.view_cols // 4
+        # top-left board cell in view
+        self.row = 1
+        self.col = 0
+
+    def clamp(self):
+        """Keep the window inside the board."""
+        self.row = max(1, min(self.row, self.rows - self.view_rows))
+        self.col = max(0, min(self.col, self.cols - self.view_cols))
+
+    def center(self, row, col):
+        """
+        Center the window on a cell.
+        
+        Args:
+            row (int): Row of the cell
+            col (int): Column of the cell
+        """
+        self.row = row - self.view_rows // 2
+        self.col = col - self.view_cols // 2
+        self.clamp()
+
+    def follow(self, row, col):
+        """
+        Scroll just enough to keep a cell out of the window's margins.
+        
+        Args:
+            row (int): Row of the cell, usually the snake's head
+            col (int): Column of the cell
+        
+        Returns:
+            bool: True if the window moved
+        """
+        old = (self.row, self.col)
+        self.row = min(self.row, row - self.margin_rows)
+        self.row = max(self.row, row + self.margin_rows + 1 - self.view_rows)
+        self.col = min(self.col, col - self.margin_cols)
+        self.col = max(self.col, col + self.margin_cols + 1 - self.view_cols)
+        self.clamp()
+        return (self.row, self.col) != old
+
+    def visible(self, row, col):
+        """
+        Check if a cell is inside the window.
+        
+        Args:
+            row (int): Row of the cell
+            col (int): Column of the cell
+        
+        Returns:
+            bool: True if the cell is on screen
+        """
+        return self.row <= row < self.row + self.view_rows and self.col <= col < self.col + self.view_cols
+
+class CameraRenderer(BoardRenderer):
+    """
+    Draws the part of a huge board that is inside the camera's window.
+    
+    The window is redrawn as a whole whenever the snake moves: the baked
+    empty grid is blitted, then only the snake cells and tiles inside the
+    window are filled in. Tiles outside the window are shown as markers on
+    the edge of the view, pointing the way to them.
+    """
+
+    def __init__(self, screen, cell_size=HUGE_CELL_SIZE):
+        """
+        Initialize the renderer for a screen.
+        
+        Args:
+            screen (pygame.Surface): The game screen to draw on
+            cell_size (int): Size of a board cell in pixels
+        """
+        super().__init__(screen)
+        self.cell = cell_size
+        # the view sits under the stats bar
+        top = SPOT_HEIGHT
+        self.view_rows = (SCREEN_HEIGHT - top) // cell_size
+        self.view_cols = SCREEN_WIDTH // cell_size
+        self.view_rect = pygame.Rect(0, top, self.view_cols * cell_size, self.view_rows * cell_size)
+        self.atlases = self.atlases + (get_atlas(cell_size),)
+        self.layers = None
+        self.camera = None
+        self.changed = True
+
+    def glyph_sets(self):
+        """
+        Get the glyphs to render ahead of the first round.
+        
+        Returns:
+            list: (atlas, chars, color) for the stats bar and the tiles of
+                both cell sizes
+        """
+        return super().glyph_sets() + [(self.atlases[2], "0123456789", BLACK)]
+
+    def view_layers(self):
+        """
+        Get the empty grid and the grid lines of the view, baking them on first use.
+        
+        The camera moves in whole cells, so the same grid fits every position.
+        
+        Returns:
+            tuple: (background, lines) pygame.Surface objects the size of the view
+        """
+        if self.layers is None:
+            size = self.view_rect.size
+            background = pygame.Surface(size).convert()
+            background.fill(WHITE)
+            lines = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+            for surface in (background, lines):
+                for i in range(self.view_rows + 1):
+                    pygame.draw.line(surface, BLACK, (0, i * self.cell), (size[0], i * self.cell), width=2)
+                for j in range(self.view_cols + 1):
+                    pygame.draw.line(surface, BLACK, (j * self.cell, 0), (j * self.cell, size[1]), width=2)
+            self.layers = (background, lines)
+        return self.layers
+
+    def invalidate(self):
+        """Clear the screen, reset the camera and present the whole screen on the next frame."""
+        self.screen.fill(BLACK)
+        self.full = True
+        self.camera = None
+        self.changed = True
+        self.stats.invalidate()
+
+    def draw_step(self, result, snake_color):
+        """
+        Note that the view needs redrawing after an engine step.
+        
+        The whole view is redrawn from the engine's cell grid, so every body
+        cell is drawn however many steps a frame simulates.
+        
+        Args:
+            result (dict): The engine step result, see GameEngine.step
+            snake_color (tuple): RGB color for the snake (drawn by draw_board)
+        """
+        if result['moved']:
+            self.changed = True
+
+    def cell_rect(self, row, col):
+        """
+        Get the screen area of a board cell inside the view.
+        
+        Args:
+            row (int): Row of the cell
+            col (int): Column of the cell
+        
+        Returns:
+            pygame.Rect: The cell's area on screen
+        """
+        return pygame.Rect(self.view_rect.x + (col - self.camera.col) * self.cell,
+                           self.view_rect.y + (row - self.camera.row) * self.cell,
+                           self.cell, self.cell)
+
+    def draw_board(self, engine, snake_color, number_color):
+        """
+        Redraw the view if the snake moved since the last frame.
+        
+        Args:
+            engine (GameEngine): The running round
+            snake_color (tuple): RGB color for the snake
+            number_color (tuple): RGB color for the digits
+        """
+        snake = engine.snake
+        camera = self.camera
+        if camera is None:
+            camera = self.camera = Camera(engine.rows, engine.cols, self.view_rows, self.view_cols)
+            camera.center(snake.row, snake.col)
+        if not self.changed:
+            return
+        self.changed = False
+        camera.follow(snake.row, snake.col)
+
+        background, lines = self.view_layers()
+        self.screen.blit(background, self.view_rect)
+
+        # the snake cells in view come straight from the engine's cell grid
+        view = engine.cells[camera.row:camera.row + camera.view_rows,
+                            camera.col:camera.col + camera.view_cols]
+        for row, col in zip(*np.nonzero(view == SNAKE)):
+            self.screen.fill(snake_color, self.cell_rect(camera.row + int(row), camera.col + int(col)))
+
+        atlas = self.atlases[2]
+        for num in engine.nums:
+            # numbers with no free cell to go to are off the board
+            if num.row is None:
+                continue
+            glyph = atlas.glyph(str(num.number), number_color)
+            if camera.visible(num.row, num.col):
+                self.screen.blit(glyph, glyph.get_rect(center=self.cell_rect(num.row, num.col).center))
+            else:
+                self.draw_marker(glyph, num.row, num.col)
+
+        self.screen.blit(lines, self.view_rect)
+        self.mark(self.view_rect)
+
+    def draw_marker(self, glyph, row, col):
+        """
+        Show an off-screen tile on the edge of the view, in its direction.
+        
+        Args:
+            glyph (pygame.Surface): The tile's rendered digit
+            row (int): Row of the tile
+            col (int): Column of the tile
+        """
+        camera = self.camera
+        row = max(camera.row, min(row, camera.row + camera.view_rows - 1))
+        col = max(camera.col, min(col, camera.col + camera.view_cols - 1))
+        rect = self.cell_rect(row, col)
+        self.screen.fill(ORANGE, rect)
+        self.screen.blit(glyph, glyph.get_rect(center=rect.center))
@@ -1,8 +1,3 @@
-import pygame
-
-# Initialize pygame first
-pygame.init()
-
 # FPS
 FPS = 60
 
@@ -21,18 +16,37 @@ SQUARE_PER_COL = 30
 SPOT_WIDTH = SCREEN_WIDTH // SQUARE_PER_COL
 SPOT_HEIGHT = SCREEN_HEIGHT // SQUARE_PER_ROW
 
-# FONTS FOR MENU
-HEADER_1 = pygame.font.Font("freesansbold.ttf", int(SCREEN_WIDTH * 0.05))
-HEADER_2 = pygame.font.Font("freesansbold.ttf", int(SCREEN_WIDTH * 0.04))
-
-# FONTS FOR IN-GAME 
-FONT_BIG = pygame.font.Font("freesansbold.ttf", int(SCREEN_WIDTH * 0.03))
-FONT_SMALL = pygame.font.Font("freesansbold.ttf", int(SCREEN_WIDTH * 0.02))
-FONT_SPOT = pygame.font.Font("freesansbold.ttf", int(SPOT_WIDTH * 0.9))
+# FONT SIZES
+FONT_BIG_SIZE = int(SCREEN_WIDTH * 0.03)
 
-# SNAKE SPEED (lower value --> faster)
+# SNAKE SPEED (lower value --> faster), milliseconds per snake move
 SNAKE_SPEED = 100
 
+# most snake moves simulated in one frame, so a slow frame can't snowball
+MAX_TICKS_PER_FRAME = 5
+
+# HUGE GRID MODE (python main.py --huge)
+# a board much bigger than the screen, seen through a camera that follows the snake
+HUGE_GRID = False
+HUGE_GRID_ROWS = 300
+HUGE_GRID_COLS = 300
+HUGE_CELL_SIZE = 25
+
+# REPLAYS (python main.py --record to save rounds, --seed N to play a reproducible session)
+# recorded rounds go to replay.REPLAY_DIR, which keeps the newest replay.REPLAY_KEEP
+# of them; see replay.py to play one back
+RECORD_REPLAYS = False
+SEED = None
+
+# STARTUP
+# time.perf_counter() when main.py started, until the time to menu has been reported
+# (printed with MATHSNAKE_PROFILE set)
+LAUNCH_TIME = None
+
+# AUTOPILOT (python main.py --autopilot)
+# the snake is steered by autopilot.Autopilot instead of the keyboard
+AUTOPILOT = False
+
 # COLORS
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -62,5 +76,62 @@ E5 = 659
 G5 = 784
 C6 = 1047
 
-# SCREEN
-SCREEN = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
\ No newline at end of file
+# NAMES CREATED BY setup()
+# pygame is only initialized the first time one of these is used, so
+# importing config (and the modules that import it) has no side effects
+LAZY_NAMES = ("SCREEN", "HEADER_1", "HEADER_2", "FONT_BIG", "FONT_SMALL", "FONT_SPOT")
+
+# seconds spent in each step of setup(), for the startup report
+SETUP_TIMES = {}
+
+def setup():
+    """
+    Initialize pygame, open the game window and load the fonts.
+    
+    Called automatically the first time config.SCREEN or one of the fonts
+    is used. Calling it again does nothing. Set SDL_VIDEODRIVER=dummy to run
+    without a display.
+    """
+    if "SCREEN" in globals():
+        return
+
+    import time
+
+    start = time.perf_counter()
+    import pygame
+    SETUP_TIMES['import pygame'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pygame.init()
+    SETUP_TIMES['pygame.init'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    # FONTS FOR MENU
+    header_1 = pygame.font.Font("freesansbold.ttf", int(SCREEN_WIDTH * 0.05))
+    header_2 = pygame.font.Font("freesansbold.ttf", int(SCREEN_WIDTH * 0.04))
+
+    # FONTS FOR IN-GAME
+    font_big = pygame.font.Font("freesansbold.ttf", FONT_BIG_SIZE)
+    font_small = pygame.font.Font("freesansbold.ttf", int(SCREEN_WIDTH * 0.02))
+    font_spot = pygame.font.Font("freesansbold.ttf", int(SPOT_WIDTH * 0.9))
+    SETUP_TIMES['fonts'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    SETUP_TIMES['set_mode'] = time.perf_counter() - start
+
+    globals().update(
+        HEADER_1=header_1,
+        HEADER_2=header_2,
+        FONT_BIG=font_big,
+        FONT_SMALL=font_small,
+        FONT_SPOT=font_spot,
+        SCREEN=screen
+    )
+
+def __getattr__(name):
+    """Create the window and fonts on first access to config.SCREEN or a font."""
+    if name in LAZY_NAMES:
+        setup()
+        return globals()[name]
+    raise AttributeError(f"module 'config' has no attribute '{name}'")
\ No newline at end of file
@@ -0,0 +1,125 @@
+"""
+Keyboard controls for Math Snake.
+
+This module turns key events into snake directions. Presses are queued as
+they arrive instead of sampling the keyboard once per snake move, so quick
+taps between moves are not lost and two fast turns stay two turns.
+"""
+
+import pygame
+from snake import UP, LEFT, DOWN, RIGHT, DIRECTIONS
+
+# movement key -> snake direction
+KEY_ACTIONS = {
+    pygame.K_w: UP,
+    pygame.K_a: LEFT,
+    pygame.K_s: DOWN,
+    pygame.K_d: RIGHT
+}
+
+# most presses kept waiting for a snake move
+QUEUE_SIZE = 3
+
+# the only events the game reacts to; everything else (mouse motion,
+# text input, ...) is kept off the event queue
+ALLOWED_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN)
+
+def filter_events():
+    """Keep events the game never reads, like MOUSEMOTION floods, off the event queue."""
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(ALLOWED_EVENTS)
+
+def is_reverse(action, other):
+    """
+    Check if two directions point opposite ways.
+    
+    Args:
+        action (str): A snake direction
+        other (str): Another snake direction, or None
+    
+    Returns:
+        bool: True if action would turn the snake straight back
+    """
+    if other is None:
+        return False
+    drow, dcol = DIRECTIONS[action]
+    orow, ocol = DIRECTIONS[other]
+    return (drow + orow, dcol + ocol) == (0, 0)
+
+class DirectionQueue:
+    """
+    Bounded queue of the directions the player asked for.
+    
+    Every key press is queued and one is used per snake move. When the
+    queue is empty, the snake keeps moving in the direction of the most
+    recently pressed key that is still held, like holding a key did before.
+    """
+
+    def __init__(self, size=QUEUE_SIZE):
+        """
+        Initialize an empty queue.
+        
+        Args:
+            size (int): Most presses kept; presses beyond that are dropped
+        """
+        self.size = size
+        self.queue = []
+        # movement keys held down, most recently pressed last
+        self.held = []
+        # direction of the last move handed out
+        self.heading = None
+
+    def reset(self):
+        """Forget queued presses and the heading, e.g. when a round starts."""
+        self.queue.clear()
+        self.held.clear()
+        self.heading = None
+
+    def handle(self, event):
+        """
+        Update the queue from a pygame event.
+        
+        Args:
+            event (pygame.event.Event): Any event, non-movement events are ignored
+        """
+        if event.type not in (pygame.KEYDOWN, pygame.KEYUP):
+            return
+        action = KEY_ACTIONS.get(event.key)
+        if action is None:
+            return
+
+        if event.type == pygame.KEYUP:
+            if action in self.held:
+                self.held.remove(action)
+            return
+
+        if action not in self.held:
+            self.held.append(action)
+        last = self.queue[-1] if self.queue else self.heading
+        # pressing the current direction again or a full queue changes nothing
+        if action != last and len(self.queue) < self.size:
+            self.queue.append(action)
+
+    def pop(self, allow_reverse=False):
+        """
+        Get the direction for the next snake move.
+        
+        Args:
+            allow_reverse (bool): Whether turning straight back is allowed,
+                i.e. the snake is one cell long and can't run into itself
+        
+        Returns:
+            str: The snake direction, or None to stay in place
+        """
+        while self.queue:
+            action = self.queue.pop(0)
+            if allow_reverse or not is_reverse(action, self.heading):
+                self.heading = action
+                return action
+
+        if self.held:
+            action = self.held[-1]
+            if allow_reverse or not is_reverse(action, self.heading):
+                self.heading = action
+                return action
+        return None
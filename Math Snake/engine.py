@@ -0,0 +1,215 @@
+"""
+Headless game engine for Math Snake.
+
+This module holds the rules of a single round - snake movement, digit
+eating, answer progress and win/lose detection - without importing pygame,
+so rounds can be simulated as fast as the CPU allows. The Game class in
+game.py feeds it keyboard input and draws the result of every step.
+"""
+
+import random
+import numpy as np
+from snake import Snake
+from game_numbers import create_numbers
+from free_cells import FreeCells
+
+# round status
+PLAYING = "playing"
+WON = "won"
+LOST = "lost"
+
+# reasons a round can be lost
+WALL = "wall"
+SELF = "self"
+WRONG = "wrong"
+
+# what is on each cell of GameEngine.cells (same encoding as batch_env),
+# digit d is stored as TILE + d
+EMPTY = 0
+SNAKE = 1
+TILE = 2
+
+def rng_stream(seed, name):
+    """
+    Get an independent random stream derived from a session seed.
+    
+    Each part of a session (the board, the question, ...) draws from its
+    own stream, so adding a random draw to one part never shifts the
+    numbers another part sees.
+    
+    Args:
+        seed (int): The session seed, or None for an unseeded stream
+        name (str): Name of the stream, e.g. "board"
+    
+    Returns:
+        random.Random: The random stream
+    """
+    if seed is None:
+        return random.Random()
+    return random.Random(f"{seed}/{name}")
+
+class GameEngine:
+    """
+    State and rules for one round of Math Snake.
+    
+    The engine is advanced with step(action), where action is one of the
+    snake directions (UP, LEFT, DOWN, RIGHT) or None to stay in place.
+    """
+
+    def __init__(self, answer, rows, cols, seed=None):
+        """
+        Set up a new round for the given answer.
+        
+        Places the snake and the ten digit tiles so that nothing overlaps.
+        The same seed, answer and actions always play out the same round.
+        
+        Args:
+            answer (int): The answer the player has to spell out with the snake
+            rows (int): Number of rows in the grid (row 0 is the stats bar)
+            cols (int): Number of columns in the grid
+            seed (int): Seed for the board's random stream, or None
+        """
+        self.answer = answer
+        self.rows = rows
+        self.cols = cols
+        self.seed = seed
+        rng = rng_stream(seed, "board")
+        # cells number tiles may spawn on, shared with the snake
+        self.free = FreeCells(rows, cols, 1, 1, rng)
+        self.snake = Snake(rows, cols, self.free, rng)
+        self.nums = create_numbers(rows, cols, rng)
+
+        # place every number on its own free cell so nothing overlaps
+        for num in self.nums:
+            num.createNewPos(self.free)
+
+        # what is on every cell, for looking up a whole area at once
+        self.cells = np.zeros((rows, cols), dtype=np.uint8)
+        # flat view of the same memory, indexed by packed cell (row * cols + col)
+        self.flat = self.cells.reshape(rows * cols)
+        self.cells[self.snake.row, self.snake.col] = SNAKE
+        for num in self.nums:
+            self.put_tile(num)
+
+        # numbers that found no free cell, placed again once cells free up
+        self.offboard = [num for num in self.nums if num.row is None]
+
+        answerStr = str(answer)
+        self.isNegative = answerStr.startswith("-")
+        self.digits = answerStr.lstrip("-")
+        self.ansLen = len(self.digits)
+        self.idx = 0
+        self.arr = []
+        self.status = PLAYING
+        self.reason = None
+        self.steps = 0
+
+    @property
+    def currentNumToFind(self):
+        """
+        The Number tile holding the next digit of the answer.
+        
+        Once the answer is complete this stays on the last digit.
+        """
+        return self.nums[int(self.digits[min(self.idx, self.ansLen - 1)])]
+
+    def put_tile(self, num):
+        """
+        Record a number tile's cell in the cell grid.
+        
+        Args:
+            num (Number): The tile, skipped if it is off the board
+        """
+        if num.row is not None:
+            self.cells[num.row, num.col] = TILE + int(num.number)
+
+    def lose(self, reason):
+        """
+        End the round as a loss.
+        
+        Args:
+            reason (str): One of WALL, SELF, WRONG
+        """
+        self.status = LOST
+        self.reason = reason
+
+    def step(self, action):
+        """
+        Advance the round by one snake move.
+        
+        Args:
+            action (str): One of UP, LEFT, DOWN, RIGHT, or None to not move
+        
+        Returns:
+            dict: What happened during the step:
+                - moved: Whether the snake moved
+                - head: Cell (row, col) the head moved to, or None
+                - tail: Cell (row, col) vacated by the tail, or None
+                - eaten: The Number eaten this step, or None
+                - eaten_from: Cell (row, col) the eaten Number was on, or None
+                - correct: Whether the eaten Number was the expected digit
+                - status: PLAYING, WON or LOST after the step
+        """
+        result = {
+            'moved': False,
+            'head': None,
+            'tail': None,
+            'eaten': None,
+            'eaten_from': None,
+            'correct': False,
+            'status': self.status
+        }
+
+        if self.status != PLAYING or action is None:
+            return result
+
+        self.steps += 1
+        target = self.currentNumToFind
+
+        if not self.snake.move(action, target.row, target.col):
+            self.lose(WALL)
+            result['status'] = self.status
+            return result
+
+        result['moved'] = True
+        result['head'] = (self.snake.row, self.snake.col)
+        result['tail'] = self.snake.tail
+        if self.snake.tail_index is not None:
+            self.flat[self.snake.tail_index] = EMPTY
+
+        if self.snake.collisionWithSelf():
+            self.lose(SELF)
+            result['status'] = self.status
+            return result
+
+        self.flat[self.snake.head_index] = SNAKE
+
+        for num in self.offboard[:]:
+            if num.createNewPos(self.free):
+                self.offboard.remove(num)
+                self.put_tile(num)
+
+        for num in self.nums:
+            if not num.collision(self.snake.row, self.snake.col):
+                continue
+
+            # the old cell stays taken, the snake's head is on it now
+            result['eaten'] = num
+            result['eaten_from'] = (num.row, num.col)
+            if num.createNewPos(self.free):
+                self.put_tile(num)
+            else:
+                self.offboard.append(num)
+            self.arr.append(num.number)
+
+            if num.number == self.digits[self.idx]:
+                result['correct'] = True
+                self.idx += 1
+                if self.idx == self.ansLen:
+                    self.status = WON
+            else:
+                self.lose(WRONG)
+            break
+
+        result['status'] = self.status
+        return result
@@ -0,0 +1,242 @@
+"""
+Math expression trees for Math Snake.
+
+This module builds the questions shown before each round as small
+expression trees. The same tree is rendered to the text the player sees
+and evaluated directly for the answer, so no string is ever parsed or
+passed to eval. It does not import pygame, so questions can be prepared
+in bulk outside the game. Every generator takes the random source to draw
+from, so a seeded random.Random gives the same question every time.
+"""
+
+import operator
+import random
+
+MATH_SYMBOLS = ["+", "-", "*"]
+
+OPERATORS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul
+}
+
+class Num:
+    """A number in an expression, optionally shown in parentheses."""
+
+    __slots__ = ("value", "parens")
+
+    def __init__(self, value, parens=False):
+        """
+        Initialize a number node.
+        
+        Args:
+            value (int): The number
+            parens (bool): Whether to show the number as "(value)"
+        """
+        self.value = value
+        self.parens = parens
+
+    def evaluate(self):
+        """
+        Get the value of the node.
+        
+        Returns:
+            int: The number
+        """
+        return self.value
+
+    def render(self):
+        """
+        Get the text of the node.
+        
+        Returns:
+            str: The number, in parentheses if requested
+        """
+        return f"({self.value})" if self.parens else str(self.value)
+
+class BinOp:
+    """A binary operation applied to two sub-expressions."""
+
+    __slots__ = ("symbol", "func", "left", "right")
+
+    def __init__(self, symbol, left, right):
+        """
+        Initialize an operation node.
+        
+        Args:
+            symbol (str): One of MATH_SYMBOLS
+            left (Num or BinOp): Left operand
+            right (Num or BinOp): Right operand
+        """
+        self.symbol = symbol
+        self.func = OPERATORS[symbol]
+        self.left = left
+        self.right = right
+
+    def evaluate(self):
+        """
+        Compute the value of the expression.
+        
+        Returns:
+            int: The result of the operation
+        """
+        return self.func(self.left.evaluate(), self.right.evaluate())
+
+    def render(self):
+        """
+        Get the text of the expression.
+        
+        Trees are built with the usual precedence (multiplication first, then
+        left to right), so the operands can be written out in order without
+        adding grouping parentheses.
+        
+        Returns:
+            str: The expression, e.g. "42 + (-17) * 3"
+        """
+        return f"{self.left.render()} {self.symbol} {self.right.render()}"
+
+def build(operands, symbols):
+    """
+    Combine operands and operators into a tree that respects precedence.
+    
+    Multiplications are folded into terms first, then the terms are joined
+    by additions and subtractions from left to right.
+    
+    Args:
+        operands (list): Num nodes in the order they appear
+        symbols (list): Operator symbols between the operands
+    
+    Returns:
+        Num or BinOp: Root of the expression tree
+    """
+    terms = [operands[0]]
+    term_symbols = []
+    for symbol, operand in zip(symbols, operands[1:]):
+        if symbol == "*":
+            terms[-1] = BinOp(symbol, terms[-1], operand)
+        else:
+            term_symbols.append(symbol)
+            terms.append(operand)
+
+    tree = terms[0]
+    for symbol, term in zip(term_symbols, terms[1:]):
+        tree = BinOp(symbol, tree, term)
+    return tree
+
+def chain(limit, symbolCount, parens, rng):
+    """
+    Generate a random expression of numbers joined by random operators.
+    
+    Args:
+        limit (callable): Returns a random number for each operand
+        symbolCount (int): Use the first symbolCount entries of MATH_SYMBOLS
+        parens (tuple): For each operand, whether it is shown in parentheses
+        rng (random.Random): Random source for the operators
+    
+    Returns:
+        Num or BinOp: Root of the expression tree
+    """
+    operands = [Num(limit(), parens[0])]
+    symbols = []
+    for wrapped in parens[1:]:
+        symbols.append(MATH_SYMBOLS[rng.randint(0, symbolCount - 1)])
+        operands.append(Num(limit(), wrapped))
+    return build(operands, symbols)
+
+def create_easy(rng=random):
+    """
+    Generate an easy-level math expression.
+    
+    Creates expressions with 2-3 numbers in range 1-99,
+    using only addition and subtraction.
+    
+    Args:
+        rng (random.Random): Random source, the random module by default
+    
+    Returns:
+        BinOp: An expression tree (e.g. for "42 + 17" or "65 - 23 + 11")
+    """
+    varCount = rng.randint(2, 3)
+    def limit(): return rng.randint(1, 99)
+    return chain(limit, 2, (False,) * varCount, rng)
+
+def create_medium(rng=random):
+    """
+    Generate a medium-level math expression.
+    
+    Creates expressions with 2-4 numbers in range 100-999,
+    using addition and subtraction.
+    
+    Args:
+        rng (random.Random): Random source, the random module by default
+    
+    Returns:
+        BinOp: An expression tree
+    """
+    varCount = rng.randint(2, 4)
+    def limit(): return rng.randint(100, 999)
+    return chain(limit, 2, (False,) * varCount, rng)
+
+def create_hard(rng=random):
+    """
+    Generate a hard-level math expression.
+    
+    Creates expressions with 2-4 numbers (excluding -100 to +100),
+    using addition, subtraction, and multiplication with parentheses.
+    
+    Args:
+        rng (random.Random): Random source, the random module by default
+    
+    Returns:
+        BinOp: An expression tree with parenthesized operands
+    """
+    varCount = rng.randint(2, 4)
+    def limit(): return rng.choice([rng.randint(-999, -101), rng.randint(101, 999)])
+    parens = {
+        2: (False, True),
+        3: (False, True, False),
+        4: (False, True, True, True)
+    }
+    return chain(limit, 3, parens[varCount], rng)
+
+def create_insane(rng=random):
+    """
+    Generate an insane-level math expression.
+    
+    Creates expressions with 3-4 large numbers (excluding -100 to +100),
+    using all operations including multiplication with parentheses.
+    
+    Args:
+        rng (random.Random): Random source, the random module by default
+    
+    Returns:
+        BinOp: An expression tree with parenthesized operands
+    """
+    varCount = rng.randint(3, 4)
+    def limit(): return rng.choice([rng.randint(-9999, -101), rng.randint(101, 9999)])
+    parens = {
+        3: (False, True, False),
+        4: (False, True, True, True)
+    }
+    return chain(limit, 3, parens[varCount], rng)
+
+# generator for each difficulty level
+CREATORS = {
+    "Easy": create_easy,
+    "Medium": create_medium,
+    "Hard": create_hard,
+    "Insane": create_insane
+}
+
+def create_expression(difficulty, rng=random):
+    """
+    Generate an expression for a difficulty level.
+    
+    Args:
+        difficulty (str): The difficulty level ('Easy', 'Medium', 'Hard', 'Insane')
+        rng (random.Random): Random source, the random module by default
+    
+    Returns:
+        BinOp: An expression tree
+    """
+    return CREATORS.get(difficulty, create_insane)(rng)
@@ -0,0 +1,145 @@
+"""
+Free cell index for Math Snake.
+
+This module contains the FreeCells class, which keeps track of the grid
+cells that number tiles may spawn on and are currently empty. The snake
+and the tiles update it as they move, so a uniformly random free cell can
+be drawn in constant time no matter how crowded the board is.
+"""
+
+import random
+from array import array
+
+class FreeCells:
+    """
+    Set of free (row, col) cells supporting O(1) add, remove and random pick.
+    
+    Cells are packed into one integer (row * cols + col). The free ones are
+    kept in a flat array, and a second array as big as the board maps each
+    cell to its slot in the first one (-1 if taken). Removing a cell swaps
+    the last free cell into its slot, so the free cells never have holes and
+    random picks stay uniform. Both arrays are plain machine integers, so a
+    million-cell board costs a few megabytes and no Python objects per cell.
+    """
+
+    def __init__(self, rows, cols, first_row=0, first_col=0, rng=random):
+        """
+        Start with every cell of the spawn area free.
+        
+        Args:
+            rows (int): Number of rows in the grid
+            cols (int): Number of columns in the grid
+            first_row (int): Rows above this one are outside the spawn area
+            first_col (int): Columns left of this one are outside the spawn area
+            rng (random.Random): Random source for random(), the random
+                module by default
+        """
+        self.rng = rng
+        self.rows = rows
+        self.cols = cols
+        self.first_row = first_row
+        self.first_col = first_col
+
+        self.cells = array("l")
+        self.index = array("l", [-1]) * (rows * cols)
+        for row in range(first_row, rows):
+            start = row * cols + first_col
+            width = cols - first_col
+            self.index[start:start + width] = array("l", range(len(self.cells), len(self.cells) + width))
+            self.cells.extend(range(start, start + width))
+        self.count = len(self.cells)
+
+    def __len__(self):
+        """Return the number of free cells."""
+        return self.count
+
+    def __contains__(self, cell):
+        """Return True if the (row, col) cell is free."""
+        return self.in_area(cell) and self.index[cell[0] * self.cols + cell[1]] >= 0
+
+    def in_area(self, cell):
+        """
+        Check if a cell is inside the spawn area.
+        
+        Args:
+            cell (tuple): The (row, col) cell
+        
+        Returns:
+            bool: True if number tiles may spawn on the cell
+        """
+        row, col = cell
+        return self.first_row <= row < self.rows and self.first_col <= col < self.cols
+
+    def take(self, cell):
+        """
+        Mark a cell as occupied.
+        
+        Cells that are already occupied or outside the spawn area are ignored.
+        
+        Args:
+            cell (tuple): The (row, col) cell to occupy
+        """
+        self.take_index(cell[0] * self.cols + cell[1])
+
+    def in_area_index(self, packed):
+        """Return True if the packed cell (row * cols + col) is inside the spawn area."""
+        return self.first_row * self.cols <= packed < self.rows * self.cols \
+            and packed % self.cols >= self.first_col
+
+    def take_index(self, packed):
+        """
+        Mark a packed cell (row * cols + col) as occupied, see take.
+        
+        Args:
+            packed (int): The cell to occupy
+        """
+        if not self.in_area_index(packed):
+            return
+        i = self.index[packed]
+        if i < 0:
+            return
+
+        # swap the last free cell into the hole left by the removed one
+        self.count -= 1
+        last = self.cells[self.count]
+        self.cells[i] = last
+        self.index[last] = i
+        self.index[packed] = -1
+
+    def release(self, cell):
+        """
+        Mark a cell as free again.
+        
+        Cells that are already free or outside the spawn area are ignored.
+        
+        Args:
+            cell (tuple): The (row, col) cell to free
+        """
+        self.release_index(cell[0] * self.cols + cell[1])
+
+    def release_index(self, packed):
+        """
+        Mark a packed cell (row * cols + col) as free again, see release.
+        
+        Args:
+            packed (int): The cell to free
+        """
+        if not self.in_area_index(packed):
+            return
+        if self.index[packed] >= 0:
+            return
+
+        self.cells[self.count] = packed
+        self.index[packed] = self.count
+        self.count += 1
+
+    def random(self):
+        """
+        Pick a uniformly random free cell.
+        
+        Returns:
+            tuple: A free (row, col) cell, or None if no cell is free
+        """
+        if not self.count:
+            return None
+        return divmod(self.cells[self.rng.randrange(self.count)], self.cols)
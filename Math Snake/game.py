@@ -1,224 +1,384 @@
 """
 Main game module for Math Snake.
 
-This module contains the Game class which manages the core game loop,
-collision detection, number collection, and win/lose conditions.
+This module contains the Game class which runs the core game loop. The
+game rules live in engine.py; Game reads keyboard input, feeds it to the
+engine and draws the outcome.
 """
 
+import random
 import pygame
+import config
 from config import *
 from menu import get_difficulty
 from question import QuestionWindow
-from snake import Snake
-from game_numbers import create_numbers
-from grid import draw_lines, drawStats
+from question_pool import QuestionPool
+from controls import DirectionQueue, filter_events
+from engine import GameEngine, PLAYING, WON, LOST, WRONG, rng_stream
+from replay import ReplayRecorder, ReplayInput, new_engine
+from autopilot import Autopilot
+from renderer import BoardRenderer
+from camera import CameraRenderer
 from screens import you_win_screen, you_lose_screen, death_animation, victory_animation
-from sounds import SoundManager
+from sounds import SoundManager, synthesize_sounds
+from grid import get_grid
+from menu import make_galaxy, set_galaxy
+from startup_pipeline import StartupPipeline, STARTUP_REPORT
+from profiler import get_profiler
 
 class Game:
     """
     Main game class that manages the Math Snake game loop and state.
     
-    Handles initialization, game state management, collision detection,
-    and coordinates between different game components.
+    Handles initialization and input, and draws the state of the headless
+    GameEngine that owns the game rules.
     """
     
     def __init__(self):
-        """Initialize the game with clock, running state, and sound manager."""
+        """
+        Initialize the game with clock, running state, controls, sound manager, renderer and question pool.
+        
+        The independent pieces are prepared in parallel by the startup
+        pipeline while a loading splash is shown. With config.HUGE_GRID set,
+        rounds are played on a HUGE_GRID_ROWS x HUGE_GRID_COLS board seen
+        through a camera. Every round gets its own seed, drawn from a
+        stream seeded with config.SEED.
+        """
         self.clock = pygame.time.Clock()
         self.running = True
-        self.sound_manager = SoundManager()
+        self.game_state = None
+        self.seeds = random.Random(config.SEED)
+        self.controls = DirectionQueue()
+        if config.HUGE_GRID:
+            self.set_board(HUGE_GRID_ROWS, HUGE_GRID_COLS)
+        else:
+            self.set_board(SQUARE_PER_ROW, SQUARE_PER_COL)
+        filter_events()
+        self.question_pool = QuestionPool()
+        self.question_pool.start()
+        
+        pipeline = StartupPipeline({
+            'sounds': synthesize_sounds,
+            'glyphs': self.renderer.render_glyphs,
+            'grid': get_grid,
+            'galaxy': make_galaxy,
+            'questions': self.question_pool.wait_ready
+        })
+        results = pipeline.run(config.SCREEN)
+        if STARTUP_REPORT:
+            pipeline.report()
+        # the mixer, the Sounds and the surfaces are made on the main thread
+        self.sound_manager = SoundManager(results['sounds'])
+        self.renderer.add_glyphs(results['glyphs'])
+        set_galaxy(results['galaxy'])
+        
+    def set_board(self, rows, cols):
+        """
+        Set the board size for new rounds and pick the renderer that can show it.
         
+        A board that matches the screen grid is drawn whole; any other size,
+        like the huge grid, is seen through a camera.
+        
+        Args:
+            rows (int): Number of rows in the board
+            cols (int): Number of columns in the board
+        """
+        self.board_size = (rows, cols)
+        if self.board_size == (SQUARE_PER_ROW, SQUARE_PER_COL):
+            self.renderer = BoardRenderer(config.SCREEN)
+        else:
+            self.renderer = CameraRenderer(config.SCREEN)
+    
     def initialize_game(self, difficulty):
         """
         Initialize a new game session with the specified difficulty.
         
-        Creates a math question, initializes the snake, generates number tiles,
-        and ensures no overlapping positions between game elements.
+        Takes a prepared math question from the question pool and starts a
+        new engine round for its answer. When config.SEED is set, the
+        question is generated from the round's seed instead, so the whole
+        session can be played again. The round is recorded as a replay if
+        config.RECORD_REPLAYS is set, and steered by an Autopilot if
+        config.AUTOPILOT is set.
         
         Args:
             difficulty (str): The difficulty level ('Easy', 'Medium', 'Hard', 'Insane')
             
         Returns:
-            dict: Game state containing:
-                - answer: The correct answer to the math expression
-                - snake: The Snake object
-                - nums: List of Number objects (0-9)
-                - arr: List tracking collected digits
-                - idx: Current index in the answer string
-                - isNegative: Whether the answer is negative
-                - ansLen: Length of the answer (excluding negative sign)
-                - currentNumToFind: The Number object the player needs to find next
-                - time: Game timer
-        """
-        question_window = QuestionWindow(difficulty)
+            dict: Game state, see new_state
+        """
+        seed = self.seeds.getrandbits(32)
+        if config.SEED is None:
+            question_window = QuestionWindow(difficulty, self.question_pool.take(difficulty))
+        else:
+            question_window = QuestionWindow(difficulty, rng=rng_stream(seed, "question"))
         answer = question_window.display_expression()
         
-        snake = Snake(SPOT_WIDTH, SPOT_HEIGHT)
-        SCREEN.fill(WHITE)
-        
-        nums = create_numbers()
-        
-        # ensure no numbers overlap with each other or the snake
-        occupied_positions = set()
-        occupied_positions.add((snake.row, snake.col))
+        # the round is about to start, leave the CPU to the game loop
+        self.question_pool.pause()
         
-        for num in nums:
-            # keep generating new positions until we find an unoccupied one
-            while (num.row, num.col) in occupied_positions:
-                num.createNewPos(occupied_positions)
-            occupied_positions.add((num.row, num.col))
+        engine = GameEngine(answer, *self.board_size, seed)
         
-        arr = []
-        idx = 0
+        print(f"Answer: {answer}")
         
-        isNegative = False
-        answerStr = str(answer)
-        ansLen = len(answerStr)
-        if answerStr[idx] == "-":
-            idx += 1
-            ansLen -= 1
-            isNegative = True
+        recorder = None
+        if config.RECORD_REPLAYS:
+            recorder = ReplayRecorder(engine, difficulty, question_window.question['expression'], SNAKE_SPEED)
+        pilot = Autopilot() if config.AUTOPILOT else None
+        return self.new_state(engine, recorder=recorder, pilot=pilot)
+    
+    def new_state(self, engine, recorder=None, pilot=None, tick_ms=None):
+        """
+        Get ready to show a new round and build its game state.
         
-        currentNumToFind = nums[int(answerStr[idx])]
+        Args:
+            engine (GameEngine): The round to play
+            recorder (ReplayRecorder): Records the actions taken, or None
+            pilot: Object whose next_action(engine) chooses every move instead
+                of the keyboard (an autopilot.Autopilot or a replay.ReplayInput),
+                or None
+            tick_ms (float): Milliseconds per snake move, SNAKE_SPEED if None
+            
+        Returns:
+            dict: Game state containing:
+                - engine: The GameEngine running the round
+                - time: Game timer, in seconds
+                - accumulator: Milliseconds of game time not yet simulated
+                - tick_ms: Milliseconds per snake move
+                - recorder: The replay recorder, or None
+                - pilot: The input source replacing the keyboard, or None
+        """
+        self.renderer.invalidate()
         
-        print(f"Answer: {answer}")
+        # restart the frame clock so the menu and question don't count as game time
+        self.clock.tick()
+        self.controls.reset()
         
         return {
-            'answer': answer,
-            'snake': snake,
-            'nums': nums,
-            'arr': arr,
-            'idx': idx,
-            'isNegative': isNegative,
-            'ansLen': ansLen,
-            'currentNumToFind': currentNumToFind,
-            'time': 0
+            'engine': engine,
+            'time': 0,
+            'accumulator': 0,
+            'tick_ms': SNAKE_SPEED if tick_ms is None else tick_ms,
+            'recorder': recorder,
+            'pilot': pilot
         }
     
+    def save_replay(self):
+        """Save the replay of the current round, if it is being recorded."""
+        state = self.game_state
+        if state is None or state['recorder'] is None:
+            return
+        
+        state['recorder'].finish(state['engine'])
+        path = state['recorder'].save()
+        # only save each round once
+        state['recorder'] = None
+        if path is not None:
+            print(f"Replay saved to {path}")
+    
+    def read_action(self):
+        """
+        Take the next direction the player asked for from the controls.
+        
+        Turning straight back is ignored unless the snake is a single cell,
+        since it would only run the snake into its own body. If the round
+        has a pilot, it chooses the direction instead.
+        
+        Returns:
+            str: The snake direction, or None if no movement key was pressed or is held
+        """
+        state = self.game_state
+        if state['pilot'] is not None:
+            return state['pilot'].next_action(state['engine'])
+        single = len(state['engine'].snake.body) == 1
+        return self.controls.pop(allow_reverse=single)
+    
+    def handle_events(self):
+        """Handle window events and queue movement key presses."""
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.running = False
+            
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_l:
+                    self.running = False
+            
+            self.controls.handle(event)
+    
+    def handle_step(self, result):
+        """
+        Play the sounds and screens for the outcome of an engine step.
+        
+        Args:
+            result (dict): The dict returned by GameEngine.step
+            
+        Returns:
+            bool: True if the round is over, False if it continues
+        """
+        engine = self.game_state['engine']
+        if result['status'] != PLAYING:
+            self.save_replay()
+        
+        if result['eaten'] is not None:
+            # play eat sound
+            self.sound_manager.play('eat')
+            if result['correct']:
+                # correct number - play success sound
+                self.sound_manager.play('correct')
+        
+        if result['status'] == WON:
+            self.sound_manager.play('victory')
+            victory_animation(config.SCREEN)
+            self.question_pool.resume()
+            you_win_screen()
+            return True
+        
+        if result['status'] == LOST:
+            # wrong number eaten - trigger death animation
+            self.sound_manager.play('wrong' if engine.reason == WRONG else 'collision')
+            death_animation(config.SCREEN)
+            self.question_pool.resume()
+            you_lose_screen()
+            return True
+        
+        return False
+    
+    def update_frame(self):
+        """
+        Start a game frame: wait for it, read input, then work out how many snake moves are due.
+        
+        The snake moves at a fixed rate of one move per SNAKE_SPEED ms no
+        matter how fast frames are drawn (the round's tick_ms, which can be
+        changed for replays). Real time is collected in an accumulator and
+        every full tick_ms in it is one move.
+        
+        Returns:
+            int: Number of snake moves to simulate this frame
+        """
+        profiler = get_profiler()
+        state = self.game_state
+        
+        profiler.frame("game")
+        frame_ms = self.clock.tick(FPS)
+        state['time'] += frame_ms / 1000
+        profiler.mark("tick")
+        
+        self.handle_events()
+        profiler.mark("events")
+        
+        # after a long stall, drop the moves that don't fit in one frame
+        tick_ms = state['tick_ms']
+        state['accumulator'] = min(state['accumulator'] + frame_ms, tick_ms * MAX_TICKS_PER_FRAME)
+        ticks = int(state['accumulator'] // tick_ms)
+        state['accumulator'] -= ticks * tick_ms
+        
+        self.renderer.draw_stats(state['engine'].arr, state['time'])
+        profiler.mark("stats")
+        return ticks
+    
+    def step_snake(self):
+        """
+        Simulate one snake move.
+        
+        Returns:
+            dict: The engine step result, see GameEngine.step
+        """
+        profiler = get_profiler()
+        state = self.game_state
+        
+        # snake movement
+        action = self.read_action()
+        if state['recorder'] is not None:
+            state['recorder'].record(action)
+        result = state['engine'].step(action)
+        profiler.mark("step")
+        self.renderer.draw_step(result, BLUE)
+        profiler.mark("step_draw")
+        return result
+    
+    def draw_frame(self):
+        """Second half of a game frame: draw the board and show it."""
+        profiler = get_profiler()
+        engine = self.game_state['engine']
+        
+        self.renderer.draw_board(engine, BLUE, BLACK)
+        
+        overlay = profiler.overlay(config.SCREEN, "game")
+        if overlay is not None:
+            self.renderer.mark(overlay)
+        profiler.mark("overlay")
+        
+        self.renderer.present()
+        profiler.mark("present")
+        
+        # the board is only partly redrawn, so take the overlay off again
+        hidden = profiler.hide_overlay(config.SCREEN)
+        if hidden is not None:
+            self.renderer.mark(hidden)
+        profiler.end_frame()
+    
     def run(self):
         """
-        Main game loop that handles rendering, input, collision detection, and game logic.
+        Main game loop that handles rendering and input around the game engine.
         
         The loop continues until the player quits. It manages:
-        - Snake movement and collision detection
-        - Number collection and validation
-        - Win/lose conditions
-        - Screen updates and animations
+        - Feeding keyboard (or autopilot) input to the engine
+        - Win/lose screens and animations
+        - Screen updates
         - Sound effects
         """
         difficulty = get_difficulty()
-        game_state = self.initialize_game(difficulty)
+        self.game_state = self.initialize_game(difficulty)
         foundDifficulty = True
         
         while self.running:
             if not foundDifficulty:
                 difficulty = get_difficulty()
-                game_state = self.initialize_game(difficulty)
+                self.game_state = self.initialize_game(difficulty)
                 foundDifficulty = True
             
-            self.clock.tick(FPS)
-            game_state['time'] += 1
-            
-            drawStats(SCREEN, BLACK, game_state['arr'], game_state['time'])
-            
-            print(f"Number to find: {game_state['currentNumToFind'].number}, "
-                  f"idx: {game_state['idx']}, ansLen: {game_state['ansLen']}")
+            ended = False
+            for _ in range(self.update_frame()):
+                if self.handle_step(self.step_snake()):
+                    ended = True
+                    break
             
-            # snake movement
-            game_state['snake'].move(
-                BLUE, 
-                SCREEN, 
-                game_state['currentNumToFind'].row, 
-                game_state['currentNumToFind'].col
-            )
-            
-            # check collisions after movement
-            if game_state['snake'].collisionWithSelf():
-                print("SELF COLLISION DETECTED!")  # Debug
-                self.sound_manager.play('collision')
-                death_animation(SCREEN)
-                you_lose_screen()
+            if ended:
                 foundDifficulty = False
                 continue
             
-            if game_state['snake'].collideWall:
-                print("WALL COLLISION DETECTED!")  # Debug
-                self.sound_manager.play('collision')
-                death_animation(SCREEN)
-                you_lose_screen()
-                foundDifficulty = False
-                continue
-            
-            for num in game_state['nums']:
-                num.draw_Number(BLACK, SCREEN)
-                
-                if num.collision(game_state['snake'].row, game_state['snake'].col):
-                    # play eat sound
-                    self.sound_manager.play('eat')
-                    
-                    # build occupied set once
-                    occupied = set(game_state['snake'].visited)
-                    for other_num in game_state['nums']:
-                        if other_num != num:
-                            occupied.add((other_num.row, other_num.col))
-                    
-                    num.createNewNumber(WHITE, SCREEN, occupied)
-                    
-                    game_state['arr'].append(str(num.number))
-                
-                    if game_state['idx'] < game_state['ansLen']:
-                        if num.number == str(game_state['answer'])[game_state['idx']]:
-                            # correct number - play success sound
-                            self.sound_manager.play('correct')
-                            game_state['idx'] += 1
-                            if game_state['idx'] <= game_state['ansLen']:
-                                if game_state['idx'] < len(str(game_state['answer'])):
-                                    game_state['currentNumToFind'] = game_state['nums'][
-                                        int(str(game_state['answer'])[game_state['idx']])
-                                    ]
-                        else:
-                            # wrong number eaten - trigger death animation
-                            self.sound_manager.play('wrong')
-                            death_animation(SCREEN)
-                            you_lose_screen()
-                            foundDifficulty = False
-                            break  # skip rest of loop
-                    
-                    if len(game_state['arr']) == game_state['ansLen']:
-                        print(f"Answer complete! arr: {''.join(game_state['arr'])}, answer: {game_state['answer']}")  # Debug
-                        final_ans = (int("-" + "".join(game_state['arr'])) if game_state['isNegative'] else int("".join(game_state['arr'])))
-                        
-                        print(f"Final answer: {final_ans}, Expected: {int(game_state['answer'])}")  # Debug
-                        if final_ans == int(game_state['answer']):
-                            print("WIN CONDITION MET - Starting victory animation")  # Debug
-                            self.sound_manager.play('victory')
-                            victory_animation(SCREEN)
-                            you_win_screen()
-                            foundDifficulty = False
-                            break
-                        else:
-                            self.sound_manager.play('wrong')
-                            death_animation(SCREEN)
-                            you_lose_screen()
-                            foundDifficulty = False
-                            break
-            
-            # draw grid lines with animation
-            draw_lines(SQUARE_PER_ROW, SQUARE_PER_COL)
-            
-            # draw snake
-            game_state['snake'].draw_head(BLUE, SCREEN)
-            
-            # snake speed
-            pygame.time.delay(SNAKE_SPEED)
-            
-            pygame.display.update()
+            self.draw_frame()
+        
+        # a round the player quit in the middle of is kept as well
+        self.save_replay()
+    
+    def play_replay(self, replay, speed=1.0):
+        """
+        Show a recorded round, with the replay's actions in place of the keyboard.
+        
+        Ends with the usual win/lose screens, or as soon as the replay runs
+        out of ticks if the player quit during the recorded round. The board
+        and renderer follow the replay's size, whichever mode the game was
+        started in.
+        
+        Args:
+            replay (dict): A replay as returned by replay.load
+            speed (float): Playback speed, 2 plays the round twice as fast
+        """
+        size = (replay['rows'], replay['cols'])
+        if size != self.board_size:
+            self.set_board(*size)
+            self.renderer.warm()
+        
+        pilot = ReplayInput(replay)
+        self.game_state = self.new_state(new_engine(replay), pilot=pilot,
+                                         tick_ms=replay['snake_speed'] / speed)
+        print(f"Replaying: {replay['expression']} = {replay['answer']}")
+        
+        while self.running and not pilot.done:
+            for _ in range(self.update_frame()):
+                if self.handle_step(self.step_snake()):
+                    return
+                if pilot.done:
+                    break
             
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_l:
-                        self.running = False
\ No newline at end of file
+            self.draw_frame()
@@ -0,0 +1,140 @@
+"""
+Glyph atlas for Math Snake.
+
+This module pre-rasterizes single characters into display-format surfaces
+so digit tiles and HUD text can be drawn with plain blits instead of
+rendering text with a font every frame.
+"""
+
+import pygame
+
+# characters used by the digit tiles and the stats bar
+HUD_CHARS = "0123456789-.Time: "
+
+class GlyphAtlas:
+    """
+    Cache of rendered characters for one font size.
+    
+    Each (character, color) pair is rendered once, converted to the display's
+    pixel format and reused from then on.
+    """
+
+    def __init__(self, size):
+        """
+        Load the font for this atlas.
+        
+        Args:
+            size (int): Font size in pixels
+        """
+        self.font = pygame.font.Font("freesansbold.ttf", size)
+        self.height = self.font.get_height()
+        self.glyphs = {}
+
+    def glyph(self, char, color):
+        """
+        Get the surface for a single character.
+        
+        Args:
+            char (str): The character to draw
+            color (tuple): RGB color of the character
+        
+        Returns:
+            pygame.Surface: The rendered character with per-pixel alpha
+        """
+        key = (char, color)
+        surface = self.glyphs.get(key)
+        if surface is None:
+            surface = self.font.render(char, True, color).convert_alpha()
+            self.glyphs[key] = surface
+        return surface
+
+    def render(self, chars, color):
+        """
+        Render characters that are not in the atlas yet, without converting them.
+        
+        Only the font is used, so this can run on a worker thread. The
+        result is handed to add() on the main thread.
+        
+        Args:
+            chars (str): The characters to render
+            color (tuple): RGB color of the characters
+        
+        Returns:
+            dict: (character, color) -> rendered surface
+        """
+        return {(char, color): self.font.render(char, True, color)
+                for char in chars if (char, color) not in self.glyphs}
+
+    def add(self, rendered):
+        """
+        Convert rendered characters to the display's pixel format and keep them.
+        
+        Args:
+            rendered (dict): Surfaces returned by render()
+        """
+        for key, surface in rendered.items():
+            self.glyphs.setdefault(key, surface.convert_alpha())
+
+    def warm(self, chars, color):
+        """
+        Render a set of characters ahead of time.
+        
+        Args:
+            chars (str): The characters to render
+            color (tuple): RGB color of the characters
+        """
+        self.add(self.render(chars, color))
+
+    def width(self, text, color):
+        """
+        Get the width of a string drawn with blit_text.
+        
+        Args:
+            text (str): The text to measure
+            color (tuple): RGB color of the text
+        
+        Returns:
+            int: Width of the text in pixels
+        """
+        return sum(self.glyph(char, color).get_width() for char in text)
+
+    def blit_text(self, screen, text, color, pos):
+        """
+        Draw a string glyph by glyph in a single batched blit.
+        
+        Args:
+            screen (pygame.Surface): The surface to draw on
+            text (str): The text to draw
+            color (tuple): RGB color of the text
+            pos (tuple): Top-left (x, y) position of the text
+        
+        Returns:
+            pygame.Rect: The area covered by the text
+        """
+        x, y = pos
+        blits = []
+        for char in text:
+            surface = self.glyph(char, color)
+            blits.append((surface, (x, y)))
+            x += surface.get_width()
+        screen.blits(blits, doreturn=False)
+        return pygame.Rect(pos[0], y, x - pos[0], self.height)
+
+# one atlas per font size, shared by the whole process
+_atlases = {}
+
+def get_atlas(size):
+    """
+    Get the shared glyph atlas for a font size, creating it on first use.
+    
+    Args:
+        size (int): Font size in pixels
+    
+    Returns:
+        GlyphAtlas: The atlas for that size
+    """
+    atlas = _atlases.get(size)
+    if atlas is None:
+        atlas = GlyphAtlas(size)
+        _atlases[size] = atlas
+    return atlas
@@ -7,16 +7,21 @@ and displays game statistics (collected numbers and time) at the top of the scre
 
 import pygame
 import math
+import config
 from config import *
+from glyphs import get_atlas
 
 class Spot:
     """
     Represents a single cell in the game grid.
     
-    Each spot knows its grid coordinates (row, col), screen coordinates (x, y),
-    dimensions, and color. Spots can be reset to their default appearance.
+    Each spot knows its grid coordinates (row, col), screen coordinates (x, y)
+    and dimensions. Spots can be reset to their default appearance. They are
+    small views made by Grid.spot() when needed, not stored for every cell.
     """
     
+    __slots__ = ("row", "col", "x", "y", "width", "height")
+    
     def __init__(self, row, col, x, y, width, height):
         """
         Initialize a grid spot with position and dimensions.
@@ -35,68 +40,181 @@ class Spot:
         self.y = y
         self.width = width
         self.height = height
-        self.color = WHITE
 
     def reset(self, screen):
         """
-        Clear the spot by drawing it with its default color.
+        Clear the spot by copying it back from the pre-baked grid background.
         
-        Used to erase numbers or snake segments when they move.
+        Used to erase numbers or snake segments when they move. The copy
+        includes the grid lines around the spot, so they don't need redrawing.
         
         Args:
             screen (pygame.Surface): The game screen to draw on
         """
-        pygame.draw.rect(screen, self.color, pygame.Rect(self.x, self.y, self.width, self.height))
+        area = pygame.Rect(self.x, self.y, self.width, self.height)
+        screen.blit(grid_layers(SQUARE_PER_ROW, SQUARE_PER_COL)[0], area, area)
 
-def make_grid(row, col):
+class Grid:
+    """
+    Geometry of a grid of equally sized cells covering the game area.
+    
+    Cell positions are computed from the row and column when asked for, so
+    the grid costs the same whether it has a hundred cells or a million.
+    What is on each cell is kept by the engine (GameEngine.cells).
     """
-    Create a 2D grid of Spot objects covering the entire game area.
     
-    Builds a row x col grid where each spot represents one playable cell.
-    Each spot is initialized with its grid coordinates and screen position.
+    __slots__ = ("rows", "cols", "width", "height")
+    
+    def __init__(self, rows, cols, width, height):
+        """
+        Initialize the grid.
+        
+        Args:
+            rows (int): Number of rows in the grid
+            cols (int): Number of columns in the grid
+            width (int): Width of a cell in pixels
+            height (int): Height of a cell in pixels
+        """
+        self.rows = rows
+        self.cols = cols
+        self.width = width
+        self.height = height
+
+    def rect(self, row, col):
+        """
+        Get the screen area of a cell.
+        
+        Args:
+            row (int): Row of the cell
+            col (int): Column of the cell
+        
+        Returns:
+            pygame.Rect: The cell's area on screen
+        """
+        return pygame.Rect(col * self.width, row * self.height, self.width, self.height)
+
+    def spot(self, row, col):
+        """
+        Get a Spot view of a cell.
+        
+        Args:
+            row (int): Row of the cell
+            col (int): Column of the cell
+        
+        Returns:
+            Spot: The cell's grid and screen coordinates
+        """
+        return Spot(row, col, col * self.width, row * self.height, self.width, self.height)
+
+def make_grid(row, col):
+    """
+    Create the grid covering the entire game area.
     
     Args:
         row (int): Number of rows in the grid
         col (int): Number of columns in the grid
         
     Returns:
-        list: 2D list of Spot objects, indexed as grid[row][col]
+        Grid: The grid, with cells of SPOT_WIDTH x SPOT_HEIGHT pixels
     """
-    grid = []
-    y = 0
-
-    for i in range(row):
-        temp = []
-        x = 0
-        for j in range(col):
-            spot = Spot(i, j, x, y, SPOT_WIDTH, SPOT_HEIGHT)
-            temp.append(spot)
-            x += SPOT_WIDTH
-        y += SPOT_HEIGHT
-        grid.append(temp)
-
-    return grid
+    return Grid(row, col, SPOT_WIDTH, SPOT_HEIGHT)
 
-def draw_lines(row, col):
+def paint_lines(surface, row, col):
     """
-    Draw the grid lines that separate each cell.
+    Paint the grid lines that separate each cell onto a surface.
     
     Renders horizontal and vertical lines to create the visible grid structure.
     Lines start at row 1 to leave space for the stats bar at the top.
     
     Args:
+        surface (pygame.Surface): The surface to paint on
         row (int): Number of rows in the grid
         col (int): Number of columns in the grid
     """
     # draw horizontal lines
     for i in range(row):
         y = i * SPOT_HEIGHT
-        pygame.draw.line(SCREEN, BLACK, (0, y), (SCREEN_WIDTH, y), width=2)
+        pygame.draw.line(surface, BLACK, (0, y), (SCREEN_WIDTH, y), width=2)
 
     # draw vertical lines
     for j in range(col):
         x = j * SPOT_WIDTH
-        pygame.draw.line(SCREEN, BLACK, (x, SPOT_HEIGHT), (x, SCREEN_HEIGHT), width=2)
+        pygame.draw.line(surface, BLACK, (x, SPOT_HEIGHT), (x, SCREEN_HEIGHT), width=2)
+
+# baked (background, lines) surfaces per grid size
+_layers = {}
+
+def grid_layers(row, col):
+    """
+    Get the pre-baked grid surfaces for a grid size, baking them on first use.
+    
+    The grid never changes during a game, so its lines are drawn only once:
+    - background: opaque white cells with the grid lines, used to clear spots
+    - lines: the grid lines alone on a transparent surface, laid over cells
+      that were drawn on
+    
+    Args:
+        row (int): Number of rows in the grid
+        col (int): Number of columns in the grid
+        
+    Returns:
+        tuple: (background, lines) pygame.Surface objects covering the screen
+    """
+    layers = _layers.get((row, col))
+    if layers is None:
+        background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        background.fill(WHITE)
+        paint_lines(background, row, col)
+
+        lines = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA).convert_alpha()
+        paint_lines(lines, row, col)
+
+        layers = (background, lines)
+        _layers[(row, col)] = layers
+    return layers
+
+def draw_lines(row, col, area=None):
+    """
+    Draw the grid lines that separate each cell from the pre-baked line layer.
+    
+    Args:
+        row (int): Number of rows in the grid
+        col (int): Number of columns in the grid
+        area (pygame.Rect): Part of the screen to draw lines on, or None for all of it
+    
+    Returns:
+        pygame.Rect: The screen area drawn on, for the renderer to mark as changed
+    """
+    lines = grid_layers(row, col)[1]
+    if area is None:
+        return config.SCREEN.blit(lines, (0, 0))
+    return config.SCREEN.blit(lines, area, area)
+
+def draw_background(row, col):
+    """
+    Clear the whole screen to the empty grid.
+    
+    Args:
+        row (int): Number of rows in the grid
+        col (int): Number of columns in the grid
+    """
+    config.SCREEN.blit(grid_layers(row, col)[0], (0, 0))
+
+# where drawStats puts the timer and the collected digits
+STATS_TIME_POS = (0.02 * SCREEN_WIDTH, SPOT_HEIGHT * 0.25)
+STATS_NUMS_POS = (0.42 * SCREEN_WIDTH, SPOT_HEIGHT * 0.25)
+
+def time_text(time):
+    """
+    Get the timer text of the stats bar.
+    
+    Args:
+        time (float): Elapsed time in seconds since game start
+        
+    Returns:
+        str: The timer text, e.g. "Time : 12.3"
+    """
+    return f"Time : {time:.1f}"
 
 def drawStats(screen, color, nums, time):
     """
@@ -104,24 +222,122 @@ def drawStats(screen, color, nums, time):
     
     Shows:
     - Collected digits sequence (on the left side, centered)
-    - Elapsed game time in frames (on the right side)
+    - Elapsed game time in seconds (on the right side)
     
     The stats bar is drawn with a black background spanning the full width
-    and occupying the top row of the grid.
+    and occupying the top row of the grid. Text is drawn from the shared
+    glyph atlas, so nothing is rasterized per frame.
     
     Args:
         screen (pygame.Surface): The game screen to draw on
         color (tuple): RGB color for the stats bar background (typically BLACK)
         nums (list): List of collected digit strings to display
-        time (int): Elapsed time in frames since game start
+        time (float): Elapsed time in seconds since game start
+        
+    Returns:
+        pygame.Rect: The screen area covered by the stats bar
     """
-    pygame.draw.rect(screen, color, pygame.Rect(0, 0, SCREEN_WIDTH, SPOT_HEIGHT))
+    bar = pygame.draw.rect(screen, color, pygame.Rect(0, 0, SCREEN_WIDTH, SPOT_HEIGHT))
 
-    Number = FONT_BIG.render("".join(nums), True, GREEN)
-    Time = FONT_BIG.render("Time : " + str(time), True, GREEN)
+    atlas = get_atlas(FONT_BIG_SIZE)
+    atlas.blit_text(screen, time_text(time), GREEN, STATS_TIME_POS)
+    atlas.blit_text(screen, "".join(nums), GREEN, STATS_NUMS_POS)
+    
+    return bar
 
-    screen.blit(Time, (0.02 * SCREEN_WIDTH, SPOT_HEIGHT * 0.25))
-    screen.blit(Number, (0.42 * SCREEN_WIDTH, SPOT_HEIGHT * 0.25))
+class StatsBar:
+    """
+    Stats bar that only redraws the characters that changed since the last frame.
+    
+    The timer changes every few frames but usually only in its last digit, and
+    the collected digits only change when a number is eaten. StatsBar keeps
+    the text it drew last and repaints from the first differing character
+    onwards, instead of repainting the whole bar.
+    """
+    
+    def __init__(self, screen, color):
+        """
+        Initialize the stats bar.
+        
+        Args:
+            screen (pygame.Surface): The game screen to draw on
+            color (tuple): RGB color for the stats bar background (typically BLACK)
+        """
+        self.screen = screen
+        self.color = color
+        self.bar = pygame.Rect(0, 0, SCREEN_WIDTH, SPOT_HEIGHT)
+        self.time_text = None
+        self.nums_text = None
+
+    def invalidate(self):
+        """Repaint the whole bar on the next draw."""
+        self.time_text = None
+        self.nums_text = None
+
+    def draw(self, nums, time):
+        """
+        Bring the stats bar up to date.
+        
+        Args:
+            nums (list): List of collected digit strings to display
+            time (float): Elapsed time in seconds since game start
+            
+        Returns:
+            list: pygame.Rect areas of the screen that were redrawn
+        """
+        timer_text = time_text(time)
+        nums_text = "".join(nums)
+
+        if self.time_text is None:
+            self.time_text, self.nums_text = timer_text, nums_text
+            return [drawStats(self.screen, self.color, nums, time)]
+
+        rects = []
+        if timer_text != self.time_text:
+            rects.append(self.redraw_text(STATS_TIME_POS, self.time_text, timer_text))
+            self.time_text = timer_text
+        if nums_text != self.nums_text:
+            rects.append(self.redraw_text(STATS_NUMS_POS, self.nums_text, nums_text))
+            self.nums_text = nums_text
+        return rects
+
+    def redraw_text(self, pos, old, new):
+        """
+        Replace one text in the bar, starting at the first character that differs.
+        
+        Args:
+            pos (tuple): Top-left (x, y) position of the text
+            old (str): Text currently on screen
+            new (str): Text to show
+            
+        Returns:
+            pygame.Rect: The area that was redrawn
+        """
+        atlas = get_atlas(FONT_BIG_SIZE)
+
+        same = 0
+        while same < min(len(old), len(new)) and old[same] == new[same]:
+            same += 1
+
+        x = pos[0] + atlas.width(new[:same], GREEN)
+        end = pos[0] + max(atlas.width(old, GREEN), atlas.width(new, GREEN))
+        area = pygame.Rect(x, pos[1], end - x, atlas.height).clip(self.bar)
 
-# Create the global game grid
-GRID = make_grid(SQUARE_PER_ROW, SQUARE_PER_COL)
\ No newline at end of file
+        pygame.draw.rect(self.screen, self.color, area)
+        atlas.blit_text(self.screen, new[same:], GREEN, (x, pos[1]))
+        return area
+
+# the global game grid, built by get_grid() on first use
+GRID = None
+
+def get_grid():
+    """
+    Get the global game grid, creating it the first time it is needed.
+    
+    Returns:
+        Grid: The grid of the normal sized board
+    """
+    global GRID
+    if GRID is None:
+        GRID = make_grid(SQUARE_PER_ROW, SQUARE_PER_COL)
+    return GRID
\ No newline at end of file
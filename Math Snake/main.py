@@ -1,7 +1,34 @@
+import time
+
+# taken before the heavy imports, to report the time until the menu shows
+LAUNCH_TIME = time.perf_counter()
+
+import argparse
 import pygame
+import config
 from game import Game
 
 def main():
+    parser = argparse.ArgumentParser(description="Play Math Snake.")
+    parser.add_argument("--huge", action="store_true",
+                        help="play on a board far bigger than the screen, explored with a camera")
+    parser.add_argument("--seed", type=int, help="the same seed gives the same questions and boards")
+    parser.add_argument("--record", action="store_true", help="save a replay of every round")
+    parser.add_argument("--autopilot", action="store_true", help="let the snake play by itself")
+    args = parser.parse_args()
+
+    # flags only switch settings on, the defaults live in config.py
+    if args.huge:
+        config.HUGE_GRID = True
+    if args.seed is not None:
+        config.SEED = args.seed
+    if args.record:
+        config.RECORD_REPLAYS = True
+    if args.autopilot:
+        config.AUTOPILOT = True
+    # the menu reports the time to its first frame (with MATHSNAKE_PROFILE set)
+    config.LAUNCH_TIME = LAUNCH_TIME
+    config.setup()
     pygame.display.set_caption("Math Snake")
     
     game = Game()
@@ -6,47 +6,94 @@ and difficulty selection.
 """
 
 import pygame
-import random
 import math
 import time
+import numpy as np
+import config
 from config import *
+from profiler import get_profiler
+from startup_pipeline import report_launch
 
-galaxy_stars = []
-for i in range(STAR_COUNT):
-    angle = random.uniform(0, 2 * math.pi)
-    radius = random.uniform(50, 0.9 * SCREEN_WIDTH // 2)
-    speed = random.uniform(0.001, 0.003)
-    size = random.randint(2, 5)
-    alpha = random.randint(100, 180) # transparency
-    galaxy_stars.append({
-        'angle': angle,
-        'radius': radius,
-        'speed': speed,
-        'size': size,
-        'alpha': alpha
-    })
+# star arrays ('angle', 'radius', 'speed', 'size', 'alpha' and the star
+# 'sprites'), filled by set_galaxy() at startup or when the menu is first drawn
+galaxy_stars = {}
+
+# pre-rendered star sprites by (size, alpha)
+_star_sprites = {}
+
+def star_sprite(size, alpha):
+    """
+    Get the sprite for a star, creating it on first use.
+    
+    Args:
+        size (int): Radius of the star in pixels
+        alpha (int): Transparency of the star (0-255)
+    
+    Returns:
+        pygame.Surface: A (2 * size) square surface with the star drawn in it
+    """
+    key = (size, alpha)
+    sprite = _star_sprites.get(key)
+    if sprite is None:
+        sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, WHITE + (alpha,), (size, size), size)
+        _star_sprites[key] = sprite
+    return sprite
+
+def make_galaxy():
+    """
+    Create the orbiting stars of the menu background.
+    
+    Each star gets a random angle, orbit radius, speed, size and transparency.
+    This is only NumPy work, so it can run on a startup worker thread; the
+    sprites are made by set_galaxy() on the main thread.
+    
+    Returns:
+        dict: Star arrays 'angle', 'radius', 'speed', 'size' and 'alpha'
+    """
+    rng = np.random.default_rng()
+    return {
+        'angle': rng.uniform(0, 2 * math.pi, STAR_COUNT),
+        'radius': rng.uniform(50, 0.9 * SCREEN_WIDTH // 2, STAR_COUNT),
+        'speed': rng.uniform(0.001, 0.003, STAR_COUNT),
+        'size': rng.integers(2, 5, STAR_COUNT, endpoint=True),
+        # transparency
+        'alpha': rng.integers(100, 180, STAR_COUNT, endpoint=True)
+    }
+
+def set_galaxy(stars):
+    """
+    Show a set of stars in the menu background, making their sprites.
+    
+    Args:
+        stars (dict): Star arrays returned by make_galaxy()
+    """
+    galaxy_stars.update(stars)
+    galaxy_stars['sprites'] = [star_sprite(size, alpha)
+                               for size, alpha in zip(stars['size'].tolist(), stars['alpha'].tolist())]
 
 def draw_galaxy():
     """
     Draw an animated spiral galaxy background effect.
     
     Stars orbit around the screen center at varying speeds and radii,
-    creating a dynamic space-like atmosphere for the menu.
+    creating a dynamic space-like atmosphere for the menu. All stars are
+    moved in one NumPy pass and drawn with a single batched blit.
     """
     center_x, center_y = SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2
     
-    for star in galaxy_stars:
-        # update angle to make it orbit
-        star['angle'] += star['speed']
-        
-        # calculate position based on angle and radius
-        x = center_x + star['radius'] * math.cos(star['angle'])
-        y = center_y + star['radius'] * math.sin(star['angle'])
-        
-        # draw the star
-        star_surface = pygame.Surface((star['size'] * 2, star['size'] * 2), pygame.SRCALPHA)
-        pygame.draw.circle(star_surface, WHITE + (star['alpha'],), (star['size'], star['size']), star['size'])
-        SCREEN.blit(star_surface, (x - star['size'], y - star['size']))
+    if not galaxy_stars:
+        set_galaxy(make_galaxy())
+    
+    stars = galaxy_stars
+    # update angles to make them orbit
+    stars['angle'] += stars['speed']
+    
+    # calculate positions based on angle and radius, offset to the sprite corner
+    xs = (center_x + stars['radius'] * np.cos(stars['angle']) - stars['size']).astype(np.int64)
+    ys = (center_y + stars['radius'] * np.sin(stars['angle']) - stars['size']).astype(np.int64)
+    
+    config.SCREEN.blits(zip(stars['sprites'], zip(xs.tolist(), ys.tolist())), doreturn=False)
 
 def draw_menu():
     """
@@ -60,13 +107,14 @@ def draw_menu():
         tuple: Four pygame.Rect objects representing the clickable button areas
             (easy_rect, medium_rect, hard_rect, insane_rect)
     """
+    profiler = get_profiler()
     PADDING = int(SCREEN_WIDTH * 0.05)
     SPACING = int(SCREEN_HEIGHT * 0.1)
 
-    easy_button = FONT_BIG.render("Easy", True, BLACK)
-    medium_button = FONT_BIG.render("Medium", True, BLACK)
-    hard_button = FONT_BIG.render("Hard", True, BLACK)
-    insane_button = FONT_BIG.render("Insane", True, BLACK)
+    easy_button = config.FONT_BIG.render("Easy", True, BLACK)
+    medium_button = config.FONT_BIG.render("Medium", True, BLACK)
+    hard_button = config.FONT_BIG.render("Hard", True, BLACK)
+    insane_button = config.FONT_BIG.render("Insane", True, BLACK)
 
     easy_rect = pygame.Rect(
         SCREEN_WIDTH // 2 - easy_button.get_width() // 2 - PADDING,
@@ -100,54 +148,59 @@ def draw_menu():
     r = max(0, min(255, int(100 + 50 * math.sin(time_elapsed))))
     g = max(0, min(255, int(100 + 50 * math.cos(time_elapsed))))
     b = max(0, min(255, int(150 + 50 * math.sin(time_elapsed / 2))))
-    SCREEN.fill((r,g,b))
+    config.SCREEN.fill((r,g,b))
+    profiler.mark("background")
 
     draw_galaxy()
+    profiler.mark("galaxy")
 
     mouse_x, mouse_y = pygame.mouse.get_pos()
 
     if easy_rect.collidepoint(mouse_x, mouse_y):
-        pygame.draw.rect(SCREEN, EASY_COLOR, easy_rect, 5)
-        pygame.draw.rect(SCREEN, WHITE, easy_rect, 3)
+        pygame.draw.rect(config.SCREEN, EASY_COLOR, easy_rect, 5)
+        pygame.draw.rect(config.SCREEN, WHITE, easy_rect, 3)
     else:
-        pygame.draw.rect(SCREEN, EASY_COLOR, easy_rect)
+        pygame.draw.rect(config.SCREEN, EASY_COLOR, easy_rect)
 
     if medium_rect.collidepoint(mouse_x, mouse_y):
-        pygame.draw.rect(SCREEN, MEDIUM_COLOR, medium_rect, 5)
-        pygame.draw.rect(SCREEN, WHITE, medium_rect, 3)
+        pygame.draw.rect(config.SCREEN, MEDIUM_COLOR, medium_rect, 5)
+        pygame.draw.rect(config.SCREEN, WHITE, medium_rect, 3)
     else:
-        pygame.draw.rect(SCREEN, MEDIUM_COLOR, medium_rect)
+        pygame.draw.rect(config.SCREEN, MEDIUM_COLOR, medium_rect)
 
     if hard_rect.collidepoint(mouse_x, mouse_y):
-        pygame.draw.rect(SCREEN, HARD_COLOR, hard_rect, 5)
-        pygame.draw.rect(SCREEN, WHITE, hard_rect, 3)
+        pygame.draw.rect(config.SCREEN, HARD_COLOR, hard_rect, 5)
+        pygame.draw.rect(config.SCREEN, WHITE, hard_rect, 3)
     else:
-        pygame.draw.rect(SCREEN, HARD_COLOR, hard_rect)
+        pygame.draw.rect(config.SCREEN, HARD_COLOR, hard_rect)
 
     if insane_rect.collidepoint(mouse_x, mouse_y):
-        pygame.draw.rect(SCREEN, INSANE_COLOR, insane_rect, 5)
-        pygame.draw.rect(SCREEN, WHITE, insane_rect, 3)
+        pygame.draw.rect(config.SCREEN, INSANE_COLOR, insane_rect, 5)
+        pygame.draw.rect(config.SCREEN, WHITE, insane_rect, 3)
     else:
-        pygame.draw.rect(SCREEN, INSANE_COLOR, insane_rect)
+        pygame.draw.rect(config.SCREEN, INSANE_COLOR, insane_rect)
 
-    title = HEADER_1.render("Welcome to Math Snake", True, BLACK)
-    selectLevel = HEADER_2.render("Select Difficulty Level", True, BLACK)
+    title = config.HEADER_1.render("Welcome to Math Snake", True, BLACK)
+    selectLevel = config.HEADER_2.render("Select Difficulty Level", True, BLACK)
 
-    SCREEN.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, SCREEN_HEIGHT * 0.1))
-    SCREEN.blit(selectLevel, (SCREEN_WIDTH // 2 - selectLevel.get_width() // 2, SCREEN_HEIGHT * 0.2))
+    config.SCREEN.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, SCREEN_HEIGHT * 0.1))
+    config.SCREEN.blit(selectLevel, (SCREEN_WIDTH // 2 - selectLevel.get_width() // 2, SCREEN_HEIGHT * 0.2))
 
-    SCREEN.blit(easy_button, (easy_rect.x + PADDING, easy_rect.y + PADDING // 2))
-    SCREEN.blit(medium_button, (medium_rect.x + PADDING, medium_rect.y + PADDING // 2))
-    SCREEN.blit(hard_button, (hard_rect.x + PADDING, hard_rect.y + PADDING // 2))
-    SCREEN.blit(insane_button, (insane_rect.x + PADDING, insane_rect.y + PADDING // 2))
+    config.SCREEN.blit(easy_button, (easy_rect.x + PADDING, easy_rect.y + PADDING // 2))
+    config.SCREEN.blit(medium_button, (medium_rect.x + PADDING, medium_rect.y + PADDING // 2))
+    config.SCREEN.blit(hard_button, (hard_rect.x + PADDING, hard_rect.y + PADDING // 2))
+    config.SCREEN.blit(insane_button, (insane_rect.x + PADDING, insane_rect.y + PADDING // 2))
 
     if easy_rect.collidepoint(mouse_x, mouse_y) or medium_rect.collidepoint(mouse_x, mouse_y) or \
             hard_rect.collidepoint(mouse_x, mouse_y) or insane_rect.collidepoint(mouse_x, mouse_y):
         pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
     else:
         pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+    profiler.mark("buttons")
 
+    profiler.overlay(config.SCREEN, "menu")
     pygame.display.update()
+    profiler.mark("update")
 
     return easy_rect, medium_rect, hard_rect, insane_rect
 
@@ -161,8 +214,11 @@ def get_difficulty():
     Returns:
         str: The selected difficulty level ('Easy', 'Medium', 'Hard', or 'Insane')
     """
+    clock = pygame.time.Clock()
+    profiler = get_profiler()
     run = True
     while run:
+        profiler.frame("menu")
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
@@ -179,5 +235,10 @@ def get_difficulty():
                 elif insane_rect.collidepoint(mouse_pos):
                     return "Insane"
 
+        profiler.mark("events")
         draw_menu()
-        pygame.display.update()
\ No newline at end of file
+        report_launch()
+        # the menu idles on screen, don't redraw it faster than the game runs
+        clock.tick(FPS)
+        profiler.mark("tick")
+        profiler.end_frame()
\ No newline at end of file
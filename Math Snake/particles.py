@@ -0,0 +1,185 @@
+"""
+Particle system for Math Snake's animations.
+
+Particles are kept struct-of-arrays style in NumPy arrays (one array per
+field) and moved with a few vectorized operations per frame. Each particle
+is drawn with a pre-rendered circle sprite looked up by (size, color,
+alpha bucket), so no surface is created while an animation is running.
+"""
+
+import numpy as np
+import pygame
+
+# particle opacity is rounded to one of this many levels (plus invisible)
+ALPHA_LEVELS = 15
+
+# sprites shared by every particle system, by (size, color, alpha level)
+_sprites = {}
+
+def circle_sprite(size, color, level):
+    """
+    Get the pre-rendered sprite for a particle, creating it on first use.
+    
+    Args:
+        size (int): Radius of the circle in pixels
+        color (tuple): RGB color of the circle
+        level (int): Opacity level, 1 to ALPHA_LEVELS
+    
+    Returns:
+        pygame.Surface: A (2 * size) square surface with the circle drawn in it
+    """
+    key = (size, color, level)
+    sprite = _sprites.get(key)
+    if sprite is None:
+        alpha = level * 255 // ALPHA_LEVELS
+        sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color + (alpha,), (size, size), size)
+        sprite = sprite.convert_alpha()
+        _sprites[key] = sprite
+    return sprite
+
+class ParticleSystem:
+    """
+    A pool of particles moving under gravity and fading out.
+    
+    Live particles occupy the first `count` slots of every array. Dead
+    particles are dropped by compacting the arrays, so nothing is removed
+    from a list while it is being iterated.
+    """
+
+    def __init__(self, gravity, capacity=256, max_life=60, rng=None):
+        """
+        Allocate the particle arrays.
+        
+        Args:
+            gravity (float): Added to every particle's vertical speed each frame
+            capacity (int): Initial number of particle slots, grown as needed
+            max_life (float): Life of a freshly emitted particle, in frames
+            rng (np.random.Generator): Random generator, or None for a new one
+        """
+        self.gravity = gravity
+        self.max_life = max_life
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.count = 0
+        # colors seen so far, particles store an index into this list
+        self.palette = []
+
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.life = np.zeros(capacity)
+        self.fade = np.zeros(capacity)
+        self.size = np.zeros(capacity, dtype=np.int64)
+        self.color = np.zeros(capacity, dtype=np.int64)
+
+    def __len__(self):
+        """Return the number of live particles."""
+        return self.count
+
+    def reserve(self, capacity):
+        """
+        Make room for at least `capacity` particles.
+        
+        Args:
+            capacity (int): Number of slots needed
+        """
+        if capacity <= len(self.x):
+            return
+        size = max(capacity, len(self.x) * 2)
+        for name in ("x", "y", "vx", "vy", "life", "fade", "size", "color"):
+            old = getattr(self, name)
+            new = np.zeros(size, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def emit(self, count, x, y, speed, sizes, colors, fade=(1.0, 1.0)):
+        """
+        Burst `count` particles out of a point in random directions.
+        
+        Args:
+            count (int): Number of particles to emit
+            x (float): X position of the burst
+            y (float): Y position of the burst
+            speed (tuple): (min, max) initial speed
+            sizes (tuple): (min, max) radius in pixels, inclusive
+            colors (list): Colors to pick from at random
+            fade (tuple): (min, max) life lost per frame
+        """
+        self.reserve(self.count + count)
+        new = slice(self.count, self.count + count)
+        rng = self.rng
+
+        angle = rng.uniform(0, 2 * np.pi, count)
+        velocity = rng.uniform(speed[0], speed[1], count)
+        self.x[new] = x
+        self.y[new] = y
+        self.vx[new] = np.cos(angle) * velocity
+        self.vy[new] = np.sin(angle) * velocity
+        self.life[new] = self.max_life
+        self.fade[new] = rng.uniform(fade[0], fade[1], count)
+        self.size[new] = rng.integers(sizes[0], sizes[1] + 1, count)
+
+        indices = []
+        for color in colors:
+            if color not in self.palette:
+                self.palette.append(color)
+            indices.append(self.palette.index(color))
+        self.color[new] = np.array(indices)[rng.integers(0, len(indices), count)]
+        self.count += count
+
+    def update(self, bottom=None):
+        """
+        Move every particle one frame and drop the dead ones.
+        
+        Args:
+            bottom (int): Particles falling below this y are dropped too,
+                gravity never brings them back. None keeps them.
+        """
+        live = slice(0, self.count)
+        self.x[live] += self.vx[live]
+        self.y[live] += self.vy[live]
+        self.vy[live] += self.gravity
+        self.life[live] -= self.fade[live]
+
+        alive = self.life[live] > 0
+        if bottom is not None:
+            alive &= (self.y[live] < bottom) | (self.vy[live] < 0)
+        if alive.all():
+            return
+
+        count = int(alive.sum())
+        for array in (self.x, self.y, self.vx, self.vy, self.life, self.fade, self.size, self.color):
+            array[:count] = array[live][alive]
+        self.count = count
+
+    def draw(self, screen, offset=(0, 0)):
+        """
+        Draw every live particle with a single batched blit.
+        
+        Args:
+            screen (pygame.Surface): The surface to draw on
+            offset (tuple): (x, y) added to every particle, e.g. for screen shake
+        """
+        live = slice(0, self.count)
+        # life left as a proportion of max_life, rounded to an opacity level
+        levels = np.clip(self.life[live] / self.max_life, 0, 1) * ALPHA_LEVELS
+        levels = np.rint(levels).astype(np.int64)
+        visible = levels > 0
+
+        xs = (self.x[live][visible].astype(np.int64) + offset[0]).tolist()
+        ys = (self.y[live][visible].astype(np.int64) + offset[1]).tolist()
+        sizes = self.size[live][visible].tolist()
+        colors = self.color[live][visible].tolist()
+        levels = levels[visible].tolist()
+
+        palette = self.palette
+        sprites = _sprites
+        blits = []
+        for x, y, size, color, level in zip(xs, ys, sizes, colors, levels):
+            key = (size, palette[color], level)
+            sprite = sprites.get(key)
+            if sprite is None:
+                sprite = circle_sprite(*key)
+            blits.append((sprite, (x, y)))
+        screen.blits(blits, doreturn=False)
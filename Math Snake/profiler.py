@@ -0,0 +1,234 @@
+"""
+Frame profiler for Math Snake.
+
+This module times the phases of each frame of the game, menu, question and
+animation loops. It is off unless an environment variable turns it on:
+MATHSNAKE_PROFILE draws a rolling overlay of per-phase milliseconds and
+percentiles on screen, and MATHSNAKE_PROFILE_CSV names a file every phase
+of every frame is streamed to as CSV. Either one can be set without the
+other. While disabled each call returns right away, so the loops can stay
+instrumented.
+"""
+
+import atexit
+import csv
+import os
+import time
+from collections import deque
+import numpy as np
+import pygame
+
+# frames kept for the rolling statistics
+WINDOW = 120
+
+# frames between refreshes of the overlay text
+OVERLAY_REFRESH = 15
+
+OVERLAY_FONT_SIZE = 14
+OVERLAY_POS = (10, 40)
+# width of the phase name column and of each number column, in pixels
+OVERLAY_COLUMNS = (90, 55)
+
+class FrameProfiler:
+    """
+    Collects how long each phase of a frame takes.
+    
+    A loop calls frame() when a frame starts, mark() after each phase and
+    end_frame() when the frame is done. Time between two calls is charged to
+    the phase named by the second one.
+    """
+
+    def __init__(self, enabled=False, csv_path=None, show_overlay=True):
+        """
+        Set up the profiler.
+        
+        Args:
+            enabled (bool): Whether to collect timings at all
+            csv_path (str): File to stream per-frame records to, or None
+            show_overlay (bool): Whether overlay() draws the statistics on screen
+        """
+        self.enabled = enabled
+        self.show_overlay = show_overlay
+        self.loop = None
+        self.frames = 0
+        self.start = 0.0
+        self.last = 0.0
+        self.phases = {}
+        # (loop, phase) -> recent durations in ms, the "frame" phase is the total
+        self.history = {}
+
+        self.file = None
+        self.writer = None
+        if enabled and csv_path:
+            self.file = open(csv_path, "w", newline="")
+            self.writer = csv.writer(self.file)
+            self.writer.writerow(["frame", "loop", "phase", "ms"])
+            atexit.register(self.close)
+
+        self.font = None
+        self.lines = []
+        # screen pixels hidden by the overlay, put back before the next frame
+        self.saved = None
+        self.saved_rect = None
+
+    def frame(self, loop):
+        """
+        Start timing a frame.
+        
+        Args:
+            loop (str): Name of the loop the frame belongs to, e.g. "game"
+        """
+        if not self.enabled:
+            return
+        self.loop = loop
+        self.phases.clear()
+        self.start = self.last = time.perf_counter()
+
+    def mark(self, phase):
+        """
+        Charge the time since the previous mark to a phase.
+        
+        Args:
+            phase (str): Name of the phase that just finished
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + now - self.last
+        self.last = now
+
+    def end_frame(self):
+        """Record the frame's phases and total time."""
+        if not self.enabled or self.loop is None:
+            return
+        self.phases["frame"] = time.perf_counter() - self.start
+
+        for phase, seconds in self.phases.items():
+            ms = seconds * 1000
+            key = (self.loop, phase)
+            recent = self.history.get(key)
+            if recent is None:
+                recent = deque(maxlen=WINDOW)
+                self.history[key] = recent
+            recent.append(ms)
+            if self.writer is not None:
+                self.writer.writerow([self.frames, self.loop, phase, f"{ms:.3f}"])
+
+        self.frames += 1
+        self.loop = None
+
+    def stats(self, loop):
+        """
+        Summarize the recent frames of a loop.
+        
+        Args:
+            loop (str): Name of the loop
+        
+        Returns:
+            list: (phase, mean, p50, p95, p99) tuples in ms, the frame total last
+        """
+        rows = []
+        for (name, phase), recent in self.history.items():
+            if name != loop:
+                continue
+            values = np.array(recent)
+            p50, p95, p99 = np.percentile(values, (50, 95, 99))
+            rows.append((phase, values.mean(), p50, p95, p99))
+        rows.sort(key=lambda row: row[0] == "frame")
+        return rows
+
+    def overlay(self, screen, loop):
+        """
+        Draw the rolling statistics of a loop in the top-left corner.
+        
+        The pixels under the overlay are saved first, so loops that only
+        redraw what changed can put them back with hide_overlay().
+        
+        Args:
+            screen (pygame.Surface): The screen to draw on
+            loop (str): Name of the loop to show
+        
+        Returns:
+            pygame.Rect: The area drawn on, or None when disabled or not shown
+        """
+        if not self.enabled or not self.show_overlay:
+            return None
+
+        if self.font is None:
+            self.font = pygame.font.Font("freesansbold.ttf", OVERLAY_FONT_SIZE)
+        if not self.lines or self.frames % OVERLAY_REFRESH == 0:
+            self.lines = self.render_lines(loop)
+
+        name_width, number_width = OVERLAY_COLUMNS
+        height = self.font.get_linesize()
+        rect = pygame.Rect(OVERLAY_POS, (name_width + number_width * 4, height * len(self.lines)))
+        rect = rect.clip(screen.get_rect())
+        self.saved = screen.subsurface(rect).copy()
+        self.saved_rect = rect
+
+        screen.fill((0, 0, 0), rect)
+        x, y = OVERLAY_POS
+        blits = []
+        for i, cells in enumerate(self.lines):
+            blits.append((cells[0], (x, y + i * height)))
+            # numbers are right-aligned in their columns
+            for j, cell in enumerate(cells[1:], 1):
+                blits.append((cell, (x + name_width + number_width * j - cell.get_width(), y + i * height)))
+        screen.blits(blits, doreturn=False)
+        return rect
+
+    def render_lines(self, loop):
+        """
+        Render the overlay's table for a loop.
+        
+        Args:
+            loop (str): Name of the loop
+        
+        Returns:
+            list: One list of rendered cells per line, the header line first
+        """
+        rows = [(loop, "mean", "p50", "p95", "p99")]
+        rows += [(phase,) + tuple(f"{value:.2f}" for value in values) for phase, *values in self.stats(loop)]
+        return [[self.font.render(text, True, (255, 255, 255)) for text in row] for row in rows]
+
+    def hide_overlay(self, screen):
+        """
+        Put back the pixels the last overlay covered.
+        
+        Args:
+            screen (pygame.Surface): The screen the overlay was drawn on
+        
+        Returns:
+            pygame.Rect: The area restored, or None if there was no overlay
+        """
+        if self.saved is None:
+            return None
+        screen.blit(self.saved, self.saved_rect)
+        self.saved = None
+        return self.saved_rect
+
+    def close(self):
+        """Flush and close the CSV file."""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+            self.writer = None
+
+# profiler shared by every loop, created by get_profiler()
+_profiler = None
+
+def get_profiler():
+    """
+    Get the shared profiler, configured from the environment on first use.
+    
+    Returns:
+        FrameProfiler: The profiler, disabled unless MATHSNAKE_PROFILE or
+            MATHSNAKE_PROFILE_CSV is set; only MATHSNAKE_PROFILE shows the
+            overlay
+    """
+    global _profiler
+    if _profiler is None:
+        csv_path = os.environ.get("MATHSNAKE_PROFILE_CSV")
+        show_overlay = bool(os.environ.get("MATHSNAKE_PROFILE"))
+        _profiler = FrameProfiler(show_overlay or bool(csv_path), csv_path, show_overlay)
+    return _profiler
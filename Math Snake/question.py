@@ -9,8 +9,187 @@ import pygame
 import random
 import time
 import math
-from random import randint, choice
+import numpy as np
+import config
 from config import *
+from expression import MATH_SYMBOLS, create_easy, create_medium, create_hard, create_insane
+from profiler import get_profiler
+
+# timer box geometry
+TIMER_BOX = (SCREEN_WIDTH * 0.025, SCREEN_HEIGHT * 0.025, SCREEN_WIDTH * 0.2, SCREEN_HEIGHT * 0.1)
+TIMER_FONT_SIZE = int(SCREEN_WIDTH * 0.035)
+
+# number of font sizes the timer pulses through when time is running out
+PULSE_STEPS = 8
+
+# particles released by a clicked star, and the life they start with
+BURST_PARTICLES = 10
+BURST_LIFE = 260
+
+# surfaces and fonts of the question screen, created by screen_assets()
+_assets = {}
+
+def screen_assets():
+    """
+    Get the surfaces and fonts the question screen draws with, creating them on first use.
+    
+    Returns:
+        dict: Assets containing:
+            - trail: Full-screen translucent black overlay that fades old frames
+            - timer_bg: Dark background of the timer box
+            - title: The rendered "Solve the Expression" title
+            - pulse_fonts: Timer fonts from normal size up to 1.3x, PULSE_STEPS of them
+    """
+    if not _assets:
+        trail = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        trail.fill((0, 0, 0, 20))
+        timer_bg = pygame.Surface(TIMER_BOX[2:], pygame.SRCALPHA)
+        timer_bg.fill((0, 0, 0, 200))
+        _assets.update({
+            'trail': trail,
+            'timer_bg': timer_bg,
+            'title': config.HEADER_1.render("Solve the Expression", True, WHITE),
+            'pulse_fonts': [pygame.font.Font("freesansbold.ttf", int(TIMER_FONT_SIZE * (1 + 0.3 * step / (PULSE_STEPS - 1))))
+                            for step in range(PULSE_STEPS)]
+        })
+    return _assets
+
+class StarField:
+    """
+    Falling stars that change color when hovered and burst when clicked.
+    
+    Star and burst particle state is kept in NumPy arrays with one row per
+    star, so stars are moved with a few vectorized operations and nothing
+    is added to or removed from a list while the screen is running.
+    """
+
+    def __init__(self, count, rng=None):
+        """
+        Scatter stars above the top of the screen.
+        
+        Args:
+            count (int): Number of stars
+            rng (np.random.Generator): Random generator, or None for a new one
+        """
+        self.rng = rng if rng is not None else np.random.default_rng()
+        rng = self.rng
+        self.x = rng.integers(0, SCREEN_WIDTH + 1, count)
+        self.y = rng.integers(-SCREEN_HEIGHT, 1, count)
+        self.size = rng.integers(10, 16, count)
+        self.color = np.tile(np.array(YELLOW), (count, 1))
+        self.hovered = np.zeros(count, dtype=bool)
+        self.burst = np.zeros(count, dtype=bool)
+
+        # burst particles, BURST_PARTICLES per star; dead ones have life <= 0
+        shape = (count, BURST_PARTICLES)
+        self.px = np.zeros(shape, dtype=np.int64)
+        self.py = np.zeros(shape, dtype=np.int64)
+        self.pvx = np.zeros(shape, dtype=np.int64)
+        self.pvy = np.zeros(shape, dtype=np.int64)
+        self.psize = np.zeros(shape, dtype=np.int64)
+        self.pcolor = np.zeros(shape + (3,), dtype=np.int64)
+        self.plife = np.zeros(shape, dtype=np.int64)
+
+    def update(self, mouse_x, mouse_y, pressed):
+        """
+        Move the stars and burst particles one frame and react to the mouse.
+        
+        Args:
+            mouse_x (int): Mouse x position
+            mouse_y (int): Mouse y position
+            pressed (bool): Whether the left mouse button is pressed
+        """
+        rng = self.rng
+        falling = ~self.burst
+
+        self.y[falling] += 2
+        # stars that fall off the bottom come back at the top
+        wrapped = falling & (self.y > SCREEN_HEIGHT)
+        count = int(wrapped.sum())
+        if count:
+            self.y[wrapped] = 0
+            self.x[wrapped] = rng.integers(0, SCREEN_WIDTH + 1, count)
+            self.size[wrapped] = rng.integers(5, 11, count)
+            self.color[wrapped] = YELLOW
+
+        # burst particles fly off and fade
+        alive = self.plife > 0
+        self.px[alive] += self.pvx[alive]
+        self.py[alive] += self.pvy[alive]
+        self.plife[alive] -= 10
+
+        # hovered stars change color once each time the mouse enters them
+        over = falling & (np.abs(self.x - mouse_x) < self.size) & (np.abs(self.y - mouse_y) < self.size)
+        entered = over & ~self.hovered
+        self.color[entered] = rng.integers(50, 256, (int(entered.sum()), 3))
+        self.hovered[falling] = over[falling]
+
+        # clicked stars burst into particles and stop falling
+        if pressed and over.any():
+            stars = np.flatnonzero(over)
+            shape = (len(stars), BURST_PARTICLES)
+            self.burst[stars] = True
+            self.px[stars] = self.x[stars, None]
+            self.py[stars] = self.y[stars, None]
+            self.pvx[stars] = rng.integers(-3, 4, shape)
+            self.pvy[stars] = rng.integers(-3, 4, shape)
+            self.psize[stars] = rng.integers(1, 4, shape)
+            self.pcolor[stars] = rng.integers(50, 256, shape + (3,))
+            self.plife[stars] = BURST_LIFE
+
+    def draw(self, screen):
+        """
+        Draw the falling stars and the live burst particles.
+        
+        Args:
+            screen (pygame.Surface): The surface to draw on
+        """
+        alive = self.plife > 0
+        particles = zip(self.px[alive].tolist(), self.py[alive].tolist(),
+                        self.psize[alive].tolist(), self.pcolor[alive].tolist())
+        for x, y, size, color in particles:
+            pygame.draw.circle(screen, color, (x, y), size)
+
+        falling = ~self.burst
+        stars = zip(self.x[falling].tolist(), self.y[falling].tolist(),
+                    self.size[falling].tolist(), self.color[falling].tolist())
+        for x, y, size, color in stars:
+            pygame.draw.circle(screen, color, (x, y), size)
+
+def make_question(expression):
+    """
+    Prepare the text and answer of a question.
+    
+    Only plain data is made, so this can run on any thread; the text is
+    rendered by render_question on the main thread.
+    
+    Args:
+        expression (BinOp): The expression tree of the question
+        
+    Returns:
+        dict: Question containing:
+            - expression: The expression text
+            - answer: The answer to the expression
+    """
+    return {
+        'expression': expression.render(),
+        'answer': expression.evaluate()
+    }
+
+def render_question(question, font):
+    """
+    Render a question's expression text, if it isn't rendered yet.
+    
+    Args:
+        question (dict): A question as returned by make_question
+        font (pygame.font.Font): Font to render the expression with
+        
+    Returns:
+        dict: The same question, with 'surface' holding the text rendered in white
+    """
+    if 'surface' not in question:
+        question['surface'] = font.render(question['expression'], True, WHITE)
+    return question
 
 class QuestionWindow:
     """
@@ -20,15 +199,21 @@ class QuestionWindow:
     must memorize the expression and its answer before gameplay begins.
     """
     
-    def __init__(self, difficulty):
+    def __init__(self, difficulty, question=None, rng=random):
         """
         Initialize the question window with a difficulty level.
         
         Args:
             difficulty (str): The difficulty level ('Easy', 'Medium', 'Hard', 'Insane')
+            question (dict): A question prepared by make_question (e.g. taken
+                from a QuestionPool), or None to generate one when displayed
+            rng (random.Random): Random source for generating the question,
+                the random module by default
         """
         self.difficulty = difficulty
-        self.mathSymbols = ["+", "-", "*"]
+        self.question = question
+        self.rng = rng
+        self.mathSymbols = MATH_SYMBOLS
     
     def createEasy(self):
         """
@@ -38,19 +223,9 @@ class QuestionWindow:
         using only addition and subtraction.
         
         Returns:
-            str: A math expression string (e.g., "42 + 17" or "65 - 23 + 11")
+            BinOp: An expression tree (e.g. for "42 + 17" or "65 - 23 + 11")
         """
-        varCount = randint(2, 3)
-        def limit(): return randint(1, 99)
-        expression = ""
-
-        if varCount == 2:
-            expression = f"{limit()} {self.mathSymbols[randint(0, 1)]} {limit()}"
-        else:
-            expression = f"{limit()} {self.mathSymbols[randint(0, 1)]} {limit()} " \
-                         f"{self.mathSymbols[randint(0, 1)]} {limit()}"
-
-        return expression
+        return create_easy(self.rng)
     
     def createMedium(self):
         """
@@ -60,23 +235,9 @@ class QuestionWindow:
         using addition and subtraction.
         
         Returns:
-            str: A math expression string
+            BinOp: An expression tree
         """
-        varCount = randint(2, 4)
-        def limit(): return randint(100, 999)
-        expression = ""
-
-        if varCount == 2:
-            expression = f"{limit()} {self.mathSymbols[randint(0, 1)]} {limit()}"
-        elif varCount == 3:
-            expression = f"{limit()} {self.mathSymbols[randint(0, 1)]} {limit()} " \
-                         f"{self.mathSymbols[randint(0, 1)]} {limit()}"
-        else:
-            expression = f"{limit()} {self.mathSymbols[randint(0, 1)]} {limit()} " \
-                         f"{self.mathSymbols[randint(0, 1)]} {limit()} " \
-                         f"{self.mathSymbols[randint(0, 1)]} {limit()}"
-
-        return expression
+        return create_medium(self.rng)
 
     def createHard(self):
         """
@@ -86,23 +247,9 @@ class QuestionWindow:
         using addition, subtraction, and multiplication with parentheses.
         
         Returns:
-            str: A math expression string with parentheses
+            BinOp: An expression tree with parenthesized operands
         """
-        varCount = randint(2, 4)
-        def limit(): return choice([randint(-999, -101), randint(101, 999)])
-        expression = ""
-
-        if varCount == 2:
-            expression = f"{limit()} {self.mathSymbols[randint(0, 2)]} ({limit()})"
-        elif varCount == 3:
-            expression = f"{limit()} {self.mathSymbols[randint(0, 2)]} ({limit()}) " \
-                         f"{self.mathSymbols[randint(0, 2)]} {limit()}"
-        else:
-            expression = f"{limit()} {self.mathSymbols[randint(0, 2)]} ({limit()}) " \
-                         f"{self.mathSymbols[randint(0, 2)]} ({limit()}) " \
-                         f"{self.mathSymbols[randint(0, 2)]} ({limit()})"
-
-        return expression
+        return create_hard(self.rng)
 
     def createInsane(self):
         """
@@ -112,21 +259,9 @@ class QuestionWindow:
         using all operations including multiplication with parentheses.
         
         Returns:
-            str: A complex math expression string with multiple parentheses
+            BinOp: An expression tree with parenthesized operands
         """
-        varCount = randint(3, 4)
-        def limit(): return choice([randint(-9999, -101), randint(101, 9999)])
-        expression = ""
-
-        if varCount == 3:
-            expression = f"{limit()} {self.mathSymbols[randint(0, 2)]} ({limit()}) " \
-                         f"{self.mathSymbols[randint(0, 2)]} {limit()}"
-        else:
-            expression = f"{limit()} {self.mathSymbols[randint(0, 2)]} ({limit()}) " \
-                         f"{self.mathSymbols[randint(0, 2)]} ({limit()}) " \
-                         f"{self.mathSymbols[randint(0, 2)]} ({limit()})"
-
-        return expression
+        return create_insane(self.rng)
 
     def display_expression(self):
         """
@@ -144,88 +279,56 @@ class QuestionWindow:
         - Hard: 35 seconds
         - Insane: 70 seconds
         
+        The answer is computed from the same expression tree that is shown,
+        so the text is never evaluated. A question passed in at construction
+        is shown as is, so nothing has to be generated here.
+        
         Returns:
-            int: The evaluated answer to the expression, or "undefined" if division by zero
+            int: The answer to the expression
         """
-        expression = ""
-
         if self.difficulty == "Easy": 
-            expression = self.createEasy()
+            create = self.createEasy
             time_limit = 10
         elif self.difficulty == "Medium": 
-            expression = self.createMedium()
+            create = self.createMedium
             time_limit = 20
         elif self.difficulty == "Hard": 
-            expression = self.createHard()
+            create = self.createHard
             time_limit = 35
         else: 
-            expression = self.createInsane()
+            create = self.createInsane
             time_limit = 70
 
+        if self.question is None:
+            self.question = make_question(create())
+        render_question(self.question, config.HEADER_2)
+
+        assets = screen_assets()
+        title = assets['title']
+        expression_text = self.question['surface']
+        pulse_fonts = assets['pulse_fonts']
+        # rendered timer texts by (text, color, pulse step), one per second and color
+        timer_texts = {}
+
         start_time = time.time()
 
         num_stars = 50
-        stars = [{'x': random.randint(0, SCREEN_WIDTH),
-                'y': random.randint(-SCREEN_HEIGHT, 0),
-                'size': random.randint(10, 15),
-                'color': YELLOW,
-                'hovered': False,
-                'burst': False,
-                'burst_particles': []} for _ in range(num_stars)]
+        stars = StarField(num_stars)
 
         clock = pygame.time.Clock()
+        profiler = get_profiler()
 
         while True:
+            profiler.frame("question")
             elapsed_time = time.time() - start_time
             remaining_time = max(0, time_limit - elapsed_time)
 
-            trail_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            trail_surface.fill((0, 0, 0, 20))
-            SCREEN.blit(trail_surface, (0, 0))
+            config.SCREEN.blit(assets['trail'], (0, 0))
             
             mouse_x, mouse_y = pygame.mouse.get_pos()
-            for star in stars:
-                if star['burst']:
-                    for particle in star['burst_particles']:
-                        particle['x'] += particle['vx']
-                        particle['y'] += particle['vy']
-                        particle['life'] -= 10
-                        pygame.draw.circle(SCREEN, particle['color'], (int(particle['x']), int(particle['y'])), particle['size'])
-                        if particle['life'] <= 0:
-                            star['burst_particles'].remove(particle)
-                    continue
-
-                if abs(star['x'] - mouse_x) < star['size'] and abs(star['y'] - mouse_y) < star['size']:
-                    if not star['hovered']:
-                        star['color'] = (random.randint(50, 255), random.randint(50, 255), random.randint(50, 255))
-                        star['hovered'] = True
-
-                    if pygame.mouse.get_pressed()[0]: # left mouse button pressed
-                        star['burst'] = True
-                        star['burst_particles'] = []
-                        for _ in range(10):
-                            particle = {
-                                'x': star['x'],
-                                'y': star['y'],
-                                'vx': random.randint(-3, 3),
-                                'vy': random.randint(-3, 3),
-                                'size': random.randint(1, 3),
-                                'color': (random.randint(50, 255), random.randint(50, 255), random.randint(50, 255)),
-                                'life': 260
-                            }
-                            star['burst_particles'].append(particle)
-                else:
-                    star['hovered'] = False
-
-                pygame.draw.circle(SCREEN, star['color'], (star['x'], star['y']), star['size'])
-
-                star['y'] += 2
-                if star['y'] > SCREEN_HEIGHT:
-                    star['y'] = 0
-                    star['x'] = random.randint(0, SCREEN_WIDTH)
-                    star['size'] = random.randint(5, 10)
-                    star['color'] = YELLOW
-                    star['burst'] = False
+            stars.update(mouse_x, mouse_y, pygame.mouse.get_pressed()[0]) # left mouse button pressed
+            stars.draw(config.SCREEN)
+            profiler.mark("stars")
 
             # create timer display with progress bar and visual feedback
             timer_text = str(int(remaining_time))
@@ -241,33 +344,30 @@ class QuestionWindow:
             else:
                 timer_color = RED
                 bar_color = RED
-                # pulse effect when time is low
-                pulse = 1.0 + 0.3 * abs(math.sin(elapsed_time * 5))
             
             # draw timer background box
-            timer_box_width = SCREEN_WIDTH * 0.2
-            timer_box_height = SCREEN_HEIGHT * 0.1
-            timer_box_x = SCREEN_WIDTH * 0.025
-            timer_box_y = SCREEN_HEIGHT * 0.025
+            timer_box_x, timer_box_y, timer_box_width, timer_box_height = TIMER_BOX
             
-            # make another canvas to remove the fading effect
-            timer_bg = pygame.Surface((timer_box_width, timer_box_height), pygame.SRCALPHA)
-            timer_bg.fill((0, 0, 0, 200))
-            SCREEN.blit(timer_bg, (timer_box_x, timer_box_y))
+            # another canvas on top to remove the fading effect
+            config.SCREEN.blit(assets['timer_bg'], (timer_box_x, timer_box_y))
             
             # border
-            pygame.draw.rect(SCREEN, timer_color, 
+            pygame.draw.rect(config.SCREEN, timer_color, 
                            (timer_box_x, timer_box_y, timer_box_width, timer_box_height), 3)
             
             # timer text
             if time_percentage <= 0.25:
-                # scale text when time is running out
-                timer_font = pygame.font.Font("freesansbold.ttf", int(SCREEN_WIDTH * 0.035 * pulse))
+                # pulse the text size when time is running out
+                step = round(abs(math.sin(elapsed_time * 5)) * (PULSE_STEPS - 1))
             else:
-                timer_font = pygame.font.Font("freesansbold.ttf", int(SCREEN_WIDTH * 0.035))
+                step = 0
             
-            timerText = timer_font.render(timer_text + "s", True, timer_color)
-            SCREEN.blit(timerText, (timer_box_x * 1.5, timer_box_y * 1.3))
+            key = (timer_text, timer_color, step)
+            timerText = timer_texts.get(key)
+            if timerText is None:
+                timerText = pulse_fonts[step].render(timer_text + "s", True, timer_color)
+                timer_texts[key] = timerText
+            config.SCREEN.blit(timerText, (timer_box_x * 1.5, timer_box_y * 1.3))
             
             # progress bar
             bar_width = timer_box_width * 0.9
@@ -279,31 +379,31 @@ class QuestionWindow:
             # filled portion
             filled_width = int(bar_width * time_percentage)
             if filled_width > 0:
-                pygame.draw.rect(SCREEN, bar_color, (bar_x, bar_y, filled_width, bar_height))
+                pygame.draw.rect(config.SCREEN, bar_color, (bar_x, bar_y, filled_width, bar_height))
             
             # bar border
-            pygame.draw.rect(SCREEN, bar_color, (bar_x, bar_y, bar_width, bar_height), 2)
+            pygame.draw.rect(config.SCREEN, bar_color, (bar_x, bar_y, bar_width, bar_height), 2)
+            profiler.mark("timer")
 
-            title = HEADER_1.render("Solve the Expression", True, WHITE)
-            expression_text = HEADER_2.render(expression, True, WHITE)
-
-            SCREEN.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, SCREEN_HEIGHT * 0.15))
-            SCREEN.blit(expression_text, (SCREEN_WIDTH // 2 - expression_text.get_width() // 2, SCREEN_HEIGHT * 0.52))
+            config.SCREEN.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, SCREEN_HEIGHT * 0.15))
+            config.SCREEN.blit(expression_text, (SCREEN_WIDTH // 2 - expression_text.get_width() // 2, SCREEN_HEIGHT * 0.52))
+            profiler.mark("text")
 
+            profiler.overlay(config.SCREEN, "question")
             pygame.display.update()
+            profiler.mark("update")
 
             if elapsed_time > time_limit:
+                profiler.end_frame()
                 break
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     pygame.quit()
+            profiler.mark("events")
 
             clock.tick(30)
+            profiler.mark("tick")
+            profiler.end_frame()
 
-        try:
-            answer = eval(expression)
-        except ZeroDivisionError:
-            answer = "undefined (division by zero)"
-
-        return answer
\ No newline at end of file
+        return self.question['answer']
\ No newline at end of file
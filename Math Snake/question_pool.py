@@ -0,0 +1,108 @@
+"""
+Background question pool for Math Snake.
+
+This module keeps a few ready-made questions per difficulty level, so
+starting a round never waits on question generation. A worker thread tops
+the pools up while the game is idle on the menu and end screens. It only
+makes the expression and answer; the text is rendered on the main thread
+when a question is taken, since pygame fonts are not thread-safe.
+"""
+
+import queue
+import threading
+import config
+from config import *
+from expression import CREATORS, create_expression
+from question import make_question, render_question
+
+# ready questions kept per difficulty level
+POOL_SIZE = 4
+
+class QuestionPool:
+    """
+    Bounded per-difficulty pools of prepared questions.
+    
+    take() hands out a ready question and wakes the worker to replace it.
+    The worker only runs while the pool is resumed, so it doesn't compete
+    with gameplay for the CPU.
+    """
+
+    def __init__(self, size=POOL_SIZE):
+        """
+        Initialize empty pools.
+        
+        Args:
+            size (int): Maximum number of ready questions per difficulty
+        """
+        self.pools = {difficulty: queue.Queue(maxsize=size) for difficulty in CREATORS}
+        self.idle = threading.Event()
+        self.wake = threading.Event()
+        # set once every difficulty has at least one question ready
+        self.ready = threading.Event()
+        self.thread = None
+
+    def start(self):
+        """Start the worker thread and let it fill the pools."""
+        if self.thread is not None:
+            return
+
+        self.thread = threading.Thread(target=self.fill, name="question-pool", daemon=True)
+        self.resume()
+        self.thread.start()
+
+    def pause(self):
+        """Stop generating questions, e.g. while a round is being played."""
+        self.idle.clear()
+
+    def resume(self):
+        """Let the worker refill the pools, e.g. on the menu or an end screen."""
+        self.idle.set()
+        self.wake.set()
+
+    def fill(self):
+        """
+        Worker loop that keeps every pool topped up.
+        
+        Adds one question at a time to whichever pools are not full, and
+        sleeps until a question is taken once they all are.
+        """
+        while True:
+            self.idle.wait()
+
+            added = False
+            for difficulty, pool in self.pools.items():
+                if not pool.full():
+                    pool.put(make_question(create_expression(difficulty)))
+                    added = True
+            # after one pass every pool holds at least one question
+            self.ready.set()
+
+            if not added:
+                self.wake.wait()
+                self.wake.clear()
+
+    def wait_ready(self):
+        """Block until every difficulty has at least one question ready."""
+        self.ready.wait()
+
+    def take(self, difficulty):
+        """
+        Get a question for a difficulty level.
+        
+        Falls back to preparing one on the spot if the pool is empty (e.g.
+        right after launch, before the worker caught up). Called on the
+        main thread, which renders the question's text.
+        
+        Args:
+            difficulty (str): The difficulty level ('Easy', 'Medium', 'Hard', 'Insane')
+            
+        Returns:
+            dict: A question as returned by question.make_question, with its
+                text rendered by question.render_question
+        """
+        try:
+            question = self.pools[difficulty].get_nowait()
+        except (KeyError, queue.Empty):
+            question = make_question(create_expression(difficulty))
+        self.wake.set()
+        return render_question(question, config.HEADER_2)
@@ -0,0 +1,227 @@
+"""
+In-game rendering for Math Snake.
+
+The game engine only knows about (row, col) cells. This module turns the
+engine state and the result of each engine step into pixels on the grid.
+"""
+
+import pygame
+import config
+from config import *
+from grid import get_grid, StatsBar, draw_lines, draw_background
+from glyphs import get_atlas, HUD_CHARS
+from profiler import get_profiler
+
+def draw_cell(screen, color, row, col):
+    """
+    Fill a single grid cell with a color.
+    
+    Args:
+        screen (pygame.Surface): The game screen to draw on
+        color (tuple): RGB color tuple for the cell
+        row (int): Row of the cell
+        col (int): Column of the cell
+    """
+    pygame.draw.rect(screen, color, get_grid().rect(row, col))
+
+def draw_number(screen, color, num):
+    """
+    Draw a number tile centered within its grid cell.
+    
+    The digit comes pre-rendered from the shared glyph atlas. Uses get_rect(center=...) to automatically calculate the top-left
+    coordinates needed to center the text within the spot.
+    
+    Args:
+        screen (pygame.Surface): The game screen to draw on
+        color (tuple): RGB color tuple for the digit
+        num (Number): The number tile to draw
+    """
+    spot = get_grid().rect(num.row, num.col)
+    text_surface = get_atlas(SPOT_WIDTH).glyph(str(num.number), color)
+    # use get_rect(center =) to auto calc. the top left coords when we align the number at the center
+    # of the spot
+    # get_rect(center=...) only moves the rectangle so its center is at the position we want
+    text_rect = text_surface.get_rect(center=(spot.x + spot.width//2, spot.y + spot.height//2))
+    screen.blit(text_surface, text_rect)
+
+def cell_rect(row, col):
+    """
+    Get the screen area a grid cell can touch when it is redrawn.
+    
+    The cell is grown by the width of the grid lines so the lines around
+    it are included.
+    
+    Args:
+        row (int): Row of the cell
+        col (int): Column of the cell
+    
+    Returns:
+        pygame.Rect: The cell's area on screen, including its border lines
+    """
+    return get_grid().rect(row, col).inflate(4, 4)
+
+class BoardRenderer:
+    """
+    Draws the running round and presents only the parts of the screen that changed.
+    
+    Every drawing call records the rectangles it touched. present() then
+    pushes just those rectangles to the display, or the whole screen after
+    invalidate() was called (new round, after a full screen animation).
+    """
+
+    def __init__(self, screen):
+        """
+        Initialize the renderer for a screen.
+        
+        Args:
+            screen (pygame.Surface): The game screen to draw on
+        """
+        self.screen = screen
+        self.dirty = []
+        self.full = True
+        # (row, col) each digit was last drawn at
+        self.drawn = {}
+        # area of the head drawn last frame, which still covers its grid lines
+        self.head_rect = None
+        self.stats = StatsBar(screen, BLACK)
+        # load the fonts here, on the main thread, render_glyphs() may run on another one
+        self.atlases = (get_atlas(SPOT_WIDTH), get_atlas(FONT_BIG_SIZE))
+
+    def glyph_sets(self):
+        """
+        Get the glyphs to render ahead of the first round.
+        
+        Returns:
+            list: (atlas, chars, color) for the digit tiles and the stats bar
+        """
+        return [(self.atlases[0], "0123456789", BLACK), (self.atlases[1], HUD_CHARS, GREEN)]
+
+    def render_glyphs(self):
+        """
+        Render the glyphs of glyph_sets() without converting them.
+        
+        This only renders text with fonts loaded in __init__, so it can run on
+        a startup worker thread; add_glyphs() finishes the job on the main one.
+        
+        Returns:
+            list: The rendered surfaces for each glyph set
+        """
+        return [atlas.render(chars, color) for atlas, chars, color in self.glyph_sets()]
+
+    def add_glyphs(self, rendered):
+        """
+        Convert glyphs from render_glyphs() and add them to their atlases.
+        
+        Args:
+            rendered (list): The value returned by render_glyphs()
+        """
+        for (atlas, chars, color), surfaces in zip(self.glyph_sets(), rendered):
+            atlas.add(surfaces)
+
+    def warm(self):
+        """Render the digit and stats bar glyphs ahead of the first round."""
+        self.add_glyphs(self.render_glyphs())
+
+    def invalidate(self):
+        """Clear the board, redraw everything and present the whole screen on the next frame."""
+        draw_background(SQUARE_PER_ROW, SQUARE_PER_COL)
+        self.full = True
+        self.drawn = {}
+        self.head_rect = None
+        self.stats.invalidate()
+
+    def mark(self, rect):
+        """
+        Record a screen area that changed this frame.
+        
+        Args:
+            rect (pygame.Rect): The changed area
+        """
+        if not self.full:
+            self.dirty.append(rect)
+
+    def draw_stats(self, nums, time):
+        """
+        Update the stats bar, redrawing only the characters that changed.
+        
+        Args:
+            nums (list): List of collected digit strings to display
+            time (float): Elapsed time in seconds since game start
+        """
+        for rect in self.stats.draw(nums, time):
+            self.mark(rect)
+
+    def draw_step(self, result, snake_color):
+        """
+        Draw the cells changed by an engine step.
+        
+        Clears the cell vacated by the snake's tail and the old position of an
+        eaten number, then draws the new head. This runs for every step, so
+        the body is complete even when one frame simulates several steps.
+        The tiles' new positions are drawn with the rest of the frame.
+        
+        Args:
+            result (dict): The dict returned by GameEngine.step
+            snake_color (tuple): RGB color for the snake
+        """
+        for cell in (result['tail'], result['eaten_from']):
+            if cell is not None:
+                get_grid().spot(*cell).reset(self.screen)
+                self.mark(cell_rect(*cell))
+        if result['moved']:
+            self.draw_head(result['head'], snake_color)
+
+    def draw_head(self, cell, snake_color):
+        """
+        Draw the snake's head and lay the grid lines back over the previous one.
+        
+        The head is drawn over the lines, the rest of the body under them.
+        
+        Args:
+            cell (tuple): The (row, col) cell of the head
+            snake_color (tuple): RGB color for the snake
+        """
+        if self.head_rect is not None:
+            self.mark(draw_lines(SQUARE_PER_ROW, SQUARE_PER_COL, self.head_rect))
+        draw_cell(self.screen, snake_color, *cell)
+        self.head_rect = cell_rect(*cell)
+        self.mark(self.head_rect)
+
+    def draw_board(self, engine, snake_color, number_color):
+        """
+        Draw the number tiles that moved, and the snake's head after invalidate().
+        
+        Only the cells drawn on get their grid lines laid back over them,
+        from the pre-baked line layer. The head is otherwise drawn by
+        draw_step as the snake moves.
+        
+        Args:
+            engine (GameEngine): The running round
+            snake_color (tuple): RGB color for the snake
+            number_color (tuple): RGB color for the digits
+        """
+        profiler = get_profiler()
+        for num in engine.nums:
+            cell = (num.row, num.col)
+            # numbers with no free cell to go to are off the board
+            if num.row is None or self.drawn.get(num.number) == cell:
+                continue
+            draw_number(self.screen, number_color, num)
+            self.drawn[num.number] = cell
+            # the lines cover the whole cell the number was drawn in
+            self.mark(draw_lines(SQUARE_PER_ROW, SQUARE_PER_COL, cell_rect(*cell)))
+        profiler.mark("tiles")
+
+        # a fresh board has no head yet
+        if self.head_rect is None:
+            self.draw_head((engine.snake.row, engine.snake.col), snake_color)
+        profiler.mark("head")
+
+    def present(self):
+        """Push the changed areas (or the whole screen) to the display."""
+        if self.full:
+            pygame.display.update()
+            self.full = False
+        else:
+            pygame.display.update(self.dirty)
+        self.dirty = []
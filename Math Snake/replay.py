@@ -0,0 +1,316 @@
+"""
+Replay recording and playback for Math Snake.
+
+A replay holds everything needed to play a round again exactly: the board
+seed, the difficulty and question, and the action taken on every snake
+tick. Only the ticks where the action changes are stored, so even a long
+round is a small JSON file. A replay can be re-simulated headless with
+GameEngine as fast as the CPU allows, or shown in the game window at any
+speed:
+
+    python replay.py REPLAY.json                    # re-simulate, check the outcome
+    python replay.py REPLAY.json --play --speed 4   # watch it four times faster
+
+With config.RECORD_REPLAYS set (python main.py --record), the game saves
+a replay of every round into REPLAY_DIR, keeping the newest REPLAY_KEEP.
+"""
+
+import argparse
+import json
+import os
+import time
+from engine import GameEngine, PLAYING
+from snake import UP, LEFT, DOWN, RIGHT
+
+REPLAY_DIR = os.environ.get(
+    "MATHSNAKE_REPLAY_DIR",
+    os.path.join(os.path.expanduser("~"), ".local", "share", "mathsnake", "replays")
+)
+
+# replays kept in REPLAY_DIR, the oldest are deleted past this
+REPLAY_KEEP = 100
+
+# bump when the file format changes
+REPLAY_VERSION = 1
+
+# one character per action in the input list, "-" for not moving
+ACTION_CODES = {
+    None: "-",
+    UP: "U",
+    LEFT: "L",
+    DOWN: "D",
+    RIGHT: "R"
+}
+CODE_ACTIONS = {code: action for action, code in ACTION_CODES.items()}
+
+class ReplayRecorder:
+    """
+    Records a round as it is played.
+    
+    record() is called with the action of every snake tick; the replay
+    keeps [tick, code] pairs for the ticks where the action changed.
+    """
+
+    def __init__(self, engine, difficulty, expression, snake_speed):
+        """
+        Start recording a round.
+        
+        Args:
+            engine (GameEngine): The round, before its first tick
+            difficulty (str): The difficulty level ('Easy', 'Medium', 'Hard', 'Insane')
+            expression (str): The question shown before the round
+            snake_speed (float): Milliseconds per snake tick
+        """
+        self.replay = {
+            'version': REPLAY_VERSION,
+            'seed': engine.seed,
+            'difficulty': difficulty,
+            'expression': expression,
+            'answer': engine.answer,
+            'rows': engine.rows,
+            'cols': engine.cols,
+            'snake_speed': snake_speed,
+            'ticks': 0,
+            'inputs': [],
+            'status': PLAYING,
+            'reason': None,
+            'steps': 0
+        }
+        self.last = None
+
+    def record(self, action):
+        """
+        Record the action of one snake tick.
+        
+        Args:
+            action (str): One of UP, LEFT, DOWN, RIGHT, or None
+        """
+        replay = self.replay
+        if action != self.last:
+            replay['inputs'].append([replay['ticks'], ACTION_CODES[action]])
+            self.last = action
+        replay['ticks'] += 1
+
+    def finish(self, engine):
+        """
+        Store the outcome of the round, so playback can be checked against it.
+        
+        Args:
+            engine (GameEngine): The recorded round
+        """
+        self.replay['status'] = engine.status
+        self.replay['reason'] = engine.reason
+        self.replay['steps'] = engine.steps
+
+    def save(self, path=None):
+        """
+        Write the replay to disk.
+        
+        The file is written under a temporary name and renamed into place, so
+        a crash never leaves a half-written replay. Failing to write (e.g. a
+        read-only home directory) only means the round is not saved. New
+        files in REPLAY_DIR make the oldest ones past REPLAY_KEEP go.
+        
+        Args:
+            path (str): File to write, or None for a new file in REPLAY_DIR
+        
+        Returns:
+            str: The path written, or None if the replay could not be saved
+        """
+        prune = path is None
+        if path is None:
+            name = f"{time.strftime('%Y%m%d-%H%M%S')}-{self.replay['seed']}.json"
+            path = os.path.join(REPLAY_DIR, name)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with open(temp_path, "w") as file:
+                json.dump(self.replay, file, separators=(",", ":"))
+            os.replace(temp_path, path)
+        except OSError:
+            return None
+        if prune:
+            prune_replays(REPLAY_DIR, REPLAY_KEEP)
+        return path
+
+class ReplayInput:
+    """
+    Feeds a replay's recorded actions to the game, one per snake tick.
+    
+    It plugs into Game as a pilot, in place of the keyboard.
+    """
+
+    def __init__(self, replay):
+        """
+        Start at the first tick of a replay.
+        
+        Args:
+            replay (dict): A replay as returned by load
+        """
+        self.actions = actions(replay)
+        self.remaining = replay['ticks']
+
+    @property
+    def done(self):
+        """Whether every recorded tick has been played."""
+        return self.remaining <= 0
+
+    def next_action(self, engine):
+        """
+        Get the action for the next snake tick.
+        
+        Args:
+            engine (GameEngine): The round being played (unused)
+        
+        Returns:
+            str: The recorded action, or None once the replay has run out
+        """
+        self.remaining -= 1
+        return next(self.actions, None)
+
+def prune_replays(directory, keep):
+    """
+    Delete the oldest replays in a directory, keeping the newest ones.
+    
+    Saved replay names start with the time they were recorded, so sorting
+    the names sorts the replays by age. Files that can't be deleted are
+    left alone.
+    
+    Args:
+        directory (str): The replay directory
+        keep (int): Number of replays to keep
+    """
+    try:
+        names = sorted(name for name in os.listdir(directory) if name.endswith(".json"))
+    except OSError:
+        return
+    for name in names[:max(len(names) - keep, 0)]:
+        try:
+            os.remove(os.path.join(directory, name))
+        except OSError:
+            pass
+
+def load(path):
+    """
+    Read a replay file.
+    
+    Args:
+        path (str): The replay file
+    
+    Returns:
+        dict: The replay
+    
+    Raises:
+        ValueError: If the file was written by an incompatible version
+    """
+    with open(path) as file:
+        replay = json.load(file)
+    if replay.get('version') != REPLAY_VERSION:
+        raise ValueError(f"{path}: unsupported replay version {replay.get('version')}")
+    return replay
+
+def actions(replay):
+    """
+    Expand a replay's input changes into one action per tick.
+    
+    Args:
+        replay (dict): A replay as returned by load
+    
+    Yields:
+        str: The action of each tick, one of UP, LEFT, DOWN, RIGHT or None
+    """
+    inputs = replay['inputs']
+    action = None
+    i = 0
+    for tick in range(replay['ticks']):
+        if i < len(inputs) and inputs[i][0] == tick:
+            action = CODE_ACTIONS[inputs[i][1]]
+            i += 1
+        yield action
+
+def new_engine(replay):
+    """
+    Set up the round a replay was recorded from.
+    
+    Args:
+        replay (dict): A replay as returned by load
+    
+    Returns:
+        GameEngine: The round, before its first tick
+    """
+    return GameEngine(replay['answer'], replay['rows'], replay['cols'], replay['seed'])
+
+def simulate(replay):
+    """
+    Re-simulate a replay headless, as fast as possible.
+    
+    Args:
+        replay (dict): A replay as returned by load
+    
+    Returns:
+        GameEngine: The round after its last recorded tick
+    """
+    engine = new_engine(replay)
+    for action in actions(replay):
+        engine.step(action)
+        if engine.status != PLAYING:
+            break
+    return engine
+
+def matches(replay, engine):
+    """
+    Check that a re-simulated round ended like the recorded one.
+    
+    Args:
+        replay (dict): A replay as returned by load
+        engine (GameEngine): The round returned by simulate
+    
+    Returns:
+        bool: True if the status, loss reason and step count all agree
+    """
+    return (engine.status, engine.reason, engine.steps) == \
+        (replay['status'], replay['reason'], replay['steps'])
+
+def play(replay, speed=1.0):
+    """
+    Show a replay in the game window.
+    
+    Args:
+        replay (dict): A replay as returned by load
+        speed (float): Playback speed, 2 plays the round twice as fast
+    """
+    import pygame
+    import config
+
+    config.setup()
+    pygame.display.set_caption("Math Snake - replay")
+    from game import Game
+
+    Game().play_replay(replay, speed)
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-simulate or watch a recorded Math Snake round.")
+    parser.add_argument("replay", help="replay file to load")
+    parser.add_argument("--play", action="store_true", help="show the round in the game window")
+    parser.add_argument("--speed", type=float, default=1.0, help="playback speed multiplier for --play")
+    args = parser.parse_args()
+
+    replay = load(args.replay)
+    print(f"{replay['difficulty']}: {replay['expression']} = {replay['answer']}, "
+          f"{replay['ticks']} ticks, {len(replay['inputs'])} input changes")
+
+    if args.play:
+        play(replay, args.speed)
+        return
+
+    start = time.perf_counter()
+    engine = simulate(replay)
+    elapsed = time.perf_counter() - start
+    print(f"Result: {engine.status} ({engine.reason}) after {engine.steps} steps, "
+          f"{replay['ticks'] / max(elapsed, 1e-9):.0f} ticks/s")
+    if not matches(replay, engine):
+        print(f"MISMATCH: recorded {replay['status']} ({replay['reason']}) after {replay['steps']} steps")
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -8,14 +8,21 @@ animations, as well as win/lose screens with restart options.
 import pygame
 import random
 import math
+import config
 from config import *
+from particles import ParticleSystem
+from profiler import get_profiler
 
-def death_animation(screen):
+# particles in the death explosion and in each victory firework
+DEATH_PARTICLES = 100
+FIREWORK_PARTICLES = 40
+
+def death_animation(screen, particle_count=DEATH_PARTICLES):
     """
     Display an explosive death animation when the player loses.
     
     Creates a dramatic explosion effect with:
-    - 100 particles exploding outward from screen center
+    - particle_count particles exploding outward from screen center
     - Screen shake effect for the first 20 frames
     - Red fade overlay that intensifies over time
     - Particles affected by gravity and fading
@@ -25,83 +32,67 @@ def death_animation(screen):
     
     Args:
         screen (pygame.Surface): The game screen to draw the animation on
+        particle_count (int): Number of explosion particles
     """
     # create explosion particles
-    particles = []
-    center_x, center_y = SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2
+    particles = ParticleSystem(gravity=0.3, capacity=particle_count)
+    particles.emit(particle_count, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, speed=(2, 15), sizes=(3, 8),
+                   colors=[RED, YELLOW, ORANGE, WHITE, REDDISH_PINK], fade=(0.8, 1.2))
     
-    for _ in range(100):
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(2, 15)
-        particles.append({
-            'x': center_x,
-            'y': center_y,
-            'vx': math.cos(angle) * speed,
-            'vy': math.sin(angle) * speed,
-            'color': random.choice([RED, YELLOW, ORANGE, WHITE, REDDISH_PINK]),
-            'size': random.randint(3, 8),
-            'life': 60,
-            'fade': random.uniform(0.8, 1.2)
-        })
+    # the overlay and text only change opacity, so they are created once;
+    # in the display's pixel format the full-screen overlay blits much faster
+    fade_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    fade_surface.fill(RED)
+    wrong_surface = config.HEADER_1.render("WRONG!", True, WHITE)
     
     clock = pygame.time.Clock()
+    profiler = get_profiler()
     
     # animate explosion (2s)
     for frame in range(120):
+        profiler.frame("death")
         # screen shake effect
         shake_x = random.randint(-int(SCREEN_WIDTH * 0.05), int(SCREEN_WIDTH * 0.05)) if frame < 20 else 0
         shake_y = random.randint(-int(SCREEN_HEIGHT * 0.05), int(SCREEN_HEIGHT * 0.05)) if frame < 20 else 0
         
         # fade to red overlay
-        fade_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        fade_surface.fill(RED)
         fade_alpha = min(255, frame * 8)
         fade_surface.set_alpha(fade_alpha)
         screen.blit(fade_surface, (shake_x, shake_y))
+        profiler.mark("fade")
         
-        # update and draw particles
-        for particle in particles[:]:
-            if particle['life'] <= 0:
-                particles.remove(particle)
-                continue
-            
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['vy'] += 0.3  # Gravity
-            particle['life'] -= particle['fade']
-            
-            # draw particle with fading
-            # life starts at 60, do / 60 gives proportion of life left
-            # then multiply by 255 (max opacity) to simulate the fading effect by making
-            # the particle more transparent with less life 
-            alpha = max(0, min(255, int((particle['life'] / 60) * 255)))
-            particle_surface = pygame.Surface((particle['size'] * 2, particle['size'] * 2), pygame.SRCALPHA)
-            color_with_alpha = particle['color'] + (alpha,)
-            pygame.draw.circle(particle_surface, color_with_alpha, (particle['size'], particle['size']), particle['size'])
-            screen.blit(particle_surface, (int(particle['x']) + shake_x, int(particle['y']) + shake_y))
+        # update and draw particles, they fade out as their life runs down
+        particles.update(bottom=SCREEN_HEIGHT)
+        particles.draw(screen, (shake_x, shake_y))
+        profiler.mark("particles")
         
         # "WRONG!" text appears
         if frame > 40:
-            wrong_surface = HEADER_1.render("WRONG!", True, WHITE)
             text_alpha = min(255, (frame - 40) * 10)
             wrong_surface.set_alpha(text_alpha)
             screen.blit(wrong_surface, (SCREEN_WIDTH // 2 - wrong_surface.get_width() // 2, SCREEN_HEIGHT // 3))
+        profiler.mark("text")
         
+        profiler.overlay(screen, "death")
         pygame.display.update()
+        profiler.mark("update")
         clock.tick(60)
+        profiler.mark("tick")
         
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
+        profiler.mark("events")
+        profiler.end_frame()
 
-def victory_animation(screen):
+def victory_animation(screen, particle_count=FIREWORK_PARTICLES):
     """
     Display a celebratory fireworks animation when the player wins.
     
     Creates a spectacular victory display with:
     - Color-shifting gradient background
     - Fireworks that launch upward and explode into particles
-    - 40 particles per explosion with gravity effects
+    - particle_count particles per explosion with gravity effects
     - Random confetti falling across the screen
     - Pulsing "VICTORY!" text with shadow effect in gold
     
@@ -110,20 +101,28 @@ def victory_animation(screen):
     
     Args:
         screen (pygame.Surface): The game screen to draw the animation on
+        particle_count (int): Number of particles in each firework explosion
     """
-    print("Victory animation started!")  # Debug
-    # create fireworks
+    # rising fireworks, the explosions all share one particle system
     fireworks = []
+    particles = ParticleSystem(gravity=0.15, capacity=particle_count * 8)
     clock = pygame.time.Clock()
     
+    # the text is rendered once and only rescaled every frame
+    victory_text = config.HEADER_1.render("VICTORY!", True, GOLD)
+    shadow = config.HEADER_1.render("VICTORY!", True, BLACK)
+    profiler = get_profiler()
+    
     # victory text with scaling effect (2s)
     for frame in range(120):
+        profiler.frame("victory")
         # gradient background that shifts colors
         time_factor = frame / 120
         r = max(0, min(255, int(50 + 100 * math.sin(time_factor * math.pi))))
         g = max(0, min(255, int(50 + 100 * math.cos(time_factor * math.pi))))
         b = max(0, min(255, int(100 + 100 * math.sin(time_factor * math.pi * 2))))
         screen.fill((r, g, b))
+        profiler.mark("background")
         
         # spawn fireworks randomly
         if frame % 8 == 0:
@@ -133,58 +132,29 @@ def victory_animation(screen):
             fireworks.append({
                 'x': x,
                 'y': y,
-                'particles': [],
-                'exploded': False,
                 'color': color,
                 'timer': 0
             })
         
-        # update fireworks (need to shallow copy cuz if we delete we won't loop all fireworks)
-        for firework in fireworks[:]:
-            if not firework['exploded']:
-                firework['timer'] += 1
-                if firework['timer'] > 15:
-                    firework['exploded'] = True
-                    # create explosion particles
-                    for _ in range(40):
-                        angle = random.uniform(0, 2 * math.pi)
-                        speed = random.uniform(2, 8)
-                        firework['particles'].append({
-                            'x': firework['x'],
-                            'y': firework['y'],
-                            'vx': math.cos(angle) * speed,
-                            'vy': math.sin(angle) * speed,
-                            'life': 60,
-                            'size': random.randint(2, 5)
-                        })
-                else:
-                    # rising firework
-                    pygame.draw.circle(screen, firework['color'], 
-                                     (int(firework['x']), int(firework['y'])), 4)
-                    firework['y'] -= 3
+        # update rising fireworks, the ones that explode turn into particles
+        rising = []
+        for firework in fireworks:
+            firework['timer'] += 1
+            if firework['timer'] > 15:
+                particles.emit(particle_count, firework['x'], firework['y'], speed=(2, 8), sizes=(2, 5),
+                               colors=[firework['color']])
             else:
-                # update and draw explosion particles
-                for particle in firework['particles'][:]:
-                    if particle['life'] <= 0:
-                        firework['particles'].remove(particle)
-                        continue
-                    
-                    particle['x'] += particle['vx']
-                    particle['y'] += particle['vy']
-                    particle['vy'] += 0.15  # Gravity
-                    particle['life'] -= 1
-                    
-                    alpha = max(0, min(255, int((particle['life'] / 60) * 255)))
-                    if alpha > 0:
-                        particle_surface = pygame.Surface((particle['size'] * 2, particle['size'] * 2), pygame.SRCALPHA)
-                        color_with_alpha = firework['color'] + (alpha,)
-                        pygame.draw.circle(particle_surface, color_with_alpha, 
-                                         (particle['size'], particle['size']), particle['size'])
-                        screen.blit(particle_surface, (int(particle['x']), int(particle['y'])))
-                
-                # remove firework if all particles are gone
-                if not firework['particles']:
-                    fireworks.remove(firework)
+                pygame.draw.circle(screen, firework['color'], 
+                                 (int(firework['x']), int(firework['y'])), 4)
+                firework['y'] -= 3
+                rising.append(firework)
+        fireworks = rising
+        profiler.mark("fireworks")
+        
+        # update and draw explosion particles
+        particles.update(bottom=SCREEN_HEIGHT)
+        particles.draw(screen)
+        profiler.mark("particles")
         
         # random confetti
         for _ in range(5):
@@ -193,10 +163,10 @@ def victory_animation(screen):
             confetti_color = random.choice([GOLD, RED, GREEN, BLUE, PINK, YELLOW])
             size = random.randint(3, 6)
             pygame.draw.rect(screen, confetti_color, (x, y, size, size * 2))
+        profiler.mark("confetti")
         
         # victory text with pulsing effect
         scale = 1.0 + 0.2 * math.sin(frame * 0.1)
-        victory_text = HEADER_1.render("VICTORY!", True, GOLD)
         
         # create scaled surface
         text_width = int(victory_text.get_width() * scale)
@@ -204,7 +174,6 @@ def victory_animation(screen):
         scaled_surface = pygame.transform.scale(victory_text, (text_width, text_height))
         
         # shadow effect
-        shadow = HEADER_1.render("VICTORY!", True, BLACK)
         shadow_scaled = pygame.transform.scale(shadow, (text_width, text_height))
         screen.blit(shadow_scaled, 
                    (SCREEN_WIDTH // 2 - text_width // 2 + 5, SCREEN_HEIGHT // 3 + 5))
@@ -212,14 +181,20 @@ def victory_animation(screen):
         # main text
         screen.blit(scaled_surface, 
                    (SCREEN_WIDTH // 2 - text_width // 2, SCREEN_HEIGHT // 3))
+        profiler.mark("text")
         
+        profiler.overlay(screen, "victory")
         pygame.display.update()
+        profiler.mark("update")
         clock.tick(60)
+        profiler.mark("tick")
         
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 return
+        profiler.mark("events")
+        profiler.end_frame()
 
 def you_win_screen():
     """
@@ -231,15 +206,15 @@ def you_win_screen():
     
     This function blocks until the player makes a choice.
     """
-    win_message = HEADER_1.render("You Win!", True, RED)
-    restart_message = HEADER_1.render("Press R to Restart", True, BLACK)
-    quit_message = HEADER_1.render("Press Q to Quit", True, BLACK)
+    win_message = config.HEADER_1.render("You Win!", True, RED)
+    restart_message = config.HEADER_1.render("Press R to Restart", True, BLACK)
+    quit_message = config.HEADER_1.render("Press Q to Quit", True, BLACK)
 
     while True:
-        SCREEN.fill(WHITE)
-        SCREEN.blit(win_message, (SCREEN_WIDTH // 2 - win_message.get_width() // 2, SCREEN_HEIGHT // 4))
-        SCREEN.blit(restart_message, (SCREEN_WIDTH // 2 - restart_message.get_width() // 2, SCREEN_HEIGHT // 2))
-        SCREEN.blit(quit_message, (SCREEN_WIDTH // 2 - quit_message.get_width() // 2, 3 * SCREEN_HEIGHT // 4))
+        config.SCREEN.fill(WHITE)
+        config.SCREEN.blit(win_message, (SCREEN_WIDTH // 2 - win_message.get_width() // 2, SCREEN_HEIGHT // 4))
+        config.SCREEN.blit(restart_message, (SCREEN_WIDTH // 2 - restart_message.get_width() // 2, SCREEN_HEIGHT // 2))
+        config.SCREEN.blit(quit_message, (SCREEN_WIDTH // 2 - quit_message.get_width() // 2, 3 * SCREEN_HEIGHT // 4))
 
         pygame.display.update()
 
@@ -263,15 +238,15 @@ def you_lose_screen():
     
     This function blocks until the player makes a choice.
     """
-    lose_message = HEADER_1.render("You Lost!", True, RED)
-    restart_message = HEADER_1.render("Press R to Restart", True, BLACK)
-    quit_message = HEADER_1.render("Press Q to Quit", True, BLACK)
+    lose_message = config.HEADER_1.render("You Lost!", True, RED)
+    restart_message = config.HEADER_1.render("Press R to Restart", True, BLACK)
+    quit_message = config.HEADER_1.render("Press Q to Quit", True, BLACK)
 
     while True:
-        SCREEN.fill(WHITE)
-        SCREEN.blit(lose_message, (SCREEN_WIDTH // 2 - lose_message.get_width() // 2, SCREEN_HEIGHT // 4))
-        SCREEN.blit(restart_message, (SCREEN_WIDTH // 2 - restart_message.get_width() // 2, SCREEN_HEIGHT // 2))
-        SCREEN.blit(quit_message, (SCREEN_WIDTH // 2 - quit_message.get_width() // 2, 3 * SCREEN_HEIGHT // 4))
+        config.SCREEN.fill(WHITE)
+        config.SCREEN.blit(lose_message, (SCREEN_WIDTH // 2 - lose_message.get_width() // 2, SCREEN_HEIGHT // 4))
+        config.SCREEN.blit(restart_message, (SCREEN_WIDTH // 2 - restart_message.get_width() // 2, SCREEN_HEIGHT // 2))
+        config.SCREEN.blit(quit_message, (SCREEN_WIDTH // 2 - quit_message.get_width() // 2, 3 * SCREEN_HEIGHT // 4))
 
         pygame.display.update()
 
@@ -2,14 +2,26 @@
 Snake module for Math Snake game.
 
 This module contains the Snake class which manages the snake's
-position, movement, collision detection, and rendering.
+position, movement and collision detection. It does not import pygame,
+so the snake can be simulated headless by the game engine.
 """
 
-import pygame
 import random
-from collections import deque
-from config import *
-from grid import GRID
+from snake_body import SnakeBody
+
+# movement directions understood by Snake.move
+UP = "UP"
+LEFT = "LEFT"
+DOWN = "DOWN"
+RIGHT = "RIGHT"
+
+# (row, col) offset applied to the head for each direction
+DIRECTIONS = {
+    UP: (-1, 0),
+    LEFT: (0, -1),
+    DOWN: (1, 0),
+    RIGHT: (0, 1)
+}
 
 class Snake:
     """
@@ -18,33 +30,41 @@ class Snake:
     The snake moves on a grid and grows when eating numbers.
     It can collide with walls or itself, ending the game.
     """
-    
-    def __init__(self, width, height):
+
+    def __init__(self, rows, cols, free=None, rng=random):
         """
         Initialize the snake at a random position on the grid.
         
         Args:
-            width (int): Width of each grid cell
-            height (int): Height of each grid cell
+            rows (int): Number of rows in the grid (row 0 is the stats bar)
+            cols (int): Number of columns in the grid
+            free (FreeCells): Free cell index to keep up to date as the
+                snake moves, or None
+            rng (random.Random): Random source for the starting cell, the
+                random module by default
         """
-        self.row = random.randint(int(SQUARE_PER_ROW * 0.1), int(SQUARE_PER_ROW * 0.9))
-        self.col = random.randint(int(SQUARE_PER_COL * 0.1), int(SQUARE_PER_COL * 0.9))
-        self.width = width
-        self.height = height
-        self.body = deque([GRID[self.row][self.col]])
-        self.visited = deque([(self.row, self.col)])
+        self.rows = rows
+        self.cols = cols
+        self.row = rng.randint(int(rows * 0.1), int(rows * 0.9))
+        self.col = rng.randint(int(cols * 0.1), int(cols * 0.9))
+        self.body = SnakeBody(rows, cols)
+        # head cell packed as row * cols + col, kept next to row and col
+        self.head_index = self.row * cols + self.col
+        self.body.push_index(self.head_index)
         self.collideWall = False
+        self.collideSelf = False
+        # packed cell vacated by the last move, or None if the snake grew
+        self.tail_index = None
+        self.free = free
+        if free is not None:
+            free.take_index(self.head_index)
 
-    def draw_head(self, color, screen):
-        """
-        Draw the snake's head at its current position.
-        
-        Args:
-            color (tuple): RGB color tuple for the snake head
-            screen (pygame.Surface): The game screen to draw on
-        """
-        self.spot = GRID[self.row][self.col]
-        pygame.draw.rect(screen, color, pygame.Rect(self.spot.x, self.spot.y, self.width, self.height))
+    @property
+    def tail(self):
+        """The (row, col) cell vacated by the last move, or None if the snake grew."""
+        if self.tail_index is None:
+            return None
+        return divmod(self.tail_index, self.cols)
 
     def eat_number(self, x, y):
         """
@@ -53,93 +73,83 @@ class Snake:
         Args:
             x (int): Row coordinate of the target
             y (int): Column coordinate of the target
-            
+        
         Returns:
             bool: True if snake head is at target position, False otherwise
         """
-        return (x, y) == (self.row, self.col)
+        return x == self.row and y == self.col
 
-    def update_tail(self, screen, spot):
+    def is_free(self, row, col):
         """
-        Erase the tail segment when the snake moves without eating.
+        Check if a cell is not covered by the snake.
         
         Args:
-            screen (pygame.Surface): The game screen to draw on
-            spot (Spot): The grid spot to clear
+            row (int): Row of the cell
+            col (int): Column of the cell
+        
+        Returns:
+            bool: True if no snake segment is on the cell, False otherwise
         """
-        pygame.draw.rect(screen, WHITE, pygame.Rect(spot.x, spot.y, spot.width, spot.height))
+        return not self.body.covers(row * self.cols + col)
 
     def collisionWithSelf(self):
         """
         Check if the snake's head has collided with its own body.
         
+        The check is done by move_common when the head is pushed, so this
+        does not depend on the length of the snake.
+        
         Returns:
             bool: True if collision detected, False otherwise
         """
-        for i in range(1, len(self.visited)): # exclude head
-            if (self.row, self.col) == self.visited[i]:
-                return True
-        return False
+        return self.collideSelf
 
-    def move_common(self, color, screen, x, y):
+    def move_common(self, x, y):
         """
-        Common movement logic executed after directional input.
+        Common movement logic executed after the head position is updated.
         
-        Handles tail removal (if not eating), head drawing, and body/visited updates.
+        Removes the tail (unless the head landed on the target number) and
+        pushes the new head position onto the body, flagging a self collision
+        if the new head lands on a cell the body still covers. Cells are
+        passed around packed, so a move allocates no tuples.
         
         Args:
-            color (tuple): RGB color for the snake
-            screen (pygame.Surface): The game screen to draw on
             x (int): Row of the target number
             y (int): Column of the target number
         """
+        self.tail_index = None
         if not self.eat_number(x, y):
-            spot = self.body.pop()
-            self.visited.pop()
-            self.update_tail(screen, spot)
+            self.tail_index = self.body.pop_index()
+            if self.free is not None:
+                self.free.release_index(self.tail_index)
 
-        self.draw_head(color, screen)
-        self.body.appendleft(self.spot)
-        self.visited.appendleft((self.row, self.col))
+        head = self.head_index = self.row * self.cols + self.col
+        self.collideSelf = self.body.push_index(head)
+        if self.free is not None:
+            self.free.take_index(head)
 
-    def move(self, color, screen, x, y):
+    def move(self, direction, x, y):
         """
-        Handle snake movement based on keyboard input (WASD keys).
+        Move the snake one cell in the given direction.
         
         Checks boundaries, updates position, and sets collision flag if hitting walls.
         
         Args:
-            color (tuple): RGB color for the snake
-            screen (pygame.Surface): The game screen to draw on
+            direction (str): One of UP, LEFT, DOWN, RIGHT
             x (int): Row of the target number
             y (int): Column of the target number
+        
+        Returns:
+            bool: True if the snake moved, False if it hit a wall
         """
-        key = pygame.key.get_pressed()
-
-        if key[pygame.K_w]:
-            if self.row - 1 >= 1:
-                self.row -= 1
-                self.move_common(color, screen, x, y)
-            else:
-                self.collideWall = True
+        d_row, d_col = DIRECTIONS[direction]
+        row, col = self.row + d_row, self.col + d_col
 
-        elif key[pygame.K_a]:
-            if self.col - 1 >= 0:
-                self.col -= 1
-                self.move_common(color, screen, x, y)
-            else:
-                self.collideWall = True
+        # row 0 is covered by the stats bar
+        if 1 <= row <= self.rows - 1 and 0 <= col <= self.cols - 1:
+            self.row, self.col = row, col
+            self.move_common(x, y)
+            return True
 
-        elif key[pygame.K_s]:
-            if self.row + 1 <= SQUARE_PER_ROW - 1:
-                self.row += 1
-                self.move_common(color, screen, x, y)
-            else:
-                self.collideWall = True
-
-        elif key[pygame.K_d]:
-            if self.col + 1 <= SQUARE_PER_COL - 1:
-                self.col += 1
-                self.move_common(color, screen, x, y)
-            else:
-                self.collideWall = True
\ No newline at end of file
+        self.collideWall = True
+        return False
@@ -0,0 +1,156 @@
+"""
+Snake body storage for Math Snake.
+
+This module contains the SnakeBody class, a ring buffer of the cells the
+snake covers. Cells are packed into one integer (row * cols + col) and
+stored in a buffer allocated once for the whole board, so moving the
+snake never allocates and a very long snake costs a few bytes per cell.
+It does not import pygame; the Spot for a cell is looked up on demand
+with grid.Grid.spot.
+"""
+
+from array import array
+
+class SnakeBody:
+    """
+    Cells covered by the snake, from head to tail.
+    
+    The cells live in a circular buffer with one slot per board cell: the
+    head is pushed in front of the first slot and the tail is popped from
+    the last one, both in constant time. A bytearray of the same size
+    marks which cells are covered, so membership checks are constant time
+    too. Index 0 is the head and index len - 1 is the tail.
+    """
+
+    def __init__(self, rows, cols):
+        """
+        Allocate an empty body for a board.
+        
+        Args:
+            rows (int): Number of rows in the grid
+            cols (int): Number of columns in the grid
+        """
+        self.cols = cols
+        self.capacity = rows * cols
+        self.cells = array("l", [0]) * self.capacity
+        self.covered = bytearray(self.capacity)
+        # slot of the head and number of cells in the body
+        self.start = 0
+        self.length = 0
+
+    def __len__(self):
+        """Return the length of the snake."""
+        return self.length
+
+    def __contains__(self, cell):
+        """Return True if the snake covers the (row, col) cell."""
+        row, col = cell
+        return 0 <= col < self.cols and self.covers(row * self.cols + col)
+
+    def covers(self, packed):
+        """Return True if the snake covers the packed cell (row * cols + col)."""
+        return 0 <= packed < self.capacity and self.covered[packed] > 0
+
+    def __getitem__(self, i):
+        """
+        Get a cell of the body.
+        
+        Args:
+            i (int): Position in the body, 0 is the head and -1 the tail
+        
+        Returns:
+            tuple: The (row, col) cell
+        """
+        return divmod(self.packed_at(i), self.cols)
+
+    def packed_at(self, i):
+        """
+        Get a cell of the body without unpacking it.
+        
+        Args:
+            i (int): Position in the body, 0 is the head and -1 the tail
+        
+        Returns:
+            int: The packed cell (row * cols + col)
+        """
+        if i < 0:
+            i += self.length
+        if not 0 <= i < self.length:
+            raise IndexError("snake body index out of range")
+        return self.cells[(self.start + i) % self.capacity]
+
+    def __iter__(self):
+        """Yield the (row, col) cells from head to tail."""
+        cols = self.cols
+        for packed in self.snapshot():
+            yield divmod(packed, cols)
+
+    def push(self, cell):
+        """
+        Add a new head to the body.
+        
+        Args:
+            cell (tuple): The (row, col) cell the head moved to
+        
+        Returns:
+            bool: True if the body already covered the cell
+        """
+        return self.push_index(cell[0] * self.cols + cell[1])
+
+    def push_index(self, packed):
+        """
+        Add a new head to the body, given as a packed cell.
+        
+        This is what the snake calls on every move, so nothing is allocated.
+        
+        Args:
+            packed (int): The cell the head moved to (row * cols + col)
+        
+        Returns:
+            bool: True if the body already covered the cell
+        """
+        self.start = (self.start - 1) % self.capacity
+        self.cells[self.start] = packed
+        self.length += 1
+        hit = self.covered[packed] > 0
+        self.covered[packed] += 1
+        return hit
+
+    def pop(self):
+        """
+        Remove the tail of the body.
+        
+        Returns:
+            tuple: The (row, col) cell the tail left
+        """
+        return divmod(self.pop_index(), self.cols)
+
+    def pop_index(self):
+        """
+        Remove the tail of the body without unpacking its cell.
+        
+        Returns:
+            int: The packed cell the tail left (row * cols + col)
+        """
+        self.length -= 1
+        packed = self.cells[(self.start + self.length) % self.capacity]
+        self.covered[packed] -= 1
+        return packed
+
+    def clear(self):
+        """Remove every cell from the body."""
+        for packed in self.snapshot():
+            self.covered[packed] = 0
+        self.length = 0
+
+    def snapshot(self):
+        """
+        Copy the body out of the ring buffer.
+        
+        Returns:
+            array: Packed cell indices (row * cols + col) from head to tail
+        """
+        end = self.start + self.length
+        if end <= self.capacity:
+            return self.cells[self.start:end]
+        return self.cells[self.start:] + self.cells[:end - self.capacity]
@@ -2,13 +2,218 @@
 Sound management module for Math Snake.
 
 This module generates procedural sound effects using sine waves
-and chords for various game events.
+and chords for various game events. Generated samples are cached on disk,
+so later launches only have to memory-map them.
 """
 
+import os
 import pygame
 import numpy as np
 from config import C5, E5, G5, C6
 
+# where synthesized samples are kept between launches
+SOUND_CACHE_DIR = os.environ.get(
+    "MATHSNAKE_SOUND_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "mathsnake", "sounds")
+)
+
+# bump when the synthesis code changes so old cache files are ignored
+SOUND_CACHE_VERSION = 1
+
+def cache_path(kind, frequencies, duration, volume, sample_rate):
+    """
+    Get the cache file for a synthesized sound.
+    
+    The file name holds every parameter the samples depend on, so changing
+    any of them makes the sound get regenerated.
+    
+    Args:
+        kind (str): "tone" or "chord"
+        frequencies (list): Frequencies in Hz
+        duration (float): Length of the sound in seconds
+        volume (float): Volume multiplier
+        sample_rate (int): Samples per second
+        
+    Returns:
+        str: Path of the .npy file holding the stereo int16 samples
+    """
+    freqs = "_".join(str(freq) for freq in frequencies)
+    name = f"v{SOUND_CACHE_VERSION}-{kind}-{freqs}-{duration}-{volume}-{sample_rate}.npy"
+    return os.path.join(SOUND_CACHE_DIR, name)
+
+def load_cached(path):
+    """
+    Memory-map cached samples.
+    
+    Args:
+        path (str): Path returned by cache_path
+        
+    Returns:
+        np.ndarray: Read-only stereo int16 samples, or None if not cached
+    """
+    try:
+        samples = np.load(path, mmap_mode="r")
+    except (OSError, ValueError):
+        return None
+    if samples.dtype != np.int16 or samples.ndim != 2:
+        return None
+    return samples
+
+def save_cached(path, samples):
+    """
+    Write samples to the cache.
+    
+    The file is written under a temporary name and renamed into place, so a
+    crash never leaves a half-written cache entry. Failing to write (e.g. a
+    read-only home directory) only means the sound is generated next time.
+    
+    Args:
+        path (str): Path returned by cache_path
+        samples (np.ndarray): Stereo int16 samples
+    """
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temp_path, "wb") as file:
+            np.save(file, samples)
+        os.replace(temp_path, path)
+    except OSError:
+        pass
+
+def tone_samples(frequency, duration, volume=0.3):
+    """
+    Generate a pure tone using a sine wave.
+    
+    Creates a single-frequency sound with fade in/out envelope to prevent clicking.
+    The samples are loaded from the on-disk cache when available.
+    Uses the formula: y[n] = sin(2*pi*f*n/R) where:
+    - f = frequency (cycles per second)
+    - R = sample rate (samples per second)
+    - n = sample index (time step)
+    
+    Args:
+        frequency (float): Frequency of the tone in Hz
+        duration (float): Length of the sound in seconds
+        volume (float): Volume multiplier (0.0 to 1.0), default 0.3
+        
+    Returns:
+        np.ndarray: Stereo int16 samples
+    """
+    sample_rate = 22050
+    path = cache_path("tone", [frequency], duration, volume, sample_rate)
+    cached = load_cached(path)
+    if cached is not None:
+        return cached
+    
+    num_samples = int(sample_rate * duration)
+    
+    # generate sine wave
+    # y[n] = sin(2*pi*f*n/R) = sin(2*pi*f*t)
+    # f = freq (cyles per sec), R = sample rate (samples per sec)
+    # n = samples index (time step [0,1,2,3,...])
+    # t = n/R = time in seconds, convert index to time
+    samples = np.sin(2 * np.pi * np.arange(num_samples) * frequency / sample_rate)
+    
+    # apply envelope (fade in/out) to avoid clicks
+    #        n/F     , n < F
+    # E[n] = 1       , F <= n <= N-F
+    #        (N-n)/F , n > N-F
+    # F = fade length, N = total samples
+    envelope = np.ones(num_samples)
+    fade_length = int(sample_rate * 0.01)
+    envelope[:fade_length] = np.linspace(0, 1, fade_length)
+    envelope[-fade_length:] = np.linspace(1, 0, fade_length)
+    
+    # x[n] = E[n] * y[n] * V
+    samples = samples * envelope * volume
+    
+    # convert to 16-bit integer
+    samples = (samples * 32767).astype(np.int16)
+    
+    # create stereo sound
+    stereo_samples = np.column_stack((samples, samples))
+    save_cached(path, stereo_samples)
+    return stereo_samples
+
+def chord_samples(frequencies, duration, volume=0.2):
+    """
+    Generate a musical chord by combining multiple sine waves.
+    
+    Creates a harmonious sound by summing sine waves at different frequencies,
+    then normalizes and applies fade in/out envelope. The samples are loaded
+    from the on-disk cache when available.
+    
+    Args:
+        frequencies (list): List of frequencies in Hz to combine
+        duration (float): Length of the sound in seconds
+        volume (float): Volume multiplier (0.0 to 1.0), default 0.2
+        
+    Returns:
+        np.ndarray: Stereo int16 samples of the chord
+    """
+    sample_rate = 22050
+    path = cache_path("chord", frequencies, duration, volume, sample_rate)
+    cached = load_cached(path)
+    if cached is not None:
+        return cached
+    
+    num_samples = int(sample_rate * duration)
+    
+    # generate and sum multiple sine waves
+    samples = np.zeros(num_samples)
+    for freq in frequencies:
+        samples += np.sin(2 * np.pi * np.arange(num_samples) * freq / sample_rate)
+    
+    # normalize
+    samples = samples / len(frequencies)
+    
+    # apply envelope
+    envelope = np.ones(num_samples)
+    fade_length = int(sample_rate * 0.01)
+    envelope[:fade_length] = np.linspace(0, 1, fade_length)
+    envelope[-fade_length:] = np.linspace(1, 0, fade_length)
+    
+    samples = samples * envelope * volume
+    samples = (samples * 32767).astype(np.int16)
+    stereo_samples = np.column_stack((samples, samples))
+    save_cached(path, stereo_samples)
+    return stereo_samples
+
+def synthesize_sounds():
+    """
+    Generate the samples of every game sound effect.
+    
+    This is only NumPy work and file access, so it can run on a startup
+    worker thread; the pygame Sounds are made from the samples by
+    SoundManager on the main thread.
+    
+    Creates:
+    - 'eat': 800Hz beep for collecting numbers
+    - 'correct': C major chord for correct digit sequence
+    - 'wrong': 150Hz buzz for incorrect digit
+    - 'victory': C major chord with octave for winning
+    - 'collision': Dual-frequency sound for wall/self collision
+    
+    Returns:
+        dict: Sound name -> stereo int16 samples
+    """
+    return {
+        # eating number sound - beep
+        'eat': tone_samples(800, 0.1, 0.3),
+        
+        # correct number sound - C major chord
+        'correct': chord_samples([C5, E5, G5], 0.15, 0.25),
+        
+        # wrong number sound - low buzz
+        'wrong': tone_samples(150, 0.3, 0.4),
+        
+        # victory sound - C major chord with an added octave
+        'victory': chord_samples([C5, E5, G5, C6], 0.5, 0.3),
+        
+        # collision sound - low buzz with a sharp clickly edge
+        'collision': chord_samples([120, 800], 0.15, 0.35)
+    }
+
 class SoundManager:
     """
     Manages all sound effects in the game using procedurally generated tones.
@@ -17,15 +222,22 @@ class SoundManager:
     providing eat, correct, wrong, victory, and collision sound effects.
     """
     
-    def __init__(self):
+    def __init__(self, samples=None):
         """
-        Initialize the sound system and generate all game sounds.
+        Initialize the sound system and create all game sounds.
+        
+        The mixer has to be set up on the main thread, so the samples can be
+        synthesized elsewhere beforehand and passed in.
         
         Sets up pygame mixer with:
         - frequency=22050: 22.05 kHz sample rate (standard for small games)
         - size=-16: 16-bit signed samples (CD-quality audio)
         - channels=2: stereo (left + right)
         - buffer=512: internal audio buffer size for low latency
+        
+        Args:
+            samples (dict): Samples from synthesize_sounds, or None to
+                synthesize them now
         """
         # frequency=22050 => 22.05 kHz sample rate (standard for small games).
         # size=-16 => 16-bit signed samples (CD-quality audio).
@@ -38,17 +250,13 @@ class SoundManager:
         # larger buffer => more stable playback, but slightly higher delay between calling .play() and hearing the sound.
         pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
         self.sounds = {}
-        self.generate_sounds()
+        self.generate_sounds(samples)
         
     def generate_tone(self, frequency, duration, volume=0.3):
         """
         Generate a pure tone using a sine wave.
         
-        Creates a single-frequency sound with fade in/out envelope to prevent clicking.
-        Uses the formula: y[n] = sin(2*pi*f*n/R) where:
-        - f = frequency (cycles per second)
-        - R = sample rate (samples per second)
-        - n = sample index (time step)
+        The samples come from tone_samples, so they are cached on disk.
         
         Args:
             frequency (float): Frequency of the tone in Hz
@@ -58,44 +266,13 @@ class SoundManager:
         Returns:
             pygame.Sound: The generated sound object
         """
-        sample_rate = 22050
-        num_samples = int(sample_rate * duration)
-        
-        # generate sine wave
-        # y[n] = sin(2*pi*f*n/R) = sin(2*pi*f*t)
-        # f = freq (cyles per sec), R = sample rate (samples per sec)
-        # n = samples index (time step [0,1,2,3,...])
-        # t = n/R = time in seconds, convert index to time
-        samples = np.sin(2 * np.pi * np.arange(num_samples) * frequency / sample_rate)
-        
-        # apply envelope (fade in/out) to avoid clicks
-        #        n/F     , n < F
-        # E[n] = 1       , F <= n <= N-F
-        #        (N-n)/F , n > N-F
-        # F = fade length, N = total samples
-        envelope = np.ones(num_samples)
-        fade_length = int(sample_rate * 0.01)
-        envelope[:fade_length] = np.linspace(0, 1, fade_length)
-        envelope[-fade_length:] = np.linspace(1, 0, fade_length)
-        
-        # x[n] = E[n] * y[n] * V
-        samples = samples * envelope * volume
-        
-        # convert to 16-bit integer
-        samples = (samples * 32767).astype(np.int16)
-        
-        # create stereo sound
-        stereo_samples = np.column_stack((samples, samples))
-        
-        sound = pygame.sndarray.make_sound(stereo_samples)
-        return sound
+        return pygame.sndarray.make_sound(tone_samples(frequency, duration, volume))
     
     def generate_chord(self, frequencies, duration, volume=0.2):
         """
         Generate a musical chord by combining multiple sine waves.
         
-        Creates a harmonious sound by summing sine waves at different frequencies,
-        then normalizes and applies fade in/out envelope.
+        The samples come from chord_samples, so they are cached on disk.
         
         Args:
             frequencies (list): List of frequencies in Hz to combine
@@ -105,55 +282,20 @@ class SoundManager:
         Returns:
             pygame.Sound: The generated chord sound object
         """
-        sample_rate = 22050
-        num_samples = int(sample_rate * duration)
-        
-        # generate and sum multiple sine waves
-        samples = np.zeros(num_samples)
-        for freq in frequencies:
-            samples += np.sin(2 * np.pi * np.arange(num_samples) * freq / sample_rate)
-        
-        # normalize
-        samples = samples / len(frequencies)
-        
-        # apply envelope
-        envelope = np.ones(num_samples)
-        fade_length = int(sample_rate * 0.01)
-        envelope[:fade_length] = np.linspace(0, 1, fade_length)
-        envelope[-fade_length:] = np.linspace(1, 0, fade_length)
-        
-        samples = samples * envelope * volume
-        samples = (samples * 32767).astype(np.int16)
-        stereo_samples = np.column_stack((samples, samples))
-        
-        sound = pygame.sndarray.make_sound(stereo_samples)
-        return sound
+        return pygame.sndarray.make_sound(chord_samples(frequencies, duration, volume))
     
-    def generate_sounds(self):
+    def generate_sounds(self, samples=None):
         """
-        Generate all game sound effects and store them in the sounds dictionary.
-        
-        Creates:
-        - 'eat': 800Hz beep for collecting numbers
-        - 'correct': C major chord for correct digit sequence
-        - 'wrong': 150Hz buzz for incorrect digit
-        - 'victory': C major chord with octave for winning
-        - 'collision': Dual-frequency sound for wall/self collision
-        """
-        # eating number sound - beep
-        self.sounds['eat'] = self.generate_tone(800, 0.1, 0.3)
+        Create the game's sound effects and store them in the sounds dictionary.
         
-        # correct number sound - C major chord
-        self.sounds['correct'] = self.generate_chord([C5, E5, G5], 0.15, 0.25)
-        
-        # wrong number sound - low buzz
-        self.sounds['wrong'] = self.generate_tone(150, 0.3, 0.4)
-        
-        # victory sound - C major chord with an added octave
-        self.sounds['victory'] = self.generate_chord([C5, E5, G5, C6], 0.5, 0.3)
-        
-        # collision sound - low buzz with a sharp clickly edge
-        self.sounds['collision'] = self.generate_chord([120, 800], 0.15, 0.35)
+        Args:
+            samples (dict): Sound name -> samples, as returned by
+                synthesize_sounds, or None to synthesize them here
+        """
+        if samples is None:
+            samples = synthesize_sounds()
+        for name, stereo_samples in samples.items():
+            self.sounds[name] = pygame.sndarray.make_sound(stereo_samples)
     
     def play(self, sound_name):
         """
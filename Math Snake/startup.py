@@ -0,0 +1,101 @@
+"""
+Startup time report for Math Snake.
+
+Run this module directly to see where launch time goes: importing each
+game module, config.setup() (pygame init, fonts and window) and the work
+done before the menu can be drawn. Importing the game modules is free of
+side effects, so it works headless with the SDL dummy drivers:
+
+    SDL_VIDEODRIVER=dummy SDL_AUDIODRIVER=dummy python startup.py
+"""
+
+import importlib
+import time
+
+# modules in the order they are imported; each import also pays for any
+# module it pulls in for the first time, so third-party packages go first
+MODULES = (
+    "pygame",
+    "numpy",
+    "config",
+    "snake_body",
+    "snake",
+    "game_numbers",
+    "free_cells",
+    "engine",
+    "replay",
+    "autopilot",
+    "glyphs",
+    "profiler",
+    "grid",
+    "renderer",
+    "menu",
+    "question",
+    "screens",
+    "sounds",
+    "startup_pipeline",
+    "game"
+)
+
+def timed(times, label, func, *args):
+    """
+    Call a function and record how long it took.
+    
+    Args:
+        times (list): List of (label, seconds) tuples to append to
+        label (str): Name of the step in the report
+        func (callable): The function to call
+        *args: Arguments for the function
+    
+    Returns:
+        The function's return value
+    """
+    start = time.perf_counter()
+    result = func(*args)
+    times.append((label, time.perf_counter() - start))
+    return result
+
+def measure():
+    """
+    Import the game and run its initialization steps, timing each one.
+    
+    Returns:
+        list: (label, seconds) tuples in the order the steps ran
+    """
+    times = []
+    for name in MODULES:
+        timed(times, f"import {name}", importlib.import_module, name)
+
+    import config
+    import grid
+    import menu
+    import sounds
+
+    timed(times, "config.setup", config.setup)
+    for label, seconds in config.SETUP_TIMES.items():
+        times.append((f"  {label}", seconds))
+
+    timed(times, "grid.get_grid", grid.get_grid)
+    stars = timed(times, "menu.make_galaxy", menu.make_galaxy)
+    timed(times, "menu.set_galaxy", menu.set_galaxy, stars)
+    samples = timed(times, "sounds.synthesize_sounds", sounds.synthesize_sounds)
+    timed(times, "SoundManager", sounds.SoundManager, samples)
+    return times
+
+def report(times):
+    """
+    Print the startup times as a table.
+    
+    Indented steps are part of the step above them and are not counted
+    twice in the total.
+    
+    Args:
+        times (list): (label, seconds) tuples as returned by measure()
+    """
+    total = sum(seconds for label, seconds in times if not label.startswith(" "))
+    for label, seconds in times:
+        print(f"{label:<24}{seconds * 1000:9.1f} ms{seconds / total * 100:7.1f}%")
+    print(f"{'total':<24}{total * 1000:9.1f} ms")
+
+if __name__ == "__main__":
+    report(measure())
@@ -0,0 +1,138 @@
+"""
+Parallel startup pipeline for Math Snake.
+
+This module runs the independent initialization tasks (sound synthesis,
+glyph rendering, question pool warmup, ...) concurrently on a thread pool
+while the main thread keeps a loading splash on screen, and reports how
+long each task took.
+"""
+
+import os
+import time
+import pygame
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import config
+from config import *
+
+# splash refresh rate while tasks are running
+SPLASH_FPS = 30
+
+# the startup timings are printed only when profiling, like the frame profiler
+STARTUP_REPORT = bool(os.environ.get("MATHSNAKE_PROFILE"))
+
+def draw_splash(screen, done, total, pending):
+    """
+    Draw the loading splash with a progress bar.
+    
+    Args:
+        screen (pygame.Surface): The game screen to draw on
+        done (int): Number of finished tasks
+        total (int): Number of tasks
+        pending (list): Names of the tasks still running
+    """
+    screen.fill(BLACK)
+
+    title = config.HEADER_1.render("Math Snake", True, WHITE)
+    screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, SCREEN_HEIGHT * 0.35))
+
+    bar = pygame.Rect(SCREEN_WIDTH * 0.3, SCREEN_HEIGHT * 0.5, SCREEN_WIDTH * 0.4, SCREEN_HEIGHT * 0.03)
+    filled = bar.copy()
+    filled.width = int(bar.width * done / total) if total else bar.width
+    pygame.draw.rect(screen, GREEN, filled)
+    pygame.draw.rect(screen, WHITE, bar, 2)
+
+    status = config.FONT_SMALL.render("Loading " + ", ".join(pending), True, WHITE)
+    screen.blit(status, (SCREEN_WIDTH // 2 - status.get_width() // 2, SCREEN_HEIGHT * 0.56))
+
+    pygame.display.update()
+
+class StartupPipeline:
+    """
+    Runs named startup tasks on worker threads behind a loading splash.
+    
+    Tasks must not create pygame fonts, set up the mixer, make Sounds or
+    convert surfaces to the display format, and must not touch the window;
+    only the main thread does that, with the task results once run()
+    returns. NumPy work, file access, building data structures and
+    rendering text with an existing font are fair game.
+    """
+
+    def __init__(self, tasks, workers=4):
+        """
+        Initialize the pipeline.
+        
+        Args:
+            tasks (dict): Task name -> callable taking no arguments
+            workers (int): Number of worker threads
+        """
+        self.tasks = tasks
+        self.workers = workers
+        # task name -> (start, end) in seconds since the pipeline started
+        self.times = {}
+        self.start = None
+        self.total = None
+
+    def timed(self, name, func):
+        """
+        Run one task and record when it started and finished.
+        
+        Args:
+            name (str): Name of the task
+            func (callable): The task
+            
+        Returns:
+            The task's return value
+        """
+        start = time.perf_counter() - self.start
+        result = func()
+        self.times[name] = (start, time.perf_counter() - self.start)
+        return result
+
+    def run(self, screen):
+        """
+        Run every task and show the splash until they are all done.
+        
+        Args:
+            screen (pygame.Surface): The game screen to draw the splash on
+            
+        Returns:
+            dict: Task name -> the task's return value
+            
+        Raises:
+            Exception: Whatever the first failing task raised
+        """
+        self.start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="startup") as executor:
+            futures = {executor.submit(self.timed, name, func): name for name, func in self.tasks.items()}
+            pending = set(futures)
+
+            while pending:
+                names = sorted(futures[future] for future in pending)
+                draw_splash(screen, len(futures) - len(pending), len(futures), names)
+                # keep the window responsive while waiting
+                pygame.event.pump()
+                done, pending = wait(pending, timeout=1 / SPLASH_FPS, return_when=FIRST_COMPLETED)
+
+        self.total = time.perf_counter() - self.start
+        return {name: future.result() for future, name in futures.items()}
+
+    def report(self):
+        """Print when each task started and finished, and the pipeline's total time."""
+        for name, (start, end) in sorted(self.times.items(), key=lambda item: item[1]):
+            print(f"{name:<16}{start * 1000:8.1f} ms -> {end * 1000:8.1f} ms ({(end - start) * 1000:.1f} ms)")
+        print(f"{'startup total':<16}{self.total * 1000:8.1f} ms")
+
+def report_launch():
+    """
+    Print how long the game took from launch until the menu was on screen.
+    
+    The menu calls this after every frame it shows. Only the first call
+    after main.py set config.LAUNCH_TIME prints anything, and only when
+    STARTUP_REPORT is on.
+    """
+    if config.LAUNCH_TIME is None:
+        return
+    if STARTUP_REPORT:
+        print(f"Time to menu: {(time.perf_counter() - config.LAUNCH_TIME) * 1000:.0f} ms")
+    config.LAUNCH_TIME = None
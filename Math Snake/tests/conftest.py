@@ -0,0 +1,75 @@
+"""
+Shared setup for the Math Snake tests.
+
+The game modules live one directory up and are imported by name, and
+pygame runs on the SDL dummy drivers so no window or sound card is needed.
+The synthesized sounds are cached in a temporary directory instead of the
+user's home directory.
+"""
+
+import os
+import sys
+import tempfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+SOUND_CACHE = tempfile.TemporaryDirectory(prefix="mathsnake-sounds-")
+os.environ.setdefault("MATHSNAKE_SOUND_CACHE", SOUND_CACHE.name)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import pytest
+import config
+from game import Game
+
+class Display:
+    """
+    Stands in for pygame.display.update and keeps what was actually presented.
+    
+    Only the areas passed to update() are copied from the screen, so
+    anything drawn but never presented is missing from the copy.
+    """
+
+    def __init__(self, screen):
+        self.screen = screen
+        self.shown = pygame.Surface(screen.get_size())
+
+    def update(self, rects=None):
+        if rects is None:
+            self.shown.blit(self.screen, (0, 0))
+            return
+        for rect in rects:
+            self.shown.blit(self.screen, rect, rect)
+
+class FakeClock:
+    """A frame clock where every frame takes the same time."""
+
+    def __init__(self, frame_ms):
+        self.frame_ms = frame_ms
+
+    def tick(self, framerate=0):
+        return self.frame_ms
+
+@pytest.fixture(scope="session")
+def screen():
+    """The game screen, set up once for the whole test run."""
+    config.setup()
+    return config.SCREEN
+
+@pytest.fixture
+def display(screen, monkeypatch):
+    """A Display that records what the test presents."""
+    display = Display(screen)
+    monkeypatch.setattr(pygame.display, "update", display.update)
+    return display
+
+@pytest.fixture(scope="module")
+def game(screen):
+    """
+    One Game for the module, its startup work is slow.
+    
+    Every frame takes 50 ms, so several snake moves are simulated in each.
+    """
+    game = Game()
+    game.clock = FakeClock(50)
+    return game
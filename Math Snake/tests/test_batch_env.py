@@ -0,0 +1,84 @@
+"""
+Tests for the batched environment, checked against GameEngine.
+"""
+
+import numpy as np
+import batch_env
+from batch_env import BatchEngine
+from engine import GameEngine, EMPTY, SNAKE, TILE, LOST, WALL
+from snake import UP, LEFT, RIGHT
+
+# a 4 x 6 board (row 0 is the stats bar) with no free cell for a tile:
+# the snake fills column 0 and row 3, the ten tiles fill rows 1 and 2
+SNAKE_CELLS = [(2, 0), (3, 0), (3, 1), (3, 2), (3, 3), (3, 4), (3, 5)]
+TILE_CELLS = {1: (2, 1), 2: (1, 1), 3: (1, 2), 0: (1, 3), 4: (1, 4),
+              5: (1, 5), 6: (2, 2), 7: (2, 3), 8: (2, 4), 9: (2, 5)}
+ACTIONS = [RIGHT, UP, LEFT, UP]
+BATCH_ACTIONS = {RIGHT: batch_env.RIGHT, UP: batch_env.UP, LEFT: batch_env.LEFT}
+
+def crowded_engine():
+    """A GameEngine laid out as SNAKE_CELLS and TILE_CELLS."""
+    engine = GameEngine(123, 4, 6, seed=0)
+    free = engine.free
+    for cell in engine.snake.body:
+        free.release(cell)
+    engine.snake.body.clear()
+    for num in engine.nums:
+        if num.row is not None:
+            free.release((num.row, num.col))
+    engine.cells[:] = EMPTY
+
+    # the head is pushed last
+    for cell in reversed(SNAKE_CELLS):
+        engine.snake.body.push(cell)
+        free.take(cell)
+        engine.cells[cell] = SNAKE
+    engine.snake.row, engine.snake.col = SNAKE_CELLS[0]
+    engine.snake.head_index = engine.snake.body.packed_at(0)
+    for num in engine.nums:
+        num.row, num.col = TILE_CELLS[int(num.number)]
+        free.take((num.row, num.col))
+        engine.put_tile(num)
+    engine.offboard = []
+    return engine
+
+def crowded_batch():
+    """A one-game BatchEngine laid out as SNAKE_CELLS and TILE_CELLS."""
+    batch = BatchEngine(1, 4, 6, seed=0)
+    batch.reset([123])
+    cols = batch.cols
+    batch.grid[0] = EMPTY
+    length = len(SNAKE_CELLS)
+    for i, (row, col) in enumerate(SNAKE_CELLS):
+        # the head is at head_ptr, the rest of the body before it
+        batch.body[0, length - 1 - i] = row * cols + col
+        batch.grid[0, row, col] = SNAKE
+    batch.head_ptr[0] = length - 1
+    batch.length[0] = length
+    for digit, (row, col) in TILE_CELLS.items():
+        batch.tiles[0, digit] = row * cols + col
+        batch.grid[0, row, col] = TILE + digit
+    return batch
+
+def test_crowded_board_respawns_like_game_engine():
+    engine = crowded_engine()
+    batch = crowded_batch()
+    assert np.array_equal(engine.cells, batch.grid[0])
+
+    for action in ACTIONS[:3]:
+        engine.step(action)
+        batch.step([BATCH_ACTIONS[action]])
+        assert np.array_equal(engine.cells, batch.grid[0])
+
+    # tiles 1 and 2 were eaten with no free cell; 1 took the cell the tail
+    # freed on the third move and 2 is still waiting
+    assert [num.number for num in engine.offboard] == ["2"]
+    assert (engine.nums[1].row, engine.nums[1].col) == (3, 5)
+    assert batch.tiles[0, 2] == batch_env.OFFBOARD
+    assert batch.tiles[0, 1] == 3 * batch.cols + 5
+    assert batch.progress[0] == engine.idx == 2
+
+    engine.step(ACTIONS[3])
+    batch.step([BATCH_ACTIONS[ACTIONS[3]]])
+    assert (engine.status, engine.reason) == (LOST, WALL)
+    assert (batch.status[0], batch.reason[0]) == (batch_env.LOST, batch_env.WALL)
@@ -0,0 +1,30 @@
+"""
+Tests for the game loop.
+"""
+
+import pytest
+from config import *
+from autopilot import Autopilot
+from engine import GameEngine, PLAYING
+from grid import get_grid
+
+@pytest.mark.parametrize("tick_ms", [25, 10])
+def test_fast_ticks_keep_the_whole_body_on_screen(game, display, tick_ms):
+    engine = GameEngine(98765432109876543, SQUARE_PER_ROW, SQUARE_PER_COL, seed=3)
+    game.game_state = game.new_state(engine, pilot=Autopilot(), tick_ms=tick_ms)
+    game.renderer.invalidate()
+
+    moves = 0
+    while moves < 240:
+        ticks = game.update_frame()
+        assert ticks > 1
+        for _ in range(ticks):
+            assert not game.handle_step(game.step_snake())
+            moves += 1
+        game.draw_frame()
+
+    assert engine.status == PLAYING
+    assert len(engine.snake.body) >= 10
+    for cell in engine.snake.body:
+        center = get_grid().rect(*cell).center
+        assert display.shown.get_at(center)[:3] == BLUE, cell
@@ -0,0 +1,36 @@
+"""
+Tests for the frame profiler's environment switches.
+"""
+
+import csv
+import profiler
+
+def profile(monkeypatch, screen, env):
+    """Run one profiled frame with the given environment, return the overlay rect."""
+    monkeypatch.setattr(profiler, "_profiler", None)
+    monkeypatch.delenv("MATHSNAKE_PROFILE", raising=False)
+    monkeypatch.delenv("MATHSNAKE_PROFILE_CSV", raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+
+    frames = profiler.get_profiler()
+    frames.frame("game")
+    frames.mark("step")
+    rect = frames.overlay(screen, "game")
+    frames.hide_overlay(screen)
+    frames.end_frame()
+    frames.close()
+    return rect
+
+def test_csv_alone_records_without_the_overlay(monkeypatch, screen, tmp_path):
+    path = tmp_path / "frames.csv"
+    assert profile(monkeypatch, screen, {"MATHSNAKE_PROFILE_CSV": str(path)}) is None
+
+    with open(path, newline="") as file:
+        rows = list(csv.reader(file))
+    assert rows[0] == ["frame", "loop", "phase", "ms"]
+    assert any(row[2] == "step" for row in rows[1:])
+
+def test_overlay_needs_mathsnake_profile(monkeypatch, screen):
+    assert profile(monkeypatch, screen, {"MATHSNAKE_PROFILE": "1"}) is not None
+    assert profile(monkeypatch, screen, {}) is None
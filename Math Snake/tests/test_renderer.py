@@ -0,0 +1,47 @@
+"""
+Tests for the dirty-rectangle board renderer.
+"""
+
+import pygame
+import pytest
+from config import *
+from autopilot import Autopilot
+from engine import GameEngine, PLAYING
+from grid import get_grid
+from renderer import BoardRenderer
+
+def play(screen, ticks_per_frame, frames):
+    """
+    Let the autopilot play frames of a round, several engine steps per frame.
+    
+    Returns:
+        GameEngine: The round after the last frame
+    """
+    engine = GameEngine(98765432109876543, SQUARE_PER_ROW, SQUARE_PER_COL, seed=3)
+    pilot = Autopilot()
+    renderer = BoardRenderer(screen)
+    renderer.invalidate()
+    for _ in range(frames):
+        for _ in range(ticks_per_frame):
+            result = engine.step(pilot.next_action(engine))
+            renderer.draw_step(result, BLUE)
+        assert engine.status == PLAYING
+        renderer.draw_board(engine, BLUE, BLACK)
+        renderer.present()
+    return engine
+
+@pytest.mark.parametrize("ticks_per_frame", [1, 2, 5])
+def test_every_body_cell_is_presented(screen, display, ticks_per_frame):
+    engine = play(screen, ticks_per_frame, 240 // ticks_per_frame)
+
+    assert len(engine.snake.body) >= 10
+    for cell in engine.snake.body:
+        center = get_grid().rect(*cell).center
+        assert display.shown.get_at(center)[:3] == BLUE, cell
+
+@pytest.mark.parametrize("ticks_per_frame", [1, 5])
+def test_nothing_drawn_is_left_unpresented(screen, display, ticks_per_frame):
+    play(screen, ticks_per_frame, 240 // ticks_per_frame)
+
+    # grid lines laid back over old heads and moved tiles included
+    assert pygame.image.tobytes(display.shown, "RGB") == pygame.image.tobytes(screen, "RGB")
@@ -0,0 +1,52 @@
+"""
+Tests for replay recording and playback.
+"""
+
+import os
+import replay
+from autopilot import Autopilot
+from camera import CameraRenderer
+from engine import GameEngine, PLAYING
+from renderer import BoardRenderer
+
+def record(rows, cols, ticks):
+    """
+    Record the first ticks of an autopilot round.
+    
+    Returns:
+        dict: The replay
+    """
+    engine = GameEngine(98765432109876543, rows, cols, seed=5)
+    pilot = Autopilot()
+    recorder = replay.ReplayRecorder(engine, "Easy", "98765432109876543", 10)
+    for _ in range(ticks):
+        action = pilot.next_action(engine)
+        recorder.record(action)
+        engine.step(action)
+        assert engine.status == PLAYING
+    recorder.finish(engine)
+    return recorder.replay
+
+def test_replay_uses_the_board_it_was_recorded_on(game, display):
+    recorded = record(45, 50, 200)
+    assert isinstance(game.renderer, BoardRenderer)
+    assert not isinstance(game.renderer, CameraRenderer)
+
+    game.play_replay(recorded)
+
+    engine = game.game_state['engine']
+    assert (engine.rows, engine.cols) == (45, 50)
+    assert isinstance(game.renderer, CameraRenderer)
+    assert replay.matches(recorded, engine)
+
+def test_saving_keeps_only_the_newest_replays(tmp_path, monkeypatch):
+    monkeypatch.setattr(replay, "REPLAY_DIR", str(tmp_path))
+    monkeypatch.setattr(replay, "REPLAY_KEEP", 3)
+    for i in range(5):
+        (tmp_path / f"20240101-00000{i}-{i}.json").write_text("{}")
+
+    engine = GameEngine(1, 10, 10, seed=0)
+    path = replay.ReplayRecorder(engine, "Easy", "1", 10).save()
+
+    assert sorted(os.listdir(tmp_path)) == \
+        ["20240101-000003-3.json", "20240101-000004-4.json", os.path.basename(path)]
@@ -0,0 +1,30 @@
+"""
+Tests for the snake body ring buffer and the snake's packed-cell moves.
+"""
+
+from free_cells import FreeCells
+from snake import Snake, RIGHT
+from snake_body import SnakeBody
+
+def test_packed_push_and_pop_match_cells():
+    body = SnakeBody(4, 5)
+    for cell in [(1, 1), (1, 2), (2, 2)]:
+        assert not body.push_index(cell[0] * 5 + cell[1])
+
+    assert list(body) == [(2, 2), (1, 2), (1, 1)]
+    assert body.packed_at(0) == 12 and body.packed_at(-1) == 6
+    assert body.push_index(7)
+    assert body.pop_index() == 6
+    assert body.pop() == (1, 2)
+    assert (1, 1) not in body and body.covers(7)
+
+def test_move_keeps_free_cells_in_sync():
+    free = FreeCells(20, 20, 1, 1)
+    snake = Snake(20, 20, free)
+    start = (snake.row, snake.col)
+    assert start not in free
+
+    assert snake.move(RIGHT, 0, 0)
+    assert snake.tail == start and start in free
+    assert (snake.row, snake.col) not in free
+    assert snake.head_index == snake.row * 20 + snake.col == snake.body.packed_at(0)
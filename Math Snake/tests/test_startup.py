@@ -0,0 +1,28 @@
+"""
+Tests for the parallel startup.
+"""
+
+import threading
+import pygame
+import game
+import menu
+from glyphs import GlyphAtlas
+
+def test_mixer_and_conversions_stay_on_the_main_thread(screen, monkeypatch):
+    calls = []
+
+    def watched(func):
+        def wrapper(*args, **kwargs):
+            calls.append((func.__name__, threading.current_thread()))
+            return func(*args, **kwargs)
+        return wrapper
+
+    monkeypatch.setattr(pygame.mixer, "init", watched(pygame.mixer.init))
+    monkeypatch.setattr(pygame.sndarray, "make_sound", watched(pygame.sndarray.make_sound))
+    monkeypatch.setattr(GlyphAtlas, "add", watched(GlyphAtlas.add))
+    monkeypatch.setattr(menu, "star_sprite", watched(menu.star_sprite))
+
+    game.Game()
+
+    assert {name for name, thread in calls} == {"init", "make_sound", "add", "star_sprite"}
+    assert all(thread is threading.main_thread() for name, thread in calls)